@@ -0,0 +1,65 @@
+# config_manager.py - Manages reading and writing to YMU's own config.json.
+import os
+import json
+import logging
+import shutil
+from paths import YMU_CONFIG_FILE_PATH
+
+logger = logging.getLogger(__name__)
+
+CONFIG_FILE_PATH = YMU_CONFIG_FILE_PATH
+
+
+def _read_json_safely() -> dict:
+    """Reads the config file and handles a missing or corrupted file."""
+    if not os.path.exists(CONFIG_FILE_PATH):
+        return {}
+    try:
+        with open(CONFIG_FILE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+            return data if isinstance(data, dict) else {}
+    except (json.JSONDecodeError, OSError) as e:
+        logger.warning(f"Failed to read config.json: {e}")
+        return {}
+
+
+def get_config(key_path: str, default=None):
+    """
+    Reads a nested YMU config value.
+    Example: get_config("network.log_to_file")
+    """
+    value = _read_json_safely()
+    try:
+        for key in key_path.split("."):
+            value = value[key]
+        return value
+    except (KeyError, TypeError):
+        return default
+
+
+def set_config(key_path: str, value) -> bool:
+    """
+    Writes a nested YMU config value. Ensures parent keys exist.
+    """
+    data = _read_json_safely()
+
+    keys = key_path.split(".")
+    d = data
+    for key in keys[:-1]:
+        if key not in d or not isinstance(d[key], dict):
+            d[key] = {}
+        d = d[key]
+    d[keys[-1]] = value
+
+    os.makedirs(os.path.dirname(CONFIG_FILE_PATH), exist_ok=True)
+    temp_file = CONFIG_FILE_PATH + ".tmp"
+    try:
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4)
+
+        shutil.move(temp_file, CONFIG_FILE_PATH)
+        logger.info(f"Successfully set config '{key_path}' to '{value}'")
+        return True
+    except OSError as e:
+        logger.error(f"Failed to write config file: {e}")
+        return False
@@ -0,0 +1,174 @@
+# game_launcher.py - Starts GTA V through its launcher, either via URI or by running the launcher directly.
+import dataclasses
+import logging
+import os
+import re
+import shutil
+import subprocess
+import time
+from typing import List, Optional
+
+import config_manager
+import install_discovery
+from install_discovery import (
+    EDITION_LEGACY,
+    EPIC_APP_NAME,
+    HKCR,
+    HKCU,
+    LAUNCHER_EPIC,
+    LAUNCHER_ROCKSTAR,
+    LAUNCHER_STEAM,
+    STEAM_APP_IDS,
+    RegistryReader,
+    WindowsRegistryReader,
+)
+
+logger = logging.getLogger(__name__)
+
+DIRECT_LAUNCH_CONFIG_KEY = "inject.direct_launch"
+
+LAUNCH_MODE_URI = "uri"
+LAUNCH_MODE_DIRECT = "direct"
+
+LAUNCH_URIS = {
+    LAUNCHER_STEAM: f"steam://run/{STEAM_APP_IDS[EDITION_LEGACY]}",
+    LAUNCHER_EPIC: f"com.epicgames.launcher://apps/{EPIC_APP_NAME}?action=launch&silent=true",
+}
+EPIC_LAUNCHER_PATHS = [
+    r"C:\Program Files (x86)\Epic Games\Launcher\Portal\Binaries\Win64\EpicGamesLauncher.exe",
+    r"C:\Program Files\Epic Games\Launcher\Portal\Binaries\Win64\EpicGamesLauncher.exe",
+]
+# Windows refuses CreateProcess for executables that ask for elevation.
+ERROR_ELEVATION_REQUIRED = 740
+
+
+class DirectLaunchUnavailable(RuntimeError):
+    """The launcher cannot be started directly here; use the URI instead."""
+
+
+@dataclasses.dataclass
+class LaunchedProcess:
+    """
+    The process YMU spawned. For Steam and Epic this is the launcher, which may
+    hand the request to an instance that is already running and exit.
+    """
+
+    launcher: str
+    pid: int
+    args: List[str]
+    launched_at: float
+    spawn_ms: float
+
+
+def is_direct_launch_enabled() -> bool:
+    return bool(config_manager.get_config(DIRECT_LAUNCH_CONFIG_KEY, default=False))
+
+
+def _split_command_line(command: str) -> List[str]:
+    """Splits a registry command line such as '"C:\\x\\app.exe" -- "%1"'."""
+    return [
+        match.group(1) if match.group(1) is not None else match.group(2)
+        for match in re.finditer(r'"([^"]*)"|(\S+)', command)
+    ]
+
+
+def protocol_handler_command(uri: str, registry: RegistryReader) -> Optional[List[str]]:
+    """Returns the command registered for the URI's scheme with the URI filled in."""
+    scheme = uri.split(":", 1)[0]
+    command = registry.read_value(HKCR, rf"{scheme}\shell\open\command", "")
+    if not command:
+        return None
+    args = _split_command_line(command)
+    if not args:
+        return None
+    if any("%1" in arg for arg in args):
+        return [arg.replace("%1", uri) for arg in args]
+    return args + [uri]
+
+
+def _steam_executable(registry: RegistryReader) -> Optional[str]:
+    candidates = [registry.read_value(HKCU, r"Software\Valve\Steam", "SteamExe")]
+    steam_path = registry.read_value(HKCU, r"Software\Valve\Steam", "SteamPath")
+    if steam_path:
+        candidates.append(os.path.join(steam_path, "steam.exe"))
+    candidates.append(shutil.which("steam"))
+    for candidate in candidates:
+        if candidate and os.path.isfile(candidate):
+            return os.path.normpath(candidate)
+    return None
+
+
+def build_direct_command(
+    launcher: str, registry: Optional[RegistryReader] = None
+) -> List[str]:
+    """
+    Returns the command line that starts the game without going through the
+    shell's URL handling.
+    :raises DirectLaunchUnavailable: If the launcher or the game is not found.
+    """
+    registry = registry or WindowsRegistryReader()
+    if launcher == LAUNCHER_STEAM:
+        steam = _steam_executable(registry)
+        if steam is None:
+            raise DirectLaunchUnavailable("Steam executable not found.")
+        install = install_discovery.find_install(LAUNCHER_STEAM)
+        edition = install.edition if install else EDITION_LEGACY
+        return [steam, "-applaunch", STEAM_APP_IDS[edition]]
+
+    if launcher == LAUNCHER_EPIC:
+        command = protocol_handler_command(LAUNCH_URIS[LAUNCHER_EPIC], registry)
+        if command is not None and os.path.isfile(command[0]):
+            return command
+        for path in EPIC_LAUNCHER_PATHS:
+            if os.path.isfile(path):
+                return [path, LAUNCH_URIS[LAUNCHER_EPIC]]
+        raise DirectLaunchUnavailable("Epic Games Launcher executable not found.")
+
+    if launcher == LAUNCHER_ROCKSTAR:
+        install = install_discovery.find_install(LAUNCHER_ROCKSTAR)
+        if install is None or not os.path.isfile(install.launcher_executable):
+            raise DirectLaunchUnavailable("Rockstar Games install not found.")
+        return [install.launcher_executable]
+
+    raise DirectLaunchUnavailable(f"Unknown launcher: {launcher}")
+
+
+def launch_direct(
+    launcher: str, registry: Optional[RegistryReader] = None
+) -> LaunchedProcess:
+    """
+    Spawns the launcher (or PlayGTAV.exe) detached from YMU and returns its PID.
+    :raises DirectLaunchUnavailable: If it cannot be started this way.
+    """
+    args = build_direct_command(launcher, registry)
+    kwargs = {}
+    if os.name == "nt":
+        kwargs["creationflags"] = (
+            subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+        )
+    else:
+        kwargs["start_new_session"] = True
+
+    launched_at = time.time()
+    start = time.perf_counter()
+    try:
+        process = subprocess.Popen(
+            args,
+            cwd=os.path.dirname(args[0]) or None,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+            **kwargs,
+        )
+    except FileNotFoundError as e:
+        raise DirectLaunchUnavailable(str(e)) from e
+    except OSError as e:
+        if getattr(e, "winerror", None) == ERROR_ELEVATION_REQUIRED:
+            raise DirectLaunchUnavailable(f"{args[0]} requires elevation.") from e
+        raise
+    spawn_ms = round((time.perf_counter() - start) * 1000, 1)
+    logger.info(
+        f"Started {launcher} directly as PID {process.pid} in {spawn_ms} ms: {args}"
+    )
+    return LaunchedProcess(launcher, process.pid, args, launched_at, spawn_ms)
@@ -5,8 +5,14 @@ import os
 import logging
 from logging.handlers import RotatingFileHandler
 
+# The elevated injection helper is this same executable started with a flag;
+# it needs no UI and must skip the single-instance check below.
+if __name__ == "__main__" and sys.argv[1:2] == ["--injection-helper"]:
+    import injection_helper
+
+    sys.exit(injection_helper.main(sys.argv[1:]))
+
 try:
-    import winreg
     import win32gui
 
     IS_WINDOWS = True
@@ -26,8 +32,9 @@ if IS_WINDOWS:
     except Exception as e:
         logging.getLogger(__name__).error(f"Error during instance check: {e}")
 
-import webbrowser
+import threading
 import time
+import webbrowser
 import platform
 from typing import Optional, cast
 
@@ -91,13 +98,24 @@ from paths import (
     LOCAL_VERSION,
 )
 from worker_manager import WorkerManager
+from process_monitor import ProcessMonitor
 from theme_manager import ThemeManager
 from localization_manager import LocalizationManager
 import release_service
 import process_manager
 import settings_manager
+import config_manager
+import network_monitor
+import peer_service
 import lua_manager
 import update_checker
+import update_scheduler
+import update_pipeline
+import launch_history
+import install_discovery
+import game_launcher
+import injection_helper
+import health_monitor
 
 
 log_formatter = logging.Formatter(
@@ -205,6 +223,14 @@ def restart_application():
     sys.exit(0)
 
 
+def apply_update_and_restart():
+    """Installs a staged YMU update (if any) and restarts into it."""
+    executable = update_checker.get_app_executable()
+    if executable and update_checker.apply_staged_update(executable):
+        logger.info("Staged update applied. Restarting into the new version...")
+    restart_application()
+
+
 def restart_as_admin():
     """
     Restarts the current application with Administrator privileges using ShellExecute 'runas'.
@@ -1518,6 +1544,7 @@ class MainWindow(QMainWindow):
         self.worker_manager = worker_manager
         self.loc_manager = loc_manager
         self.notification_manager = NotificationManager(self, self.theme_manager)
+        self.process_monitor = ProcessMonitor(self.worker_manager, parent=self)
 
         self.setWindowTitle("YimMenuUpdater | NV3")
         self.setFixedSize(QSize(780, 520))
@@ -1550,6 +1577,7 @@ class MainWindow(QMainWindow):
             theme_manager=self.theme_manager,
             worker_manager=self.worker_manager,
             loc_manager=self.loc_manager,
+            process_monitor=self.process_monitor,
         )
         self.settings_page = SettingsPage(
             theme_manager=self.theme_manager,
@@ -1564,6 +1592,15 @@ class MainWindow(QMainWindow):
 
         self.setup_sidebar(sidebar_layout)
         self._trigger_initial_dll_checks()
+        self._is_staging_update = False
+        if update_checker.is_background_update_enabled():
+            QTimer.singleShot(2000, self.start_background_update)
+
+        self._scheduled_checks_running = set()
+        self._notified_update_version = None
+        self.update_schedule_timer = QTimer(self)
+        self.update_schedule_timer.timeout.connect(self._run_scheduled_checks)
+        self.update_schedule_timer.start(60 * 1000)
 
     def _on_translation_update_finished(self, update_occurred: bool):
         """Slot: Called when the LocalizationManager has finished checking."""
@@ -1690,6 +1727,100 @@ class MainWindow(QMainWindow):
             lambda: self.content_stack.setCurrentWidget(self.settings_page)
         )
 
+    def start_background_update(self):
+        """Downloads and verifies a new YMU build in the background, if available."""
+        if self._is_staging_update:
+            return
+        if update_checker.get_app_executable() is None:
+            logger.info("Running from source. Skipping background self-update.")
+            return
+        self._is_staging_update = True
+        self.worker_manager.run_task(
+            target=update_checker.stage_update,
+            on_finished=self._on_background_update_finished,
+            on_error=self._on_background_update_error,
+            dedicated=True,
+        )
+
+    def _on_background_update_finished(self, result):
+        self._is_staging_update = False
+        status, data = result
+        if status == update_checker.STATUS_STAGED:
+            msg = self.loc_manager.tr(
+                "Settings.Update.StagedMsg",
+                "YMU {0} is ready and will be installed on the next start.",
+            ).format(data)
+            self.notification_manager.show(
+                self.loc_manager.tr("Settings.Update.Title", "YMU Updater"),
+                msg,
+                icon_type="success",
+                duration=10000,
+                action_text=self.loc_manager.tr("Common.Restart", "Restart Now"),
+                action_callback=apply_update_and_restart,
+            )
+        elif status == update_checker.STATUS_ERROR:
+            logger.warning(f"Background self-update failed: {data}")
+
+    def _on_background_update_error(self, error: Exception):
+        self._is_staging_update = False
+        logger.error(f"Background self-update failed: {error}")
+
+    def _run_scheduled_checks(self):
+        """Starts the periodic update checks whose scheduled time has come."""
+        targets = {update_checker.SCHEDULE_TARGET: None}
+        for channel_info in self.download_page.RELEASE_CHANNELS.values():
+            repo_path = channel_info["repo"]
+            targets[update_checker.channel_target(repo_path)] = repo_path
+
+        for target in update_scheduler.get_due_targets(targets):
+            if target in self._scheduled_checks_running:
+                continue
+            self._scheduled_checks_running.add(target)
+
+            def release_check(_, t=target):
+                self._scheduled_checks_running.discard(t)
+
+            if targets[target] is None:
+                self.worker_manager.run_task(
+                    target=update_checker.check_for_updates,
+                    on_finished=self._on_scheduled_update_check,
+                    on_error=release_check,
+                    dedicated=True,
+                )
+            else:
+                self.worker_manager.run_task(
+                    update_checker.get_channel_release,
+                    targets[target],
+                    on_finished=release_check,
+                    on_error=release_check,
+                    dedicated=True,
+                )
+
+    def _on_scheduled_update_check(self, result):
+        self._scheduled_checks_running.discard(update_checker.SCHEDULE_TARGET)
+        status, data = result
+        if status != update_checker.STATUS_UPDATE_AVAILABLE:
+            return
+        if (
+            update_checker.is_background_update_enabled()
+            and update_checker.get_app_executable() is not None
+        ):
+            self.start_background_update()
+            return
+        if self._notified_update_version == data:
+            return
+        self._notified_update_version = data
+        self.notification_manager.show(
+            self.loc_manager.tr("Settings.Update.AvailableTitle", "Update Available"),
+            self.loc_manager.tr(
+                "Settings.Update.AvailableMsg", "Update {0} is available!"
+            ).format(data),
+            icon_type="info",
+            duration=10000,
+            action_text=self.loc_manager.tr("Settings.Btn.InstallUpdate", "Install"),
+            action_callback=self.settings_page._start_updater_download,
+        )
+
     def _trigger_initial_dll_checks(self):
         """
         Triggers a background update check for all DLL channels upon startup
@@ -1851,9 +1982,6 @@ class DownloadPage(QWidget):
         self.loc_manager = loc_manager
 
         self.latest_release_data = None
-        self.release_provider = None
-        self._release_cache = {}
-        self.CACHE_DURATION_SECONDS = 300
 
         self.is_download_ready = False
 
@@ -1948,10 +2076,8 @@ class DownloadPage(QWidget):
 
         selected_channel_name = self.channel_select.currentText()
         channel_info = self.RELEASE_CHANNELS[selected_channel_name]
-        repo_path = channel_info["repo"]
         dll_name = channel_info["dll_name"]
 
-        self.release_provider = release_service.GitHubAPIProvider(repository=repo_path)
         self.local_dll_path = os.path.join(YMU_DLL_DIR, dll_name)
 
         self.worker_manager.run_task(
@@ -2000,27 +2126,13 @@ class DownloadPage(QWidget):
         Fetches the latest release data.
         RETURNS CONSTANTS instead of display strings.
         """
-        if self.release_provider is None:
-            raise RuntimeError("Release provider has not been initialized.")
-
         selected_channel_name = self.channel_select.currentText()
         repo_path = self.RELEASE_CHANNELS[selected_channel_name]["repo"]
-        current_time = time.time()
-
-        if repo_path in self._release_cache:
-            cached_data, timestamp = self._release_cache[repo_path]
-            if (current_time - timestamp) < self.CACHE_DURATION_SECONDS:
-                logger.info(f"Using cached release data for {repo_path}.")
-                self.latest_release_data = cached_data
-                return self._compare_checksums()
-
-        logger.info(f"Fetching fresh release data for {repo_path}.")
-        self.latest_release_data = self.release_provider.get_latest_release()
-
-        if not self.latest_release_data:
-            raise RuntimeError("Failed to fetch release data from GitHub.")
-
-        self._release_cache[repo_path] = (self.latest_release_data, current_time)
+        # Shown to the user, so only reuse results younger than
+        # MIN_CHECK_AGE_SECONDS rather than anything the schedule still allows.
+        self.latest_release_data = update_checker.get_channel_release(
+            repo_path, force=True
+        )
         return self._compare_checksums()
 
     def _compare_checksums(self):
@@ -2188,16 +2300,39 @@ class InjectPage(QWidget):
     STATE_APP_RUNNING = "APP_RUNNING"
     STATE_INJECTING = "INJECTING"
     STATE_INJECTED = "INJECTED"
+    STATE_PIPELINE = "PIPELINE"
 
-    def __init__(self, theme_manager, worker_manager, loc_manager, parent=None):
+    # (session, event) from a health monitor thread.
+    _health_event = Signal(object, object)
+
+    AUTO_INJECT_CONFIG_KEY = "inject.auto_inject"
+    READY_TIMEOUT_SECONDS = 300
+    BATCH_INJECT_TIMEOUT_SECONDS = 60
+
+    def __init__(
+        self, theme_manager, worker_manager, loc_manager, process_monitor, parent=None
+    ):
         super().__init__(parent)
         self.theme_manager = theme_manager
         self.worker_manager = worker_manager
         self.loc_manager = loc_manager
+        self.process_monitor = process_monitor
 
         self.gta_pid = None
         self._state = self.STATE_IDLE
         self.dll_to_inject = None
+        # Set when an injection profile is selected; dll_to_inject is then its first DLL.
+        self.profile_to_inject: Optional[process_manager.InjectionProfile] = None
+        self._game_processes: list[process_manager.GameProcess] = []
+        self._instances_refreshing = False
+        self._launch_session: Optional[launch_history.LaunchSession] = None
+        self._ready_stop_event: Optional[threading.Event] = None
+        self._health_monitors: dict[int, health_monitor.HealthMonitor] = {}
+        self._injection_helper: Optional[injection_helper.InjectionHelperClient] = None
+        self._helper_starting = False
+        # Games that were already running when YMU started are never auto-injected.
+        self._created_at = time.time()
+        self._start_pending = False
 
         info_button = StatefulButton(
             "",
@@ -2235,6 +2370,20 @@ class InjectPage(QWidget):
         self.dll_select.setCursor(Qt.CursorShape.PointingHandCursor)
         self.dll_select.setVisible(False)
 
+        # Only shown when more than one game instance is running.
+        self.instance_list = QListWidget()
+        self.instance_list.setSelectionMode(
+            QAbstractItemView.SelectionMode.ExtendedSelection
+        )
+        self.instance_list.setToolTip(
+            self.loc_manager.tr(
+                "Inject.Tooltip.Instances",
+                "Select the game instances to inject into",
+            )
+        )
+        self.instance_list.setFixedSize(260, 90)
+        self.instance_list.setVisible(False)
+
         self.start_gta_button = AnimatedButton(
             self.loc_manager.tr("Inject.Btn.StartGta", "Start GTA 5"),
             theme_manager=self.theme_manager,
@@ -2247,6 +2396,35 @@ class InjectPage(QWidget):
         )
         self.inject_button.setEnabled(False)
 
+        self.pipeline_button = AnimatedButton(
+            self.loc_manager.tr("Inject.Btn.UpdateAndInject", "Update && Inject"),
+            theme_manager=self.theme_manager,
+        )
+        self.pipeline_button.setToolTip(
+            self.loc_manager.tr(
+                "Inject.Tooltip.UpdateAndInject",
+                "Check for updates, download, wait for GTA 5 and inject in one go",
+            )
+        )
+
+        auto_inject_layout = QHBoxLayout()
+        self.auto_inject_label = QLabel(
+            self.loc_manager.tr("Inject.Label.AutoInject", "Auto-Inject")
+        )
+        self.auto_inject_toggle = ToggleSwitch()
+        self.auto_inject_toggle.setToolTip(
+            self.loc_manager.tr(
+                "Inject.Tooltip.AutoInject",
+                "Inject the selected DLL as soon as the started game has finished loading",
+            )
+        )
+        self.auto_inject_toggle.setChecked(
+            bool(config_manager.get_config(self.AUTO_INJECT_CONFIG_KEY, default=False))
+        )
+        auto_inject_layout.addWidget(self.auto_inject_label)
+        auto_inject_layout.addStretch()
+        auto_inject_layout.addWidget(self.auto_inject_toggle)
+
         header_layout = QHBoxLayout()
         header_layout.addStretch()
         header_layout.addWidget(info_button)
@@ -2261,12 +2439,19 @@ class InjectPage(QWidget):
         controls_layout.addWidget(
             self.dll_select, alignment=Qt.AlignmentFlag.AlignCenter
         )
+        controls_layout.addWidget(
+            self.instance_list, alignment=Qt.AlignmentFlag.AlignCenter
+        )
         controls_layout.addWidget(
             self.start_gta_button, alignment=Qt.AlignmentFlag.AlignCenter
         )
         controls_layout.addWidget(
             self.inject_button, alignment=Qt.AlignmentFlag.AlignCenter
         )
+        controls_layout.addWidget(
+            self.pipeline_button, alignment=Qt.AlignmentFlag.AlignCenter
+        )
+        controls_layout.addLayout(auto_inject_layout)
 
         centering_controls_layout = QHBoxLayout()
         centering_controls_layout.addStretch()
@@ -2283,27 +2468,22 @@ class InjectPage(QWidget):
         info_button.clicked.connect(self.show_inject_info_dialog)
         self.start_gta_button.clicked.connect(self.handle_start_gta_click)
         self.inject_button.clicked.connect(self.handle_inject_click)
+        self.pipeline_button.clicked.connect(self.handle_pipeline_click)
         self.launcher_select.currentIndexChanged.connect(
             self._on_launcher_selection_changed
         )
         self.dll_select.currentIndexChanged.connect(self._on_dll_selection_changed)
+        self.auto_inject_toggle.toggled.connect(self._on_auto_inject_toggled)
 
-        self.process_checker_timer = QTimer(self)
-        self.process_checker_timer.setInterval(3000)
-        self.process_checker_timer.timeout.connect(self._run_process_check)
+        self.process_monitor.game_started.connect(self._on_game_started)
+        self.process_monitor.game_exited.connect(self._on_game_exited)
+        self._health_event.connect(self._on_health_event)
 
     def showEvent(self, event):
         """Called every time the page becomes visible."""
         super().showEvent(event)
         self._update_dll_selector()
-        self.process_checker_timer.start()
-        logger.debug("InjectPage shown, started process checker timer.")
-
-    def hideEvent(self, event):
-        """Called every time the page is hidden."""
-        super().hideEvent(event)
-        self.process_checker_timer.stop()
-        logger.debug("InjectPage hidden, stopped process checker timer.")
+        self._refresh_instances()
 
     def _set_state(self, new_state):
         """The only function that should ever change the state."""
@@ -2316,6 +2496,13 @@ class InjectPage(QWidget):
         is_launcher_selected = self.launcher_select.currentIndex() > 0
         has_dll = self.dll_to_inject is not None
 
+        self.pipeline_button.setEnabled(
+            self._state in [self.STATE_IDLE, self.STATE_APP_RUNNING]
+        )
+        if self._state != self.STATE_PIPELINE:
+            self.pipeline_button.stop_animation()
+            self.pipeline_button.reset_progress()
+
         if self._state == self.STATE_IDLE:
             self.start_gta_button.setEnabled(is_launcher_selected)
             self.inject_button.setEnabled(False)
@@ -2341,6 +2528,11 @@ class InjectPage(QWidget):
             self.inject_button.setEnabled(False)
             self.inject_button.stop_animation()
 
+        elif self._state == self.STATE_PIPELINE:
+            self.start_gta_button.setEnabled(False)
+            self.inject_button.setEnabled(False)
+            self.pipeline_button.start_animation()
+
     def _update_dll_selector(self):
         """Scans the DLL folder and dynamically adjusts the UI."""
         dll_dir = YMU_DLL_DIR
@@ -2348,10 +2540,12 @@ class InjectPage(QWidget):
 
         found_dlls = [f for f in os.listdir(dll_dir) if f.lower().endswith(".dll")]
         cleaned_names = [name.removesuffix(".dll") for name in found_dlls]
+        profiles = process_manager.load_injection_profiles()
 
         self.dll_select.clear()
+        self.profile_to_inject = None
 
-        if len(found_dlls) == 0:
+        if len(found_dlls) == 0 and not profiles:
             self.dll_select.setVisible(False)
             self.dll_to_inject = None
             self.inject_button.setText(
@@ -2359,7 +2553,7 @@ class InjectPage(QWidget):
             )
             self.inject_button.setEnabled(False)
 
-        elif len(found_dlls) == 1:
+        elif len(found_dlls) == 1 and not profiles:
             self.dll_select.setVisible(False)
             self.dll_to_inject = found_dlls[0]
             fmt = self.loc_manager.tr("Inject.Btn.InjectFile", "Inject {0}")
@@ -2367,28 +2561,50 @@ class InjectPage(QWidget):
 
         else:
             self.dll_select.addItems(cleaned_names)
+            profile_fmt = self.loc_manager.tr(
+                "Inject.Label.ProfileItem", "Profile: {0}"
+            )
+            for name in profiles:
+                # The profile name is the item data; DLL items have none.
+                self.dll_select.addItem(profile_fmt.format(name), name)
             self.dll_select.setVisible(True)
-            current_cleaned_name = self.dll_select.currentText()
-            self.dll_to_inject = f"{current_cleaned_name}.dll"
-            fmt = self.loc_manager.tr("Inject.Btn.InjectFile", "Inject {0}")
-            self.inject_button.setText(fmt.format(current_cleaned_name))
+            self._on_dll_selection_changed(self.dll_select.currentIndex())
+            return
 
         self._update_ui_for_state()
 
     def _on_dll_selection_changed(self, index):
-        """Updates the DLL to be injected when the user makes a selection."""
+        """Updates the DLL (or profile) to be injected when the user makes a selection."""
         if index > -1:
-            cleaned_name = self.dll_select.currentText()
             fmt = self.loc_manager.tr("Inject.Btn.InjectFile", "Inject {0}")
-            self.inject_button.setText(fmt.format(cleaned_name))
+            profile_name = self.dll_select.itemData(index)
+            if profile_name:
+                profile = process_manager.load_injection_profiles().get(profile_name)
+                self.profile_to_inject = profile
+                self.dll_to_inject = (
+                    profile.steps[0].dll if profile and profile.steps else None
+                )
+                self.inject_button.setText(fmt.format(profile_name))
+            else:
+                cleaned_name = self.dll_select.currentText()
+                self.inject_button.setText(fmt.format(cleaned_name))
 
-            self.dll_to_inject = f"{cleaned_name}.dll"
+                self.profile_to_inject = None
+                self.dll_to_inject = f"{cleaned_name}.dll"
         self._update_ui_for_state()
 
     def _on_launcher_selection_changed(self):
         """Enables or disables the start button based on the dropdown selection."""
         self._update_ui_for_state()
 
+    def _on_auto_inject_toggled(self, checked: bool):
+        """Called when the user clicks the auto-inject toggle."""
+        config_manager.set_config(self.AUTO_INJECT_CONFIG_KEY, checked)
+        if checked:
+            self._start_auto_inject()
+        else:
+            self._cancel_ready_wait()
+
     def show_inject_info_dialog(self):
         start_gta_default = (
             "1. Select your launcher\n"
@@ -2422,28 +2638,49 @@ class InjectPage(QWidget):
         dialog.exec()
 
     def handle_start_gta_click(self):
-        if self._state != self.STATE_IDLE:
+        if self._state != self.STATE_IDLE or self._start_pending:
             return
-        if process_manager.find_gta_pid() is not None:
+        if self.launcher_select.currentIndex() == 0:
             cast(MainWindow, self.window()).notification_manager.show(
-                self.loc_manager.tr("Common.Info", "Information"),
+                self.loc_manager.tr("Common.Error", "Error"),
                 self.loc_manager.tr(
-                    "Inject.Notify.AlreadyRunning", "GTA 5 is already running!"
+                    "Inject.Notify.SelectLauncher", "Please select a launcher first."
                 ),
-                icon_type="info",
+                icon_type="error",
             )
             return
-        if self.launcher_select.currentIndex() == 0:
+
+        # Answers from the monitor's snapshot; only scans (off this thread) if it is stale.
+        self._start_pending = True
+        self.start_gta_button.setEnabled(False)
+        self.process_monitor.refresh(self._on_start_snapshot_ready)
+
+    def _on_start_snapshot_ready(self, pid: int | None):
+        """Continues the start flow once the process snapshot is known to be current."""
+        self._start_pending = False
+        if pid is not None:
+            # The page may have missed game_started while it was busy.
+            self.update_inject_button_status(pid)
             cast(MainWindow, self.window()).notification_manager.show(
-                self.loc_manager.tr("Common.Error", "Error"),
+                self.loc_manager.tr("Common.Info", "Information"),
                 self.loc_manager.tr(
-                    "Inject.Notify.SelectLauncher", "Please select a launcher first."
+                    "Inject.Notify.AlreadyRunning", "GTA 5 is already running!"
                 ),
-                icon_type="error",
+                icon_type="info",
             )
             return
+        if self._state != self.STATE_IDLE:
+            return
+        if self.launcher_select.currentIndex() == 0:
+            self._update_ui_for_state()
+            return
 
         self._set_state(self.STATE_LAUNCHING)
+        self._launch_session = launch_history.LaunchSession(
+            launcher=self.launcher_select.currentText(),
+            auto_inject=self.auto_inject_toggle.isChecked(),
+        )
+        self.process_monitor.set_launching(launcher=self.launcher_select.currentText())
         self.worker_manager.run_task(
             target=self._launch_game_logic,
             on_finished=self.on_launch_attempt_finished,
@@ -2451,47 +2688,38 @@ class InjectPage(QWidget):
         )
 
     def _get_rockstar_path(self) -> str | None:
-        """Finds the GTA V install path via Registry (Standard & Enhanced)."""
-        if not IS_WINDOWS:
+        """Finds the Rockstar Games GTA V install path (Standard & Enhanced)."""
+        install = install_discovery.find_install(install_discovery.LAUNCHER_ROCKSTAR)
+        if install is None:
+            logger.error("Could not find Rockstar Games installation path.")
             return None
-        possible_subkeys = [
-            r"SOFTWARE\Rockstar Games\Grand Theft Auto V",
-            r"SOFTWARE\WOW6432Node\Rockstar Games\Grand Theft Auto V",
-            r"SOFTWARE\Rockstar Games\GTAV Enhanced",
-            r"SOFTWARE\WOW6432Node\Rockstar Games\GTAV Enhanced",
-        ]
-
-        for subkey in possible_subkeys:
-            try:
-                regkey = winreg.OpenKey(
-                    winreg.HKEY_LOCAL_MACHINE, subkey, 0, winreg.KEY_READ
-                )
-                path, _ = winreg.QueryValueEx(regkey, "InstallFolder")
-                winreg.CloseKey(regkey)
-                if path:
-                    path = path.strip('"').strip()
-                    if os.path.exists(path):
-                        logger.info(f"Found GTA V path via registry at: {path}")
-                        return path
-            except OSError:
-                continue
-
-        logger.error("Could not find Rockstar Games installation path in registry.")
-        return None
+        return install.path
 
     def _launch_game_logic(self, progress_signal=None):
         """Contains the actual logic for launching the game."""
         launcher = self.launcher_select.currentText()
         logger.info(f"Attempting to launch GTA 5 via {launcher} launcher.")
-        launch_uris = {
-            "Steam": "steam://run/271590",
-            "Epic Games": "com.epicgames.launcher://apps/9d2d0eb64d5c44529cece33fe2a46482?action=launch&silent=true",
-        }
+        session = self._launch_session
 
-        uri = launch_uris.get(launcher)
+        if game_launcher.is_direct_launch_enabled():
+            try:
+                launched = game_launcher.launch_direct(launcher)
+            except game_launcher.DirectLaunchUnavailable as e:
+                logger.warning(f"Direct launch unavailable, using the URI: {e}")
+            else:
+                if session is not None:
+                    session.launch_mode = game_launcher.LAUNCH_MODE_DIRECT
+                    session.launcher_pid = launched.pid
+                self._mark_stage(launch_history.STAGE_LAUNCH_SENT)
+                return f"Started {launcher} directly (PID {launched.pid})."
+
+        if session is not None:
+            session.launch_mode = game_launcher.LAUNCH_MODE_URI
+        uri = game_launcher.LAUNCH_URIS.get(launcher)
         if uri:
             try:
                 webbrowser.open(uri)
+                self._mark_stage(launch_history.STAGE_LAUNCH_SENT)
                 logger.info(f"Successfully sent launch command to {launcher}.")
                 return f"Launch command sent to {launcher}."
             except Exception as e:
@@ -2518,6 +2746,7 @@ class InjectPage(QWidget):
 
             try:
                 os.startfile(executable_path)
+                self._mark_stage(launch_history.STAGE_LAUNCH_SENT)
                 return "Success"
             except OSError as e:
                 logger.exception(f"Failed to start PlayGTAV.exe: {e}")
@@ -2536,15 +2765,177 @@ class InjectPage(QWidget):
         """Callback for when the game launch task finishes."""
         logger.info(f"Launch attempt finished with result: {result}")
 
-    def _run_process_check(self):
-        if self._state in [self.STATE_INJECTING]:
+    def _on_game_started(self, pid: int):
+        """Slot: the process monitor found the game."""
+        if self._state in [self.STATE_INJECTING, self.STATE_PIPELINE]:
+            return
+        self._record_game_seen(pid)
+        self.update_inject_button_status(pid)
+        self._refresh_instances()
+        self._start_auto_inject()
+
+    def _on_game_exited(self, pid: int):
+        """Slot: the process monitor saw the game exit."""
+        self._cancel_ready_wait()
+        if self._state == self.STATE_INJECTING:
+            # The injection task fails on its own; this makes it end up idle.
+            self.gta_pid = None
             return
+        self._finish_session(launch_history.OUTCOME_GAME_EXITED)
+        self.update_inject_button_status(None)
+        self._refresh_instances()
+
+    def _refresh_instances(self):
+        """Looks for all running game instances in the background."""
+        if self._instances_refreshing:
+            return
+        self._instances_refreshing = True
         self.worker_manager.run_task(
-            target=process_manager.find_gta_pid,
-            on_finished=self.update_inject_button_status,
-        )
+            target=process_manager.find_gta_processes,
+            on_finished=self._on_instances_found,
+            on_error=self._on_instances_error,
+        )
+
+    def _on_instances_error(self, error: Exception):
+        self._instances_refreshing = False
+        logger.error(f"Failed to list game instances: {error}")
+
+    def _on_instances_found(self, processes: list):
+        """Fills the instance list, keeping the current selection."""
+        self._instances_refreshing = False
+        selected = {game.pid for game in self._selected_instances()}
+        if not selected and self.gta_pid is not None:
+            selected = {self.gta_pid}
+        self._game_processes = processes
+
+        self.instance_list.clear()
+        for row, game in enumerate(processes):
+            started = time.strftime("%H:%M:%S", time.localtime(game.create_time))
+            self.instance_list.addItem(
+                f"PID {game.pid} · {game.username or '?'} · {started}"
+            )
+            item = self.instance_list.item(row)
+            item.setData(Qt.ItemDataRole.UserRole, game.pid)
+            item.setToolTip(game.exe or game.name)
+            item.setSelected(game.pid in selected)
+        self.instance_list.setVisible(len(processes) > 1)
+
+    def _selected_instances(self) -> list[process_manager.GameProcess]:
+        pids = {
+            item.data(Qt.ItemDataRole.UserRole)
+            for item in self.instance_list.selectedItems()
+        }
+        return [game for game in self._game_processes if game.pid in pids]
+
+    def _is_new_game(self, pid: int) -> bool:
+        """True if the tracked game process started after YMU did."""
+        tracked = self.process_monitor.tracked_process
+        return (
+            tracked is not None
+            and tracked.pid == pid
+            and tracked.create_time >= self._created_at
+        )
+
+    def _mark_stage(self, stage: str):
+        session = self._launch_session
+        if session is not None:
+            session.mark(stage)
+
+    def _record_game_seen(self, pid: int):
+        """Timestamps the game's start; begins a session if auto-inject picked it up."""
+        if self._launch_session is None:
+            if not self.auto_inject_toggle.isChecked() or not self._is_new_game(pid):
+                return
+            self._launch_session = launch_history.LaunchSession(auto_inject=True)
+        session = self._launch_session
+        session.pid = pid
+        tracked = self.process_monitor.tracked_process
+        if tracked is not None and tracked.pid == pid:
+            session.mark_at(launch_history.STAGE_PROCESS_CREATED, tracked.create_time)
+        session.mark(launch_history.STAGE_PROCESS_SEEN)
+        sent = session.stages.get(launch_history.STAGE_LAUNCH_SENT)
+        created = session.stages.get(launch_history.STAGE_PROCESS_CREATED)
+        if sent is not None and created is not None:
+            logger.info(
+                f"Game process appeared {created - sent:.0f} ms after the "
+                f"{session.launch_mode} launch."
+            )
+
+    def _finish_session(self, outcome: str, error: Optional[str] = None):
+        session, self._launch_session = self._launch_session, None
+        if session is not None:
+            launch_history.finish(session, outcome, error)
+
+    def _start_auto_inject(self):
+        """Waits in the background until the game is ready and then injects."""
+        if (
+            not self.auto_inject_toggle.isChecked()
+            or self._state != self.STATE_APP_RUNNING
+            or self._ready_stop_event is not None
+            or not self.dll_to_inject
+            or self.gta_pid is None
+        ):
+            return
+        if not self._is_new_game(self.gta_pid):
+            logger.info("Not auto-injecting into a game that was running before YMU.")
+            return
+
+        tracked = self.process_monitor.tracked_process
+        stop_event = threading.Event()
+        self._ready_stop_event = stop_event
+        logger.info(f"Auto-inject: waiting for game process {tracked.pid} to be ready.")
+        self.worker_manager.run_task(
+            target=self._wait_until_ready_logic,
+            tracked=tracked,
+            stop_event=stop_event,
+            on_finished=lambda status: self._on_game_ready(tracked, stop_event, status),
+            on_error=lambda e: self._on_ready_error(stop_event, e),
+            dedicated=True,
+            cancel_event=stop_event,
+        )
+
+    def _wait_until_ready_logic(self, tracked, stop_event, progress_signal=None):
+        detector = process_manager.ReadinessDetector(tracked)
+        return detector.wait_until_ready(
+            timeout=self.READY_TIMEOUT_SECONDS, stop_event=stop_event
+        )
+
+    def _cancel_ready_wait(self):
+        if self._ready_stop_event is not None:
+            self._ready_stop_event.set()
+            self._ready_stop_event = None
+
+    def _on_game_ready(self, tracked, stop_event, status):
+        """Callback for when the readiness wait finishes."""
+        if self._ready_stop_event is stop_event:
+            self._ready_stop_event = None
+        if status is None or stop_event.is_set():
+            return
+        if self._state != self.STATE_APP_RUNNING or self.gta_pid != tracked.pid:
+            return
+        if not status.ready:
+            cast(MainWindow, self.window()).notification_manager.show(
+                self.loc_manager.tr("Common.Info", "Information"),
+                self.loc_manager.tr(
+                    "Inject.Notify.NotReady",
+                    "Could not tell when GTA 5 finished loading. Inject manually once you see the start screen.",
+                ),
+                icon_type="info",
+            )
+            return
+        self._mark_stage(launch_history.STAGE_READY)
+        logger.info("Auto-inject: game is ready, injecting.")
+        self.handle_inject_click()
+
+    def _on_ready_error(self, stop_event, error: Exception):
+        if self._ready_stop_event is stop_event:
+            self._ready_stop_event = None
+        # Usually the game exited while loading; _on_game_exited handles that.
+        logger.info(f"Auto-inject: readiness check ended: {error!r}")
 
     def update_inject_button_status(self, pid: int | None):
+        if self._state == self.STATE_PIPELINE:
+            return
         self.gta_pid = pid
 
         if self.gta_pid is not None:
@@ -2554,11 +2945,63 @@ class InjectPage(QWidget):
             if self._state != self.STATE_LAUNCHING:
                 self._set_state(self.STATE_IDLE)
 
+    def _leave_busy_state(self, state_if_running: str):
+        """
+        Leaves PIPELINE or INJECTING. Both ignore the monitor's start and exit
+        signals, so gta_pid is re-read from the monitor instead of trusted.
+        """
+        self.gta_pid = self.process_monitor.current_pid
+        if self.gta_pid is not None:
+            self._set_state(state_if_running)
+        else:
+            self._set_state(self.STATE_IDLE)
+
     def handle_inject_click(self):
         if self._state != self.STATE_APP_RUNNING:
             return
 
+        targets = None
+        if self.instance_list.isVisible():
+            targets = self._selected_instances()
+            if not targets:
+                cast(MainWindow, self.window()).notification_manager.show(
+                    self.loc_manager.tr("Common.Error", "Error"),
+                    self.loc_manager.tr(
+                        "Inject.Notify.SelectInstance",
+                        "Please select at least one game instance.",
+                    ),
+                    icon_type="error",
+                )
+                return
+
+        self._cancel_ready_wait()
+        if self._launch_session is not None:
+            self._launch_session.dll = self.dll_to_inject
+        self._mark_stage(launch_history.STAGE_INJECT_START)
         self._set_state(self.STATE_INJECTING)
+        if self.profile_to_inject is not None:
+            # Dedicated thread: the delays between DLLs would hold up the shared worker.
+            stop_event = threading.Event()
+            self.worker_manager.run_task(
+                target=self._inject_profile_logic,
+                profile=self.profile_to_inject,
+                targets=None if targets is None else [game.tracked for game in targets],
+                stop_event=stop_event,
+                on_finished=self.on_profile_injection_complete,
+                on_error=self.on_task_error,
+                dedicated=True,
+                cancel_event=stop_event,
+            )
+            return
+        if targets is not None:
+            self.worker_manager.run_task(
+                target=self._inject_many_logic,
+                targets=[game.tracked for game in targets],
+                on_finished=self.on_batch_injection_complete,
+                on_error=self.on_task_error,
+                dedicated=True,
+            )
+            return
         self.worker_manager.run_task(
             target=self._inject_logic,
             on_finished=self.on_injection_complete,
@@ -2576,7 +3019,12 @@ class InjectPage(QWidget):
             )
             raise ValueError(msg)
 
-        if not process_manager.is_process_running(self.gta_pid):
+        tracked = self.process_monitor.tracked_process
+        if tracked is not None and tracked.pid == self.gta_pid:
+            is_running = tracked.is_alive()
+        else:
+            is_running = process_manager.is_process_running(self.gta_pid)
+        if not is_running:
             msg = self.loc_manager.tr(
                 "Inject.Error.ProcessLost",
                 "GTA 5 process disappeared before injection.",
@@ -2594,9 +3042,180 @@ class InjectPage(QWidget):
             )
             raise RuntimeError(msg)
 
+    def _inject_many_logic(self, targets, progress_signal=None):
+        """Injects the selected DLL into several game instances concurrently."""
+        if not self.dll_to_inject:
+            msg = self.loc_manager.tr(
+                "Inject.Error.NoDllSelected",
+                "Error: No DLL selected or found for injection.",
+            )
+            raise ValueError(msg)
+        return process_manager.inject_many(
+            targets,
+            self.dll_to_inject,
+            timeout=self.BATCH_INJECT_TIMEOUT_SECONDS,
+        )
+
+    def _inject_profile_logic(
+        self, profile, targets=None, stop_event=None, progress_signal=None
+    ):
+        """Injects every DLL of a profile, in order, into each target."""
+        if targets is None:
+            assert self.gta_pid is not None
+            tracked = self.process_monitor.tracked_process
+            if tracked is None or tracked.pid != self.gta_pid:
+                tracked = process_manager.TrackedProcess.from_pid(self.gta_pid)
+            if tracked is None or not tracked.is_alive():
+                msg = self.loc_manager.tr(
+                    "Inject.Error.ProcessLost",
+                    "GTA 5 process disappeared before injection.",
+                )
+                raise RuntimeError(msg)
+            targets = [tracked]
+        return {
+            tracked.pid: process_manager.inject_profile(tracked, profile, stop_event)
+            for tracked in targets
+        }
+
+    def on_profile_injection_complete(self, results: dict):
+        """Callback for when an injection profile has run against every target."""
+        lines = []
+        for pid, result in results.items():
+            lines.append(f"PID {pid} ({result.duration_ms:.0f} ms):")
+            for step in result.steps:
+                if step.success:
+                    status = f"✅ {step.dll} ({step.duration_ms:.0f} ms)"
+                else:
+                    status = f"❌ {step.dll}: {step.error}"
+                lines.append(f"  {status}")
+        summary = "\n".join(lines)
+
+        # A process with any injected DLL counts as injected; failed later steps
+        # are only a warning, so the user is not offered the same DLL again.
+        succeeded = [result for result in results.values() if result.injected]
+        if not succeeded:
+            errors = [step.error for r in results.values() for step in r.steps]
+            if "Access Denied" in errors:
+                self.on_task_error(PermissionError("Access Denied"))
+            else:
+                self.on_task_error(RuntimeError(summary))
+            return
+
+        profile_name = succeeded[0].profile
+        for result in succeeded:
+            self._start_health_monitor(result.pid, profile_name)
+        self._mark_stage(launch_history.STAGE_INJECT_DONE)
+        self._finish_session(launch_history.OUTCOME_INJECTED)
+        self._leave_busy_state(self.STATE_INJECTED)
+        complete = all(result.success for result in results.values())
+        if complete:
+            logger.info(f"Profile '{profile_name}' injected:\n{summary}")
+            title = self.loc_manager.tr(
+                "Inject.Notify.SuccessTitle", "Injection Successful"
+            )
+        else:
+            logger.warning(f"Profile '{profile_name}' partly injected:\n{summary}")
+            title = self.loc_manager.tr(
+                "Inject.Notify.PartialTitle", "Injected with Warnings"
+            )
+        msg = self.loc_manager.tr(
+            "Inject.Notify.ProfileMsg", "Injected profile '{0}'."
+        ).format(profile_name)
+        cast(MainWindow, self.window()).notification_manager.show(
+            title,
+            f"{msg}\n{summary}",
+            icon_type="success" if complete else "info",
+            duration=10000,
+        )
+
+    def on_batch_injection_complete(self, results: dict):
+        """Callback for when an injection into several instances finishes."""
+        lines = []
+        for pid, result in results.items():
+            status = "✅" if result.success else f"❌ {result.error}"
+            lines.append(f"PID {pid}: {status}")
+        summary = "\n".join(lines)
+
+        succeeded = [result for result in results.values() if result.success]
+        if not succeeded:
+            if any(result.error == "Access Denied" for result in results.values()):
+                self.on_task_error(PermissionError("Access Denied"))
+            else:
+                self.on_task_error(RuntimeError(summary))
+            return
+
+        for result in succeeded:
+            self._start_health_monitor(result.pid, self.dll_to_inject)
+        self._mark_stage(launch_history.STAGE_INJECT_DONE)
+        self._finish_session(launch_history.OUTCOME_INJECTED)
+        self._leave_busy_state(self.STATE_INJECTED)
+        logger.info(f"Injected into {len(succeeded)} of {len(results)} instances.")
+        msg = self.loc_manager.tr(
+            "Inject.Notify.BatchMsg", "Injected into {0} of {1} instances."
+        ).format(len(succeeded), len(results))
+        cast(MainWindow, self.window()).notification_manager.show(
+            self.loc_manager.tr("Inject.Notify.SuccessTitle", "Injection Successful"),
+            f"{msg}\n{summary}",
+            icon_type="success" if len(succeeded) == len(results) else "info",
+            duration=10000,
+        )
+
+    def _start_health_monitor(self, pid: int | None, dll_filename: Optional[str]):
+        """Watches an injected game for crashes and memory blow-ups."""
+        if pid is None:
+            return
+        tracked = self.process_monitor.tracked_process
+        if tracked is None or tracked.pid != pid:
+            game = next((g for g in self._game_processes if g.pid == pid), None)
+            tracked = (
+                game.tracked if game else process_manager.TrackedProcess.from_pid(pid)
+            )
+        if tracked is None:
+            return
+        previous = self._health_monitors.pop(pid, None)
+        if previous is not None:
+            previous.stop()
+        monitor = health_monitor.HealthMonitor(
+            tracked,
+            dll=dll_filename,
+            on_event=lambda session, event: self._health_event.emit(session, event),
+        )
+        self._health_monitors[pid] = monitor
+        monitor.start()
+
+    def _on_health_event(self, session, event):
+        """Slot: a health monitor flagged something about an injected game."""
+        if event.kind in [health_monitor.EVENT_CRASH, health_monitor.EVENT_EXIT]:
+            monitor = self._health_monitors.get(session.pid)
+            if monitor is not None and monitor.session is session:
+                del self._health_monitors[session.pid]
+        if event.kind == health_monitor.EVENT_CRASH:
+            cast(MainWindow, self.window()).notification_manager.show(
+                self.loc_manager.tr("Inject.Notify.CrashTitle", "Game Crashed"),
+                self.loc_manager.tr(
+                    "Inject.Notify.CrashMsg",
+                    "GTA 5 (PID {0}) stopped {1:.0f}s after injection ({2}).",
+                ).format(session.pid, event.at, event.detail),
+                icon_type="error",
+                duration=10000,
+            )
+        elif event.kind == health_monitor.EVENT_MEMORY:
+            cast(MainWindow, self.window()).notification_manager.show(
+                self.loc_manager.tr("Common.Info", "Information"),
+                self.loc_manager.tr(
+                    "Inject.Notify.MemoryMsg",
+                    "GTA 5 (PID {0}) memory is growing fast {1:.0f}s after injection: {2}",
+                ).format(session.pid, event.at, event.detail),
+                icon_type="info",
+                duration=10000,
+            )
+
     def on_injection_complete(self, result: str):
         """Callback for when the injection task finishes."""
-        self._set_state(self.STATE_INJECTED)
+        self._start_health_monitor(self.gta_pid, self.dll_to_inject)
+        self._mark_stage(launch_history.STAGE_INJECT_DONE)
+        self._finish_session(launch_history.OUTCOME_INJECTED)
+        self._leave_busy_state(self.STATE_INJECTED)
         logger.info(f"Injection finished with result: {result}")
 
         cast(MainWindow, self.window()).notification_manager.show(
@@ -2607,25 +3226,134 @@ class InjectPage(QWidget):
             icon_type="success",
         )
 
+    def handle_pipeline_click(self):
+        """Starts the check -> download -> select -> wait -> inject pipeline."""
+        if self._state not in [self.STATE_IDLE, self.STATE_APP_RUNNING]:
+            return
+
+        download_page = cast(MainWindow, self.window()).download_page
+        channel_name = download_page.channel_select.currentText()
+        channel_info = DownloadPage.RELEASE_CHANNELS[channel_name]
+        logger.info(f"Starting update-and-inject pipeline for {channel_name}.")
+
+        self._cancel_ready_wait()
+        self._finish_session(launch_history.OUTCOME_CANCELLED)
+        self._set_state(self.STATE_PIPELINE)
+        stop_event = threading.Event()
+        self.worker_manager.run_task(
+            target=update_pipeline.run_update_and_inject,
+            repository=channel_info["repo"],
+            dll_name=channel_info["dll_name"],
+            stop_event=stop_event,
+            on_finished=self.on_pipeline_complete,
+            on_error=self.on_task_error,
+            on_progress=lambda p: self.pipeline_button.set_progress(p / 100.0),
+            dedicated=True,
+            cancel_event=stop_event,
+        )
+
+    def on_pipeline_complete(self, result: "update_pipeline.PipelineResult"):
+        """Callback for when the update-and-inject pipeline finishes."""
+        self.process_monitor.track(result.pid)
+        self._start_health_monitor(result.pid, result.dll_filename)
+        self._update_dll_selector()
+        index = self.dll_select.findText(result.dll_filename.removesuffix(".dll"))
+        if index != -1:
+            self.dll_select.setCurrentIndex(index)
+        self._leave_busy_state(self.STATE_INJECTED)
+
+        timings = ", ".join(
+            f"{stage} {duration / 1000:.1f}s"
+            for stage, duration in result.timings.items()
+        )
+        msg = self.loc_manager.tr(
+            "Inject.Notify.PipelineMsg", "Injected {0} ({1}) in {2:.1f}s."
+        ).format(result.dll_filename, result.version_tag, result.total_ms / 1000)
+        cast(MainWindow, self.window()).notification_manager.show(
+            self.loc_manager.tr("Inject.Notify.SuccessTitle", "Injection Successful"),
+            f"{msg}\n{timings}",
+            icon_type="success",
+            duration=10000,
+        )
+
+    def _start_injection_helper(self):
+        """Starts the elevated injection helper (UAC prompt) and retries the injection."""
+        if self._helper_starting or self._injection_helper is not None:
+            return
+        self._helper_starting = True
+        stop_event = threading.Event()
+        self.worker_manager.run_task(
+            target=self._start_injection_helper_logic,
+            stop_event=stop_event,
+            on_finished=self._on_injection_helper_started,
+            on_error=self._on_injection_helper_error,
+            dedicated=True,
+            cancel_event=stop_event,
+        )
+
+    def _start_injection_helper_logic(self, stop_event, progress_signal=None):
+        client = injection_helper.InjectionHelperClient()
+        client.start(stop_event)
+        return client
+
+    def _on_injection_helper_started(self, client):
+        self._helper_starting = False
+        self._injection_helper = client
+        process_manager.set_injector_backend(
+            injection_helper.HelperInjectorBackend(client)
+        )
+        logger.info("Injections now go through the elevated helper.")
+        if self._state == self.STATE_APP_RUNNING:
+            self.handle_inject_click()
+
+    def _on_injection_helper_error(self, error: Exception):
+        self._helper_starting = False
+        logger.error(f"Injection helper failed to start: {error}")
+        cast(MainWindow, self.window()).notification_manager.show(
+            self.loc_manager.tr("Common.Error", "Permission Error"),
+            self.loc_manager.tr(
+                "Inject.Error.HelperFailed",
+                "Could not start the elevated injection helper.",
+            ),
+            icon_type="error",
+            duration=10000,
+            action_text=self.loc_manager.tr("Common.RestartAdmin", "Restart as Admin"),
+            action_callback=restart_as_admin,
+        )
+
     def on_task_error(self, error: Exception):
         logger.error(f"A task failed in the background: {error}")
-        if self.gta_pid:
-            self._set_state(self.STATE_APP_RUNNING)
-        else:
-            self._set_state(self.STATE_IDLE)
+        helper = self._injection_helper
+        if helper is not None and not helper.is_running():
+            # The helper went away; go back to injecting from this process.
+            self._injection_helper = None
+            process_manager.set_injector_backend(None)
+        if self._state in [self.STATE_LAUNCHING, self.STATE_INJECTING]:
+            self._finish_session(launch_history.OUTCOME_FAILED, str(error))
+        if self._state == self.STATE_LAUNCHING:
+            self.process_monitor.set_launching(False)
+        self._leave_busy_state(self.STATE_APP_RUNNING)
         if isinstance(error, PermissionError) or "Access Denied" in str(error):
+            if self._injection_helper is not None:
+                # Even the elevated helper was denied; restarting YMU would not help.
+                cast(MainWindow, self.window()).notification_manager.show(
+                    self.loc_manager.tr("Common.Error", "Permission Error"),
+                    str(error),
+                    icon_type="error",
+                )
+                return
             msg = self.loc_manager.tr(
                 "Inject.Error.AccessDenied",
-                "Missing permissions to inject into GTA V.\nTry restarting YMU as Administrator.",
+                "Missing permissions to inject into GTA V.\nRetry with administrator rights; YMU keeps running.",
             )
-            action_text = self.loc_manager.tr("Common.RestartAdmin", "Restart as Admin")
+            action_text = self.loc_manager.tr("Common.InjectAsAdmin", "Inject as Admin")
             cast(MainWindow, self.window()).notification_manager.show(
                 self.loc_manager.tr("Common.Error", "Permission Error"),
                 msg,
                 icon_type="error",
                 duration=10000,
                 action_text=action_text,
-                action_callback=restart_as_admin,
+                action_callback=self._start_injection_helper,
             )
         else:
             cast(MainWindow, self.window()).notification_manager.show(
@@ -2959,6 +3687,70 @@ class SettingsPage(QWidget):
         debug_console_layout.addStretch()
         debug_console_layout.addWidget(self.debug_console_toggle)
 
+        network_log_layout = QHBoxLayout()
+        self.network_log_label = QLabel(
+            self.loc_manager.tr("Settings.Other.NetworkLog", "Log Network Timings")
+        )
+        self.network_log_toggle = ToggleSwitch()
+        self.network_log_toggle.setToolTip(
+            self.loc_manager.tr(
+                "Settings.Other.Tooltip.NetworkLog",
+                "Write per-request timings to network.jsonl next to ymu.log",
+            )
+        )
+        network_log_layout.addWidget(self.network_log_label)
+        network_log_layout.addStretch()
+        network_log_layout.addWidget(self.network_log_toggle)
+
+        peer_sharing_layout = QHBoxLayout()
+        self.peer_sharing_label = QLabel(
+            self.loc_manager.tr("Settings.Other.PeerSharing", "Share DLLs on LAN")
+        )
+        self.peer_sharing_toggle = ToggleSwitch()
+        self.peer_sharing_toggle.setToolTip(
+            self.loc_manager.tr(
+                "Settings.Other.Tooltip.PeerSharing",
+                "Fetch verified DLLs from other YMU instances on your network first and serve yours to them",
+            )
+        )
+        peer_sharing_layout.addWidget(self.peer_sharing_label)
+        peer_sharing_layout.addStretch()
+        peer_sharing_layout.addWidget(self.peer_sharing_toggle)
+
+        direct_launch_layout = QHBoxLayout()
+        self.direct_launch_label = QLabel(
+            self.loc_manager.tr(
+                "Settings.Other.DirectLaunch", "Start Launchers Directly"
+            )
+        )
+        self.direct_launch_toggle = ToggleSwitch()
+        self.direct_launch_toggle.setToolTip(
+            self.loc_manager.tr(
+                "Settings.Other.Tooltip.DirectLaunch",
+                "Run Steam, Epic or PlayGTAV.exe directly instead of opening a launch link, so YMU can follow the started process",
+            )
+        )
+        direct_launch_layout.addWidget(self.direct_launch_label)
+        direct_launch_layout.addStretch()
+        direct_launch_layout.addWidget(self.direct_launch_toggle)
+
+        background_update_layout = QHBoxLayout()
+        self.background_update_label = QLabel(
+            self.loc_manager.tr(
+                "Settings.Other.BackgroundUpdate", "Install YMU Updates on Restart"
+            )
+        )
+        self.background_update_toggle = ToggleSwitch()
+        self.background_update_toggle.setToolTip(
+            self.loc_manager.tr(
+                "Settings.Other.Tooltip.BackgroundUpdate",
+                "Download and verify new YMU versions in the background and install them on the next start",
+            )
+        )
+        background_update_layout.addWidget(self.background_update_label)
+        background_update_layout.addStretch()
+        background_update_layout.addWidget(self.background_update_toggle)
+
         btn_open_folder = StatefulButton(
             f"  {self.loc_manager.tr('Settings.Btn.OpenYimFolder', 'Open YimMenu Folder')}",
             theme_manager=self.theme_manager,
@@ -3021,14 +3813,33 @@ class SettingsPage(QWidget):
                 "Open the feature request page on GitHub in your browser",
             )
         )
+        btn_network_stats = StatefulButton(
+            f"  {self.loc_manager.tr('Settings.Btn.NetworkStats', 'Network Statistics')}",
+            theme_manager=self.theme_manager,
+            icon_path=resource_path(os.path.join("assets", "icons", "info.svg")),
+            **link_button_colors,
+        )
+        btn_network_stats.setObjectName("LinkButton")
+        btn_network_stats.setIconSize(QSize(20, 20))
+        btn_network_stats.setToolTip(
+            self.loc_manager.tr(
+                "Settings.Tooltip.NetworkStats",
+                "Show request timings (p50/p95) per host",
+            )
+        )
         self.btn_check_for_updates = AnimatedButton(
             self.loc_manager.tr("Settings.Btn.CheckUpdates", "Check for YMU Updates"),
             theme_manager=self.theme_manager,
         )
         other_layout.addWidget(other_title)
         other_layout.addLayout(debug_console_layout)
+        other_layout.addLayout(network_log_layout)
+        other_layout.addLayout(peer_sharing_layout)
+        other_layout.addLayout(direct_launch_layout)
+        other_layout.addLayout(background_update_layout)
         other_layout.addWidget(btn_open_folder)
         other_layout.addWidget(btn_open_ymu_folder)
+        other_layout.addWidget(btn_network_stats)
         other_layout.addWidget(btn_report_bug)
         other_layout.addWidget(btn_request_feature)
         other_layout.addSpacing(15)
@@ -3066,6 +3877,13 @@ class SettingsPage(QWidget):
         self.btn_check_for_updates.clicked.connect(self._handle_check_for_updates)
         self.auto_reload_toggle.toggled.connect(self._on_auto_reload_toggled)
         self.debug_console_toggle.toggled.connect(self._on_debug_console_toggled)
+        self.network_log_toggle.toggled.connect(self._on_network_log_toggled)
+        self.peer_sharing_toggle.toggled.connect(self._on_peer_sharing_toggled)
+        self.direct_launch_toggle.toggled.connect(self._on_direct_launch_toggled)
+        self.background_update_toggle.toggled.connect(
+            self._on_background_update_toggled
+        )
+        btn_network_stats.clicked.connect(self.show_network_stats_dialog)
         self.auto_reload_toggle.focusChanged.connect(
             lambda has_focus: self._on_toggle_focus_changed(
                 self.auto_reload_label, has_focus
@@ -3076,6 +3894,26 @@ class SettingsPage(QWidget):
                 self.debug_console_label, has_focus
             )
         )
+        self.network_log_toggle.focusChanged.connect(
+            lambda has_focus: self._on_toggle_focus_changed(
+                self.network_log_label, has_focus
+            )
+        )
+        self.peer_sharing_toggle.focusChanged.connect(
+            lambda has_focus: self._on_toggle_focus_changed(
+                self.peer_sharing_label, has_focus
+            )
+        )
+        self.direct_launch_toggle.focusChanged.connect(
+            lambda has_focus: self._on_toggle_focus_changed(
+                self.direct_launch_label, has_focus
+            )
+        )
+        self.background_update_toggle.focusChanged.connect(
+            lambda has_focus: self._on_toggle_focus_changed(
+                self.background_update_label, has_focus
+            )
+        )
         btn_enable_script.clicked.connect(self._enable_selected_scripts)
         btn_disable_script.clicked.connect(self._disable_selected_scripts)
         btn_open_scripts_folder.clicked.connect(
@@ -3108,6 +3946,14 @@ class SettingsPage(QWidget):
         )
         self.debug_console_toggle.setChecked(bool(is_debug_enabled))
 
+        self.network_log_toggle.setChecked(network_monitor.is_log_to_file_enabled())
+
+        self.peer_sharing_toggle.setChecked(peer_service.is_enabled())
+        self.direct_launch_toggle.setChecked(game_launcher.is_direct_launch_enabled())
+        self.background_update_toggle.setChecked(
+            update_checker.is_background_update_enabled()
+        )
+
     def _on_auto_reload_toggled(self, checked: bool):
         """Called when the user clicks the auto-reload toggle."""
         settings_manager.set_setting("lua.enable_auto_reload_changed_scripts", checked)
@@ -3116,6 +3962,75 @@ class SettingsPage(QWidget):
         """Called when the user clicks the debug console toggle."""
         settings_manager.set_setting("debug.external_console", checked)
 
+    def _on_network_log_toggled(self, checked: bool):
+        """Called when the user clicks the network log toggle."""
+        network_monitor.set_log_to_file(checked)
+
+    def _on_peer_sharing_toggled(self, checked: bool):
+        """Called when the user clicks the peer sharing toggle."""
+        config_manager.set_config(peer_service.ENABLED_CONFIG_KEY, checked)
+        if checked:
+            peer_service.start_sharing()
+        else:
+            peer_service.stop_sharing()
+
+    def _on_direct_launch_toggled(self, checked: bool):
+        """Called when the user clicks the direct launch toggle."""
+        config_manager.set_config(game_launcher.DIRECT_LAUNCH_CONFIG_KEY, checked)
+
+    def _on_background_update_toggled(self, checked: bool):
+        """Called when the user clicks the background update toggle."""
+        if checked == update_checker.is_background_update_enabled():
+            return
+        config_manager.set_config(update_checker.BACKGROUND_UPDATE_CONFIG_KEY, checked)
+        if checked:
+            cast(MainWindow, self.window()).start_background_update()
+
+    def show_network_stats_dialog(self):
+        """Shows the per-host p50/p95 request timings collected this session."""
+        summary = network_monitor.summarize()
+        if not summary:
+            content = {
+                self.loc_manager.tr(
+                    "Settings.Network.Title", "Network Statistics"
+                ): self.loc_manager.tr(
+                    "Settings.Network.Empty", "No requests recorded yet."
+                )
+            }
+        else:
+            fmt = self.loc_manager.tr(
+                "Settings.Network.Summary",
+                "Requests: {0} | Cache hits: {1} | Errors: {2}",
+            )
+            phase_names = {
+                "total": "Total",
+                "dns": "DNS",
+                "connect": "Connect",
+                "tls": "TLS",
+                "ttfb": "TTFB",
+                "transfer": "Transfer",
+            }
+            content = {}
+            for host, stats in summary.items():
+                lines = [
+                    fmt.format(stats["count"], stats["cache_hits"], stats["errors"])
+                ]
+                for phase, name in phase_names.items():
+                    p50 = stats[f"{phase}_p50"]
+                    p95 = stats[f"{phase}_p95"]
+                    if p50 is None or p95 is None:
+                        continue
+                    lines.append(f"{name}: p50 {p50:.0f} ms / p95 {p95:.0f} ms")
+                content[host or "?"] = "\n".join(lines)
+
+        dialog = InfoDialog(
+            title=self.loc_manager.tr("Settings.Network.Title", "Network Statistics"),
+            content=content,
+            theme_manager=self.theme_manager,
+            parent=self,
+        )
+        dialog.exec()
+
     def _on_toggle_focus_changed(self, label: QLabel, has_focus: bool):
         """Updates the style of a label based on the focus state of its toggle."""
         if has_focus:
@@ -3194,6 +4109,7 @@ class SettingsPage(QWidget):
             target=update_checker.check_for_updates,
             on_finished=self._on_update_check_finished,
             on_error=self._on_task_error,
+            force=True,
         )
 
     def _on_update_check_finished(self, result):
@@ -3223,6 +4139,13 @@ class SettingsPage(QWidget):
                 ),
             )
 
+        elif (
+            status == update_checker.STATUS_UPDATE_AVAILABLE
+            and update_checker.is_background_update_enabled()
+            and update_checker.get_app_executable() is not None
+        ):
+            cast(MainWindow, self.window()).start_background_update()
+
         elif status == update_checker.STATUS_UPDATE_AVAILABLE:
             title = self.loc_manager.tr(
                 "Settings.Update.AvailableTitle", "Update Available"
@@ -3393,13 +4316,21 @@ class SettingsPage(QWidget):
 
 
 def cleanup_updater():
-    updater_path = os.path.join(YMU_APPDATA_DIR, "ymu_self_updater.exe")
-    if os.path.exists(updater_path):
-        try:
-            os.remove(updater_path)
-            logger.info(f"Removed old updater: {updater_path}")
-        except OSError:
-            pass
+    """
+    Removes updaters left behind by older YMU versions. The current updater
+    lives in update_checker.UPDATER_CACHE_DIR and is reused across updates.
+    """
+    legacy_paths = [
+        update_checker.UPDATER_EXE_PATH,
+        os.path.join(YMU_DLL_DIR, "ymu_self_updater.exe"),
+    ]
+    for updater_path in legacy_paths:
+        if os.path.exists(updater_path):
+            try:
+                os.remove(updater_path)
+                logger.info(f"Removed old updater: {updater_path}")
+            except OSError:
+                pass
 
 
 if __name__ == "__main__":
@@ -3417,8 +4348,19 @@ if __name__ == "__main__":
     except Exception as e:
         logger.error(f"Failed to delete the legacy './ymu' folder: {e}")
 
+    app_executable = update_checker.get_app_executable()
+    if app_executable:
+        update_checker.cleanup_previous_version(app_executable)
+        if update_checker.apply_staged_update(app_executable):
+            import subprocess
+
+            logger.info("Staged update applied. Launching the new version...")
+            subprocess.Popen([app_executable] + sys.argv[1:])
+            sys.exit(0)
+
     app = QApplication(sys.argv)
     cleanup_updater()
+    peer_service.start_sharing()
     worker_manager = WorkerManager()
     focus_filter = FocusStealingFilter(app)
     app.installEventFilter(focus_filter)
@@ -3441,5 +4383,7 @@ if __name__ == "__main__":
     window.show()
     QTimer.singleShot(100, window.show_when_ready)
     exit_code = app.exec()
+    window.process_monitor.shutdown()
+    peer_service.stop_sharing()
     worker_manager.cleanup()
     sys.exit(exit_code)
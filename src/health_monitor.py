@@ -0,0 +1,301 @@
+# health_monitor.py - Samples the game after injection and flags crashes and memory blow-ups.
+import collections
+import dataclasses
+import json
+import logging
+import os
+import threading
+import time
+from typing import Callable, Deque, List, Optional
+
+import psutil
+
+from paths import YMU_APPDATA_DIR
+from process_manager import TrackedProcess
+
+try:
+    import win32api
+    import win32process
+except ImportError:
+    win32api = win32process = None
+
+logger = logging.getLogger(__name__)
+
+HEALTH_HISTORY_PATH = os.path.join(YMU_APPDATA_DIR, "health_history.json")
+HISTORY_SIZE = 20
+
+# Sample a few times per second while a crash caused by the injection is
+# most likely, then back off.
+FAST_INTERVAL_SECONDS = 0.5
+FAST_PHASE_SECONDS = 180
+SLOW_INTERVAL_SECONDS = 10.0
+# Samples kept in memory for the growth check (the history only keeps a summary).
+SAMPLE_BUFFER_SIZE = 120
+
+# Memory counts as blowing up when the working set grows by this much within
+# the window. No limit relative to the size after injection: people usually
+# inject at the menu, and loading story or online mode more than doubles it.
+MEMORY_GROWTH_BYTES = 1024 * 1024 * 1024
+MEMORY_GROWTH_WINDOW_SECONDS = 30
+# An exit with an unknown exit code this soon after injection counts as a crash.
+EARLY_EXIT_SECONDS = 60
+
+# Access for a handle that outlives the process and still answers GetExitCodeProcess.
+SYNCHRONIZE = 0x00100000
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+STILL_ACTIVE = 259
+
+EVENT_CRASH = "crash"
+EVENT_EXIT = "exit"
+EVENT_MEMORY = "memory"
+
+_history_lock = threading.Lock()
+
+
+@dataclasses.dataclass
+class HealthSample:
+    """One sample; at is in seconds since the injection."""
+
+    at: float
+    cpu_percent: float
+    rss_bytes: int
+
+
+@dataclasses.dataclass
+class HealthEvent:
+    kind: str
+    at: float
+    detail: str
+
+
+@dataclasses.dataclass
+class HealthSession:
+    pid: int
+    dll: Optional[str]
+    injected_at: float
+    events: List[HealthEvent] = dataclasses.field(default_factory=list)
+    sample_count: int = 0
+    baseline_rss_bytes: Optional[int] = None
+    peak_rss_bytes: int = 0
+    peak_cpu_percent: float = 0.0
+    duration_seconds: Optional[float] = None
+
+    def summary(self) -> dict:
+        return dataclasses.asdict(self)
+
+
+def _format_bytes(value: int) -> str:
+    return f"{value / (1024 * 1024 * 1024):.2f} GiB"
+
+
+def _format_exit_code(code: Optional[int]) -> str:
+    if code is None:
+        return "unknown"
+    # Windows reports NTSTATUS codes such as 0xC0000005 as large integers.
+    return hex(code) if code < 0 or code > 0xFFFF else str(code)
+
+
+class HealthMonitor(threading.Thread):
+    """
+    Watches an injected game process in a daemon thread: liveness, CPU and
+    working set, at FAST_INTERVAL_SECONDS for the first minutes and at
+    SLOW_INTERVAL_SECONDS afterwards. Crashes, exits and memory blow-ups are
+    passed to on_event (called in this thread) with their time since injection.
+    The session summary is added to health_history.json when the game exits.
+    """
+
+    def __init__(
+        self,
+        tracked: TrackedProcess,
+        dll: Optional[str] = None,
+        on_event: Optional[Callable[[HealthSession, HealthEvent], None]] = None,
+        injected_at: Optional[float] = None,
+    ):
+        super().__init__(name=f"health-monitor-{tracked.pid}", daemon=True)
+        self.tracked = tracked
+        self.on_event = on_event
+        self.session = HealthSession(
+            pid=tracked.pid, dll=dll, injected_at=injected_at or time.time()
+        )
+        self.samples: Deque[HealthSample] = collections.deque(maxlen=SAMPLE_BUFFER_SIZE)
+        self._origin = time.monotonic() - (time.time() - self.session.injected_at)
+        self._last_cpu: Optional[tuple] = None
+        self._memory_flagged = False
+        self._stop_event = threading.Event()
+        self._handle = None
+
+    def stop(self):
+        """Stops sampling without recording the session."""
+        self._stop_event.set()
+
+    def _elapsed(self) -> float:
+        return round(time.monotonic() - self._origin, 2)
+
+    def _flag(self, kind: str, detail: str):
+        event = HealthEvent(kind, self._elapsed(), detail)
+        self.session.events.append(event)
+        log = logger.info if kind == EVENT_EXIT else logger.warning
+        log(
+            f"PID {self.tracked.pid} +{event.at:.1f}s after injection: {kind} ({detail})"
+        )
+        if self.on_event is not None:
+            try:
+                self.on_event(self.session, event)
+            except Exception:
+                logger.exception("Health event callback failed.")
+
+    def _sample(self, process: psutil.Process) -> HealthSample:
+        now = time.monotonic()
+        with process.oneshot():
+            # An exited child that was not reaped yet still answers queries.
+            if process.status() == psutil.STATUS_ZOMBIE:
+                raise psutil.ZombieProcess(process.pid)
+            cpu_times = process.cpu_times()
+            rss = process.memory_info().rss
+        cpu_seconds = cpu_times.user + cpu_times.system
+        cpu_percent = 0.0
+        if self._last_cpu is not None:
+            elapsed = max(now - self._last_cpu[0], 1e-6)
+            cpu_percent = (cpu_seconds - self._last_cpu[1]) / elapsed * 100
+        self._last_cpu = (now, cpu_seconds)
+        return HealthSample(self._elapsed(), round(cpu_percent, 1), rss)
+
+    def _check_memory(self, sample: HealthSample):
+        session = self.session
+        if session.baseline_rss_bytes is None:
+            session.baseline_rss_bytes = sample.rss_bytes
+        window_start = sample.at - MEMORY_GROWTH_WINDOW_SECONDS
+        oldest = next((s for s in self.samples if s.at >= window_start), sample)
+        growth = sample.rss_bytes - oldest.rss_bytes
+
+        blowing_up = growth >= MEMORY_GROWTH_BYTES
+        if blowing_up and not self._memory_flagged:
+            self._flag(
+                EVENT_MEMORY,
+                f"{_format_bytes(sample.rss_bytes)}, +{_format_bytes(growth)} in "
+                f"{sample.at - oldest.at:.0f}s",
+            )
+        self._memory_flagged = blowing_up
+
+    def _open_handle(self):
+        """
+        Windows: keeps a handle to the game, since psutil cannot read the exit
+        code of a process that is already gone.
+        """
+        if win32api is None:
+            return
+        try:
+            self._handle = win32api.OpenProcess(
+                SYNCHRONIZE | PROCESS_QUERY_LIMITED_INFORMATION,
+                False,
+                self.tracked.pid,
+            )
+        except win32api.error as e:
+            logger.info(f"No handle to PID {self.tracked.pid}; exit code unknown: {e}")
+
+    def _close_handle(self):
+        if self._handle is not None:
+            self._handle.Close()
+            self._handle = None
+
+    def _exit_code(self, process: Optional[psutil.Process]) -> Optional[int]:
+        if self._handle is not None:
+            try:
+                code = win32process.GetExitCodeProcess(self._handle)
+                return None if code == STILL_ACTIVE else code
+            except win32api.error:
+                return None
+        if process is None:
+            return None
+        try:
+            # Elsewhere this only works for children of YMU.
+            return process.wait(timeout=0)
+        except (psutil.Error, psutil.TimeoutExpired):
+            return None
+
+    def _handle_exit(self, process: Optional[psutil.Process]):
+        exit_code = self._exit_code(process)
+        elapsed = self._elapsed()
+        crashed = exit_code not in (None, 0) or (
+            exit_code is None and elapsed < EARLY_EXIT_SECONDS
+        )
+        self._flag(
+            EVENT_CRASH if crashed else EVENT_EXIT,
+            f"exit code {_format_exit_code(exit_code)}",
+        )
+
+    def run(self):
+        self._open_handle()
+        try:
+            # Checked after opening the handle, which pins the PID to this process.
+            process = psutil.Process(self.tracked.pid)
+            if process.create_time() != self.tracked.create_time:
+                self._close_handle()
+                raise psutil.NoSuchProcess(self.tracked.pid)
+        except psutil.Error:
+            self._handle_exit(None)
+            self._finish()
+            return
+
+        while not self._stop_event.is_set():
+            try:
+                sample = self._sample(process)
+            except psutil.NoSuchProcess:
+                self._handle_exit(process)
+                break
+            except psutil.AccessDenied:
+                # Liveness is all we can watch.
+                if not self.tracked.is_alive():
+                    self._handle_exit(process)
+                    break
+            else:
+                session = self.session
+                session.sample_count += 1
+                session.peak_rss_bytes = max(session.peak_rss_bytes, sample.rss_bytes)
+                session.peak_cpu_percent = max(
+                    session.peak_cpu_percent, sample.cpu_percent
+                )
+                self._check_memory(sample)
+                self.samples.append(sample)
+
+            interval = (
+                FAST_INTERVAL_SECONDS
+                if self._elapsed() < FAST_PHASE_SECONDS
+                else SLOW_INTERVAL_SECONDS
+            )
+            self._stop_event.wait(interval)
+
+        if not self._stop_event.is_set():
+            self._finish()
+        self._close_handle()
+
+    def _finish(self):
+        self._close_handle()
+        self.session.duration_seconds = self._elapsed()
+        _append_to_history(self.session)
+
+
+def load_history() -> List[dict]:
+    """Returns the summaries of recent sessions, oldest first."""
+    if not os.path.exists(HEALTH_HISTORY_PATH):
+        return []
+    try:
+        with open(HEALTH_HISTORY_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+            return data if isinstance(data, list) else []
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Failed to read health history: {e}")
+        return []
+
+
+def _append_to_history(session: HealthSession):
+    with _history_lock:
+        history = load_history()
+        history.append(session.summary())
+        temp_file = HEALTH_HISTORY_PATH + ".tmp"
+        try:
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(history[-HISTORY_SIZE:], f, indent=4)
+            os.replace(temp_file, HEALTH_HISTORY_PATH)
+        except OSError as e:
+            logger.warning(f"Failed to write health history: {e}")
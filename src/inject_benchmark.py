@@ -0,0 +1,138 @@
+# inject_benchmark.py - Measures how much the inject flow costs around the injector call itself.
+import argparse
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import time
+from types import SimpleNamespace
+from typing import Callable, Dict, List
+
+import process_manager
+from paths import YMU_DLL_DIR
+
+BENCHMARK_DLL = "ymu-benchmark.dll"
+
+
+def _inject_logic_runner() -> Callable[[process_manager.TrackedProcess], object]:
+    """Runs InjectPage._inject_logic (needs PySide6, but no QApplication)."""
+    from gui import InjectPage
+
+    # Importing gui attaches its DEBUG handlers to the root logger.
+    logging.getLogger().setLevel(logging.CRITICAL)
+    loc_manager = SimpleNamespace(tr=lambda key, default: default)
+
+    def run(tracked: process_manager.TrackedProcess):
+        page = SimpleNamespace(
+            gta_pid=tracked.pid,
+            dll_to_inject=BENCHMARK_DLL,
+            loc_manager=loc_manager,
+            process_monitor=SimpleNamespace(tracked_process=tracked),
+        )
+        return InjectPage._inject_logic(page)
+
+    return run
+
+
+def _inject_dll_runner() -> Callable[[process_manager.TrackedProcess], object]:
+    """Runs process_manager.inject_dll only."""
+    return lambda tracked: process_manager.inject_dll(tracked.pid, BENCHMARK_DLL)
+
+
+PATHS: Dict[str, Callable[[], Callable[[process_manager.TrackedProcess], object]]] = {
+    "inject-logic": _inject_logic_runner,
+    "inject-dll": _inject_dll_runner,
+}
+
+
+def _summarize(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "mean": statistics.fmean(ordered),
+        "p50": ordered[len(ordered) // 2],
+        "max": ordered[-1],
+    }
+
+
+def run_benchmark(
+    path: str,
+    iterations: int,
+    latency_ms: float,
+    jitter_ms: float,
+    failure_rate: float,
+):
+    """
+    Drives an inject path against an idle dummy process with the fake backend
+    and splits each call into time spent in the injector and overhead.
+    """
+    backend = process_manager.FakeInjectorBackend(
+        latency=latency_ms / 1000,
+        jitter=jitter_ms / 1000,
+        failure_rate=failure_rate,
+        seed=0,
+    )
+    process_manager.set_injector_backend(backend)
+    dll_path = os.path.join(YMU_DLL_DIR, BENCHMARK_DLL)
+    with open(dll_path, "wb"):
+        pass
+    target = subprocess.Popen(
+        [sys.executable, "-c", "import time; time.sleep(3600)"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        tracked = process_manager.TrackedProcess.from_pid(target.pid)
+        if tracked is None:
+            raise RuntimeError("Dummy target process did not start.")
+        run = PATHS[path]()
+        run(tracked)
+        backend.calls.clear()
+
+        totals = []
+        failures = 0
+        for _ in range(iterations):
+            start = time.perf_counter()
+            try:
+                if not run(tracked):
+                    failures += 1
+            except (RuntimeError, PermissionError):
+                failures += 1
+            totals.append((time.perf_counter() - start) * 1000)
+        injector = [seconds * 1000 for _, _, seconds in backend.calls]
+        overhead = [total - inner for total, inner in zip(totals, injector)]
+    finally:
+        process_manager.set_injector_backend(None)
+        target.kill()
+        target.wait()
+        os.remove(dll_path)
+
+    print(f"{path}: {iterations} calls, {failures} failed")
+    print(f"{'':>10} {'mean ms':>9} {'p50 ms':>9} {'max ms':>9}")
+    for name, samples in (
+        ("total", totals),
+        ("injector", injector),
+        ("overhead", overhead),
+    ):
+        stats = _summarize(samples)
+        print(
+            f"{name:>10} {stats['mean']:>9.3f} {stats['p50']:>9.3f} {stats['max']:>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the inject flow with a fake injector backend."
+    )
+    parser.add_argument("--path", choices=list(PATHS), default="inject-logic")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--jitter-ms", type=float, default=1.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    # inject_dll logs every call and every simulated failure; keep the table readable.
+    logging.basicConfig(level=logging.CRITICAL)
+    run_benchmark(
+        args.path, args.iterations, args.latency_ms, args.jitter_ms, args.failure_rate
+    )
@@ -0,0 +1,406 @@
+# injection_helper.py - A small elevated helper process that injects on behalf of the unelevated GUI.
+import argparse
+import json
+import logging
+import os
+import secrets
+import socket
+import subprocess
+import sys
+import threading
+import time
+from multiprocessing.connection import (
+    AuthenticationError,
+    Client,
+    Connection,
+    answer_challenge,
+    deliver_challenge,
+)
+from typing import List, Optional
+
+import psutil
+
+import process_manager
+from paths import YMU_DLL_DIR
+
+logger = logging.getLogger(__name__)
+
+HELPER_FLAG = "--injection-helper"
+PROTOCOL_VERSION = 1
+# Covers the UAC prompt, which the user may take a while to answer.
+CONNECT_TIMEOUT_SECONDS = 60
+# How often the wait for the helper's connection checks whether to stop.
+ACCEPT_SLICE_SECONDS = 0.5
+REQUEST_TIMEOUT_SECONDS = 30
+PARENT_CHECK_SECONDS = 1.0
+MAX_MESSAGE_BYTES = 64 * 1024
+
+OP_PING = "ping"
+OP_INJECT = "inject"
+OP_SHUTDOWN = "shutdown"
+
+ERROR_ACCESS_DENIED = "access_denied"
+ERROR_FAILED = "failed"
+ERROR_INVALID = "invalid"
+
+
+class HelperError(RuntimeError):
+    """The helper could not be started or stopped answering."""
+
+
+def is_elevated() -> bool:
+    if sys.platform == "win32":
+        import ctypes
+
+        try:
+            return bool(ctypes.windll.shell32.IsUserAnAdmin())
+        except OSError:
+            return False
+    return os.geteuid() == 0
+
+
+def _send(conn: Connection, message: dict):
+    # JSON rather than pickle: the elevated side must not unpickle anything.
+    conn.send_bytes(json.dumps(message).encode("utf-8"))
+
+
+def _receive(conn: Connection) -> dict:
+    message = json.loads(conn.recv_bytes(MAX_MESSAGE_BYTES).decode("utf-8"))
+    if not isinstance(message, dict):
+        raise ValueError("Message is not an object.")
+    return message
+
+
+def _error(kind: str, error: str) -> dict:
+    return {"ok": False, "error_kind": kind, "error": error}
+
+
+def _is_game_process(pid: int) -> bool:
+    try:
+        process = psutil.Process(pid)
+        return process_manager._match_process(process, process.name()) is not None
+    except psutil.Error:
+        return False
+
+
+class HelperServer:
+    """
+    The helper's side of the protocol. Only injects DLLs from dll_dir, only
+    into game processes (unless check_target is off, which the stand-in with
+    the fake injector uses), and stops when the GUI disconnects or exits.
+    """
+
+    def __init__(
+        self,
+        dll_dir: str,
+        backend: process_manager.InjectorBackend,
+        check_target: bool = True,
+    ):
+        self.dll_dir = os.path.normcase(os.path.realpath(dll_dir))
+        self.backend = backend
+        self.check_target = check_target
+
+    def handle(self, request: dict) -> dict:
+        op = request.get("op")
+        if op == OP_PING:
+            return {
+                "ok": True,
+                "version": PROTOCOL_VERSION,
+                "pid": os.getpid(),
+                "elevated": is_elevated(),
+                "backend": self.backend.name,
+            }
+        if op == OP_INJECT:
+            return self._inject(request)
+        return _error(ERROR_INVALID, f"Unknown operation: {op}")
+
+    def _inject(self, request: dict) -> dict:
+        try:
+            tracked = process_manager.TrackedProcess(
+                int(request["pid"]), float(request["create_time"])
+            )
+            dll_path = os.path.realpath(str(request["dll_path"]))
+        except (KeyError, TypeError, ValueError) as e:
+            return _error(ERROR_INVALID, f"Malformed inject request: {e!r}")
+
+        if (
+            os.path.normcase(os.path.dirname(dll_path)) != self.dll_dir
+            or not dll_path.lower().endswith(".dll")
+            or not os.path.isfile(dll_path)
+        ):
+            return _error(ERROR_INVALID, "Only DLLs in the YMU DLL folder are allowed.")
+        if not tracked.is_alive():
+            return _error(ERROR_FAILED, "Process exited.")
+        if self.check_target and not _is_game_process(tracked.pid):
+            return _error(ERROR_INVALID, f"PID {tracked.pid} is not the game.")
+
+        start = time.perf_counter()
+        try:
+            self.backend.inject(tracked.pid, dll_path)
+        except PermissionError as e:
+            return _error(ERROR_ACCESS_DENIED, str(e) or "Access Denied")
+        except process_manager.InjectionFailed as e:
+            return _error(ERROR_FAILED, str(e))
+        except Exception as e:
+            logger.exception(f"Unexpected error while injecting: {e}")
+            return _error(ERROR_FAILED, str(e) or type(e).__name__)
+        return {
+            "ok": True,
+            "duration_ms": round((time.perf_counter() - start) * 1000, 1),
+        }
+
+    def serve(self, conn: Connection, parent_pid: Optional[int] = None):
+        """Answers requests until the GUI disconnects, exits or asks to shut down."""
+        while True:
+            if parent_pid and not psutil.pid_exists(parent_pid):
+                logger.info("YMU exited; stopping the injection helper.")
+                return
+            try:
+                if not conn.poll(PARENT_CHECK_SECONDS):
+                    continue
+                request = _receive(conn)
+            except (EOFError, OSError):
+                return
+            except ValueError as e:
+                _send(conn, _error(ERROR_INVALID, f"Unreadable request: {e}"))
+                continue
+            if request.get("op") == OP_SHUTDOWN:
+                _send(conn, {"ok": True, "id": request.get("id")})
+                return
+            response = self.handle(request)
+            response["id"] = request.get("id")
+            _send(conn, response)
+
+
+def main(argv: List[str]) -> int:
+    """Entry point of the helper process (started with HELPER_FLAG)."""
+    parser = argparse.ArgumentParser(prog="ymu-injection-helper")
+    parser.add_argument(HELPER_FLAG, action="store_true")
+    parser.add_argument("--port", type=int, required=True)
+    parser.add_argument("--authkey", required=True)
+    parser.add_argument("--parent-pid", type=int)
+    parser.add_argument("--dll-dir", required=True)
+    parser.add_argument("--fake-injector", action="store_true")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    if args.fake_injector:
+        backend: process_manager.InjectorBackend = process_manager.FakeInjectorBackend()
+    else:
+        backend = process_manager.get_injector_backend()
+    server = HelperServer(args.dll_dir, backend, check_target=not args.fake_injector)
+    try:
+        conn = Client(("127.0.0.1", args.port), authkey=bytes.fromhex(args.authkey))
+    except (OSError, AuthenticationError) as e:
+        logger.error(f"Could not connect to YMU: {e}")
+        return 1
+    with conn:
+        server.serve(conn, args.parent_pid)
+    return 0
+
+
+def _is_compiled() -> bool:
+    return "__compiled__" in globals() or getattr(sys, "frozen", False)
+
+
+def _launch_elevated(args: List[str]):
+    import ctypes
+
+    params = subprocess.list2cmdline(args[1:])
+    result = ctypes.windll.shell32.ShellExecuteW(
+        None, "runas", args[0], params, None, 0
+    )
+    # ShellExecute returns a value <= 32 on failure, e.g. when UAC was declined.
+    if result <= 32:
+        raise HelperError(f"Could not start the injection helper (code {result}).")
+
+
+def _launch_plain(args: List[str]):
+    subprocess.Popen(
+        args,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+class InjectionHelperClient:
+    """
+    The GUI's side: starts the helper (elevated via UAC unless elevate is off)
+    and sends it inject requests. YMU listens and the helper connects back, so
+    the elevated process never accepts connections; both sides prove they
+    know a per-session random key before anything else is exchanged.
+    """
+
+    def __init__(
+        self,
+        elevate: bool = True,
+        fake_injector: bool = False,
+        dll_dir: str = YMU_DLL_DIR,
+        connect_timeout: float = CONNECT_TIMEOUT_SECONDS,
+    ):
+        self.elevate = elevate
+        self.fake_injector = fake_injector
+        self.dll_dir = dll_dir
+        self.connect_timeout = connect_timeout
+        self.info: dict = {}
+        self._conn: Optional[Connection] = None
+        self._lock = threading.Lock()
+        self._next_id = 0
+
+    def is_running(self) -> bool:
+        return self._conn is not None
+
+    def helper_command(self, port: int, authkey: bytes) -> List[str]:
+        if _is_compiled():
+            # The packaged app is a single executable; gui.py dispatches on HELPER_FLAG.
+            base = [os.path.abspath(sys.argv[0])]
+        else:
+            base = [sys.executable, os.path.abspath(__file__)]
+        args = base + [
+            HELPER_FLAG,
+            "--port",
+            str(port),
+            "--authkey",
+            authkey.hex(),
+            "--parent-pid",
+            str(os.getpid()),
+            "--dll-dir",
+            self.dll_dir,
+        ]
+        if self.fake_injector:
+            args.append("--fake-injector")
+        return args
+
+    def _accept(
+        self,
+        server: socket.socket,
+        authkey: bytes,
+        stop_event: Optional[threading.Event] = None,
+    ) -> Connection:
+        deadline = time.monotonic() + self.connect_timeout
+        while True:
+            if stop_event is not None and stop_event.is_set():
+                raise HelperError("Stopped waiting for the injection helper.")
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise HelperError("The injection helper did not connect in time.")
+            server.settimeout(min(remaining, ACCEPT_SLICE_SECONDS))
+            try:
+                sock, _ = server.accept()
+            except socket.timeout:
+                continue
+            sock.setblocking(True)
+            conn = Connection(sock.detach())
+            try:
+                deliver_challenge(conn, authkey)
+                answer_challenge(conn, authkey)
+                return conn
+            except (AuthenticationError, EOFError, OSError) as e:
+                logger.warning(f"Rejected a connection to the helper port: {e}")
+                conn.close()
+
+    def start(self, stop_event: Optional[threading.Event] = None):
+        """
+        Starts the helper and waits until it is connected and has answered a ping.
+        :param stop_event: Gives up waiting for the helper to connect once set.
+        :raises HelperError: If it could not be started (e.g. UAC was declined)
+            or stop_event was set.
+        """
+        if self.is_running():
+            return
+        authkey = secrets.token_bytes(32)
+        with socket.create_server(("127.0.0.1", 0)) as server:
+            args = self.helper_command(server.getsockname()[1], authkey)
+            logger.info(f"Starting injection helper (elevated: {self.elevate}).")
+            (_launch_elevated if self.elevate else _launch_plain)(args)
+            self._conn = self._accept(server, authkey, stop_event)
+        self.info = self.request({"op": OP_PING})
+        if self.info.get("version") != PROTOCOL_VERSION:
+            self.close()
+            raise HelperError("The injection helper speaks a different protocol.")
+        logger.info(f"Injection helper is running: {self.info}")
+
+    def request(self, message: dict, timeout: float = REQUEST_TIMEOUT_SECONDS) -> dict:
+        """Sends one request and returns the response. Thread-safe."""
+        with self._lock:
+            conn = self._conn
+            if conn is None:
+                raise HelperError("The injection helper is not running.")
+            self._next_id += 1
+            message = dict(message, id=self._next_id)
+            try:
+                _send(conn, message)
+                if not conn.poll(timeout):
+                    raise HelperError("The injection helper did not answer in time.")
+                response = _receive(conn)
+            except (EOFError, OSError, ValueError, HelperError) as e:
+                self._drop_connection()
+                raise HelperError(f"Lost the injection helper: {e}") from e
+            if response.get("id") != message["id"]:
+                self._drop_connection()
+                raise HelperError("The injection helper answered out of order.")
+            return response
+
+    def inject(self, pid: int, create_time: float, dll_path: str) -> float:
+        """
+        Injects through the helper and returns the time the helper took in ms.
+        :raises PermissionError: If even the helper was denied access.
+        :raises process_manager.InjectionFailed: For any other failure.
+        """
+        try:
+            response = self.request(
+                {
+                    "op": OP_INJECT,
+                    "pid": pid,
+                    "create_time": create_time,
+                    "dll_path": dll_path,
+                }
+            )
+        except HelperError as e:
+            raise process_manager.InjectionFailed(str(e)) from e
+        if response.get("ok"):
+            return float(response.get("duration_ms", 0.0))
+        if response.get("error_kind") == ERROR_ACCESS_DENIED:
+            raise PermissionError("Access Denied")
+        raise process_manager.InjectionFailed(
+            f"Injection helper: {response.get('error')}"
+        )
+
+    def _drop_connection(self):
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except OSError:
+                pass
+            self._conn = None
+
+    def close(self):
+        """Asks the helper to exit. It also exits on its own when YMU does."""
+        if self._conn is None:
+            return
+        try:
+            self.request({"op": OP_SHUTDOWN}, timeout=2)
+        except HelperError:
+            pass
+        with self._lock:
+            self._drop_connection()
+
+
+class HelperInjectorBackend(process_manager.InjectorBackend):
+    """Routes inject_dll through a running injection helper."""
+
+    name = "helper"
+
+    def __init__(self, client: InjectionHelperClient):
+        self.client = client
+
+    def inject(self, pid: int, dll_path: str):
+        tracked = process_manager.TrackedProcess.from_pid(pid)
+        if tracked is None:
+            raise process_manager.InjectionFailed(f"Process {pid} exited.")
+        self.client.inject(pid, tracked.create_time, dll_path)
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
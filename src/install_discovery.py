@@ -0,0 +1,494 @@
+# install_discovery.py - Finds GTA V installs from Rockstar, Steam and Epic and caches them.
+import abc
+import dataclasses
+import glob
+import json
+import logging
+import os
+import re
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from paths import YMU_INSTALL_CACHE_FILE_PATH
+
+logger = logging.getLogger(__name__)
+
+LAUNCHER_ROCKSTAR = "Rockstar Games"
+LAUNCHER_STEAM = "Steam"
+LAUNCHER_EPIC = "Epic Games"
+
+EDITION_LEGACY = "legacy"
+EDITION_ENHANCED = "enhanced"
+# Game executable -> edition. PlayGTAV.exe sits next to either one.
+GAME_EXECUTABLES = {
+    "GTA5.exe": EDITION_LEGACY,
+    "GTA5_Enhanced.exe": EDITION_ENHANCED,
+}
+LAUNCHER_EXECUTABLE = "PlayGTAV.exe"
+
+ROCKSTAR_SUBKEYS = [
+    r"SOFTWARE\Rockstar Games\Grand Theft Auto V",
+    r"SOFTWARE\WOW6432Node\Rockstar Games\Grand Theft Auto V",
+    r"SOFTWARE\Rockstar Games\GTAV Enhanced",
+    r"SOFTWARE\WOW6432Node\Rockstar Games\GTAV Enhanced",
+]
+STEAM_APP_IDS = {EDITION_LEGACY: "271590", EDITION_ENHANCED: "3240220"}
+EPIC_APP_NAME = "9d2d0eb64d5c44529cece33fe2a46482"
+EPIC_APP_NAMES = frozenset([EPIC_APP_NAME])
+EPIC_DISPLAY_NAME = "grand theft auto v"
+
+CACHE_VERSION = 1
+# A cache whose installs all pass the stat check is still rescanned after this
+# long, so a newly installed copy shows up eventually.
+CACHE_MAX_AGE_SECONDS = 24 * 60 * 60
+# Looking up a launcher with no cached install rescans at most this often.
+MISSING_RESCAN_SECONDS = 60
+
+HKLM = "HKLM"
+HKCU = "HKCU"
+HKCR = "HKCR"
+
+
+@dataclasses.dataclass
+class GameInstall:
+    launcher: str
+    path: str
+    executable: str
+    edition: str
+    source: str
+    # (mtime, size) of the executable when it was found; compared on cache reads.
+    stamp: Optional[Tuple[float, int]] = None
+
+    @property
+    def launcher_executable(self) -> str:
+        return os.path.join(self.path, LAUNCHER_EXECUTABLE)
+
+    def to_dict(self) -> dict:
+        return dataclasses.asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "GameInstall":
+        fields = {f.name for f in dataclasses.fields(cls)}
+        install = cls(**{k: v for k, v in data.items() if k in fields})
+        if install.stamp is not None:
+            install.stamp = (float(install.stamp[0]), int(install.stamp[1]))
+        return install
+
+
+class RegistryReader(abc.ABC):
+    """Reads string values from the Windows registry."""
+
+    @abc.abstractmethod
+    def read_value(self, hive: str, subkey: str, name: str) -> Optional[str]:
+        """Returns the value, or None if the key or value does not exist."""
+
+
+class WindowsRegistryReader(RegistryReader):
+    def __init__(self):
+        try:
+            import winreg
+        except ImportError:
+            winreg = None
+        self._winreg = winreg
+
+    def read_value(self, hive: str, subkey: str, name: str) -> Optional[str]:
+        winreg = self._winreg
+        if winreg is None:
+            return None
+        root = {
+            HKLM: winreg.HKEY_LOCAL_MACHINE,
+            HKCU: winreg.HKEY_CURRENT_USER,
+            HKCR: winreg.HKEY_CLASSES_ROOT,
+        }[hive]
+        try:
+            with winreg.OpenKey(root, subkey, 0, winreg.KEY_READ) as key:
+                value, _ = winreg.QueryValueEx(key, name)
+        except OSError:
+            return None
+        return str(value) if value else None
+
+
+class DictRegistryReader(RegistryReader):
+    """Registry backed by {(hive, subkey, name): value}; subkeys are case-insensitive."""
+
+    def __init__(self, values: Dict[Tuple[str, str, str], str]):
+        self._values = {
+            (hive, subkey.lower(), name.lower()): value
+            for (hive, subkey, name), value in values.items()
+        }
+
+    def read_value(self, hive: str, subkey: str, name: str) -> Optional[str]:
+        return self._values.get((hive, subkey.lower(), name.lower()))
+
+
+class FileSystem:
+    """The file system calls discovery needs; override to point it elsewhere."""
+
+    def isfile(self, path: str) -> bool:
+        return os.path.isfile(path)
+
+    def isdir(self, path: str) -> bool:
+        return os.path.isdir(path)
+
+    def glob(self, pattern: str) -> List[str]:
+        return glob.glob(pattern)
+
+    def read_text(self, path: str) -> str:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            return f.read()
+
+    def stat(self, path: str) -> Optional[Tuple[float, int]]:
+        try:
+            result = os.stat(path)
+        except OSError:
+            return None
+        return (result.st_mtime, result.st_size)
+
+
+def _clean_path(path: Optional[str]) -> Optional[str]:
+    if not path:
+        return None
+    return os.path.normpath(path.strip().strip('"').strip())
+
+
+def _probe_install(
+    fs: FileSystem, launcher: str, path: Optional[str], source: str
+) -> Optional[GameInstall]:
+    """Returns an install if path contains one of the game executables."""
+    path = _clean_path(path)
+    if not path or not fs.isdir(path):
+        return None
+    for executable, edition in GAME_EXECUTABLES.items():
+        executable_path = os.path.join(path, executable)
+        stamp = fs.stat(executable_path)
+        if stamp is not None:
+            return GameInstall(launcher, path, executable_path, edition, source, stamp)
+    return None
+
+
+_VDF_TOKEN = re.compile(r'"((?:\\.|[^"\\])*)"|([{}])')
+
+
+def parse_vdf(text: str) -> dict:
+    """Parses Valve's KeyValues text format (libraryfolders.vdf, *.acf)."""
+    root: dict = {}
+    stack = [root]
+    key = None
+    for match in _VDF_TOKEN.finditer(text):
+        string, brace = match.groups()
+        if brace == "{":
+            child: dict = {}
+            if key is not None:
+                stack[-1][key] = child
+            stack.append(child)
+            key = None
+        elif brace == "}":
+            if len(stack) > 1:
+                stack.pop()
+            key = None
+        elif key is None:
+            key = string.replace("\\\\", "\\")
+        else:
+            stack[-1][key] = string.replace("\\\\", "\\")
+            key = None
+    return root
+
+
+def _lower_keys(data: dict) -> dict:
+    return {str(k).lower(): v for k, v in data.items()}
+
+
+class InstallSource(abc.ABC):
+    launcher: str = ""
+
+    @property
+    def name(self) -> str:
+        return type(self).__name__
+
+    @abc.abstractmethod
+    def find(self, registry: RegistryReader, fs: FileSystem) -> List[GameInstall]:
+        """Returns the installs this source knows about."""
+
+
+class RockstarSource(InstallSource):
+    """The InstallFolder values the Rockstar Games Launcher writes."""
+
+    launcher = LAUNCHER_ROCKSTAR
+
+    def find(self, registry: RegistryReader, fs: FileSystem) -> List[GameInstall]:
+        installs = []
+        for subkey in ROCKSTAR_SUBKEYS:
+            path = registry.read_value(HKLM, subkey, "InstallFolder")
+            install = _probe_install(fs, self.launcher, path, self.name)
+            if install is not None:
+                installs.append(install)
+        return installs
+
+
+class SteamSource(InstallSource):
+    """Steam libraries from libraryfolders.vdf and the game's appmanifest files."""
+
+    launcher = LAUNCHER_STEAM
+
+    def __init__(self, extra_roots: Iterable[str] = ()):
+        self.extra_roots = list(extra_roots)
+
+    def _steam_roots(self, registry: RegistryReader) -> List[str]:
+        roots = [
+            registry.read_value(HKCU, r"Software\Valve\Steam", "SteamPath"),
+            registry.read_value(
+                HKLM, r"SOFTWARE\WOW6432Node\Valve\Steam", "InstallPath"
+            ),
+            registry.read_value(HKLM, r"SOFTWARE\Valve\Steam", "InstallPath"),
+            *self.extra_roots,
+        ]
+        if os.name == "nt":
+            roots.append(r"C:\Program Files (x86)\Steam")
+        else:
+            # Proton installs; the game runs through Wine but Steam is native.
+            home = os.path.expanduser("~")
+            roots += [
+                os.path.join(home, ".steam", "steam"),
+                os.path.join(home, ".local", "share", "Steam"),
+                os.path.join(
+                    home, ".var", "app", "com.valvesoftware.Steam", "data", "Steam"
+                ),
+            ]
+        return [path for path in map(_clean_path, roots) if path]
+
+    def _libraries(self, fs: FileSystem, root: str) -> List[str]:
+        libraries = [root]
+        vdf_path = os.path.join(root, "steamapps", "libraryfolders.vdf")
+        if not fs.isfile(vdf_path):
+            return libraries
+        try:
+            folders = _lower_keys(parse_vdf(fs.read_text(vdf_path))).get(
+                "libraryfolders", {}
+            )
+        except OSError as e:
+            logger.warning(f"Failed to read {vdf_path}: {e}")
+            return libraries
+        for entry in folders.values():
+            # Old format: "1" "D:\\Games"; current format: "1" { "path" "D:\\Games" ... }.
+            path = _lower_keys(entry).get("path") if isinstance(entry, dict) else entry
+            if path:
+                libraries.append(_clean_path(path))
+        return libraries
+
+    def find(self, registry: RegistryReader, fs: FileSystem) -> List[GameInstall]:
+        installs = []
+        seen_libraries = set()
+        for root in self._steam_roots(registry):
+            if not fs.isdir(root):
+                continue
+            for library in self._libraries(fs, root):
+                key = os.path.normcase(os.path.realpath(library))
+                if key in seen_libraries:
+                    continue
+                seen_libraries.add(key)
+                installs += self._find_in_library(fs, library)
+        return installs
+
+    def _find_in_library(self, fs: FileSystem, library: str) -> List[GameInstall]:
+        installs = []
+        steamapps = os.path.join(library, "steamapps")
+        for app_id in STEAM_APP_IDS.values():
+            manifest = os.path.join(steamapps, f"appmanifest_{app_id}.acf")
+            if not fs.isfile(manifest):
+                continue
+            try:
+                state = _lower_keys(parse_vdf(fs.read_text(manifest))).get(
+                    "appstate", {}
+                )
+            except OSError as e:
+                logger.warning(f"Failed to read {manifest}: {e}")
+                continue
+            install_dir = _lower_keys(state).get("installdir")
+            if not install_dir:
+                continue
+            path = os.path.join(steamapps, "common", install_dir)
+            install = _probe_install(fs, self.launcher, path, self.name)
+            if install is not None:
+                installs.append(install)
+        return installs
+
+
+class EpicSource(InstallSource):
+    """The *.item manifests the Epic Games Launcher keeps for installed games."""
+
+    launcher = LAUNCHER_EPIC
+
+    def __init__(self, extra_manifest_dirs: Iterable[str] = ()):
+        self.extra_manifest_dirs = list(extra_manifest_dirs)
+
+    def _manifest_dirs(self, registry: RegistryReader) -> List[str]:
+        dirs = list(self.extra_manifest_dirs)
+        data_path = registry.read_value(
+            HKLM, r"SOFTWARE\WOW6432Node\Epic Games\EpicGamesLauncher", "AppDataPath"
+        )
+        if data_path:
+            dirs.append(os.path.join(_clean_path(data_path), "Manifests"))
+        program_data = os.environ.get("PROGRAMDATA")
+        if program_data:
+            dirs.append(
+                os.path.join(
+                    program_data, "Epic", "EpicGamesLauncher", "Data", "Manifests"
+                )
+            )
+        return dirs
+
+    @staticmethod
+    def _is_gta(manifest: dict) -> bool:
+        if manifest.get("AppName") in EPIC_APP_NAMES:
+            return True
+        if EPIC_DISPLAY_NAME in str(manifest.get("DisplayName", "")).lower():
+            return True
+        executable = os.path.basename(str(manifest.get("LaunchExecutable", "")))
+        return executable.lower() in {
+            name.lower() for name in [*GAME_EXECUTABLES, LAUNCHER_EXECUTABLE]
+        }
+
+    def find(self, registry: RegistryReader, fs: FileSystem) -> List[GameInstall]:
+        installs = []
+        seen = set()
+        for manifest_dir in self._manifest_dirs(registry):
+            key = os.path.normcase(os.path.normpath(manifest_dir))
+            if key in seen or not fs.isdir(manifest_dir):
+                continue
+            seen.add(key)
+            for item in sorted(fs.glob(os.path.join(manifest_dir, "*.item"))):
+                try:
+                    manifest = json.loads(fs.read_text(item))
+                except (OSError, json.JSONDecodeError) as e:
+                    logger.warning(f"Failed to read Epic manifest {item}: {e}")
+                    continue
+                if not isinstance(manifest, dict) or not self._is_gta(manifest):
+                    continue
+                install = _probe_install(
+                    fs, self.launcher, manifest.get("InstallLocation"), self.name
+                )
+                if install is not None:
+                    installs.append(install)
+        return installs
+
+
+def default_sources() -> List[InstallSource]:
+    return [RockstarSource(), SteamSource(), EpicSource()]
+
+
+class InstallDiscovery:
+    """
+    Finds GTA V installs across all sources and keeps them in a JSON cache.
+    Cached installs are trusted while their executable's mtime and size are
+    unchanged; any mismatch, or a cache older than CACHE_MAX_AGE_SECONDS,
+    triggers a full rescan.
+    """
+
+    def __init__(
+        self,
+        registry: Optional[RegistryReader] = None,
+        fs: Optional[FileSystem] = None,
+        sources: Optional[List[InstallSource]] = None,
+        cache_path: Optional[str] = YMU_INSTALL_CACHE_FILE_PATH,
+    ):
+        self.registry = registry or WindowsRegistryReader()
+        self.fs = fs or FileSystem()
+        self.sources = sources if sources is not None else default_sources()
+        self.cache_path = cache_path
+        self._lock = threading.Lock()
+        self._installs: Optional[List[GameInstall]] = None
+        self._scanned_at = 0.0
+
+    def _load_cache(self) -> bool:
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return False
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != CACHE_VERSION:
+                return False
+            self._installs = [GameInstall.from_dict(d) for d in data["installs"]]
+            self._scanned_at = float(data["scanned_at"])
+            return True
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable install cache: {e}")
+            return False
+
+    def _save_cache(self):
+        if not self.cache_path:
+            return
+        data = {
+            "version": CACHE_VERSION,
+            "scanned_at": self._scanned_at,
+            "installs": [install.to_dict() for install in self._installs or []],
+        }
+        temp_file = self.cache_path + ".tmp"
+        try:
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=4)
+            os.replace(temp_file, self.cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to write install cache: {e}")
+
+    def _is_cache_valid(self) -> bool:
+        if self._installs is None:
+            return False
+        if time.time() - self._scanned_at > CACHE_MAX_AGE_SECONDS:
+            return False
+        return all(
+            install.stamp is not None
+            and self.fs.stat(install.executable) == install.stamp
+            for install in self._installs
+        )
+
+    def _scan(self):
+        installs: List[GameInstall] = []
+        seen = set()
+        for source in self.sources:
+            try:
+                found = source.find(self.registry, self.fs)
+            except Exception:
+                logger.exception(f"Install source {source.name} failed.")
+                continue
+            for install in found:
+                key = (install.launcher, os.path.normcase(install.path))
+                if key not in seen:
+                    seen.add(key)
+                    installs.append(install)
+        for install in installs:
+            logger.info(
+                f"Found GTA V ({install.edition}) for {install.launcher} at {install.path}"
+            )
+        if not installs:
+            logger.info("No GTA V installs found.")
+        self._installs = installs
+        self._scanned_at = time.time()
+        self._save_cache()
+
+    def discover(self, force: bool = False) -> List[GameInstall]:
+        """Returns all known installs, rescanning only if the cache is stale."""
+        with self._lock:
+            if self._installs is None and not force:
+                self._load_cache()
+            if force or not self._is_cache_valid():
+                self._scan()
+            return list(self._installs or [])
+
+    def find_install(self, launcher: str) -> Optional[GameInstall]:
+        """Returns the first install for a launcher, rescanning once if none is cached."""
+        installs = [i for i in self.discover() if i.launcher == launcher]
+        if not installs and time.time() - self._scanned_at > MISSING_RESCAN_SECONDS:
+            installs = [i for i in self.discover(force=True) if i.launcher == launcher]
+        return installs[0] if installs else None
+
+
+_discovery = InstallDiscovery()
+
+
+def discover_installs(force: bool = False) -> List[GameInstall]:
+    return _discovery.discover(force)
+
+
+def find_install(launcher: str) -> Optional[GameInstall]:
+    return _discovery.find_install(launcher)
@@ -0,0 +1,170 @@
+# launch_history.py - Timestamps each stage from launching the game to injecting and keeps a history.
+import dataclasses
+import json
+import logging
+import math
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+from paths import YMU_LAUNCH_HISTORY_FILE_PATH
+
+logger = logging.getLogger(__name__)
+
+LOG_FILE_MAX_BYTES = 1024 * 1024
+
+STAGE_LAUNCH_SENT = "launch_sent"
+STAGE_PROCESS_CREATED = "process_created"
+STAGE_PROCESS_SEEN = "process_seen"
+STAGE_READY = "ready"
+STAGE_INJECT_START = "inject_start"
+STAGE_INJECT_DONE = "inject_done"
+STAGES = [
+    STAGE_LAUNCH_SENT,
+    STAGE_PROCESS_CREATED,
+    STAGE_PROCESS_SEEN,
+    STAGE_READY,
+    STAGE_INJECT_START,
+    STAGE_INJECT_DONE,
+]
+
+OUTCOME_INJECTED = "injected"
+OUTCOME_FAILED = "failed"
+OUTCOME_GAME_EXITED = "game_exited"
+OUTCOME_CANCELLED = "cancelled"
+
+_file_lock = threading.Lock()
+
+
+@dataclasses.dataclass
+class LaunchSession:
+    """
+    One attempt to get from a launch (or a detected game) to an injected menu.
+    Stages are stored in milliseconds since the session started.
+    """
+
+    started_at: float = dataclasses.field(default_factory=time.time)
+    launcher: Optional[str] = None
+    # How the launch was sent ("uri" or "direct") and the PID of the spawned launcher.
+    launch_mode: Optional[str] = None
+    launcher_pid: Optional[int] = None
+    dll: Optional[str] = None
+    auto_inject: bool = False
+    pid: Optional[int] = None
+    stages: Dict[str, float] = dataclasses.field(default_factory=dict)
+    outcome: Optional[str] = None
+    error: Optional[str] = None
+    _origin: float = dataclasses.field(
+        default_factory=time.perf_counter, repr=False, compare=False
+    )
+
+    def mark(self, stage: str):
+        """Timestamps a stage now. Only the first mark of a stage counts."""
+        if stage not in self.stages:
+            self.stages[stage] = round((time.perf_counter() - self._origin) * 1000, 1)
+
+    def mark_at(self, stage: str, timestamp: float):
+        """Timestamps a stage at a wall-clock time, e.g. a process create time."""
+        if stage not in self.stages:
+            self.stages[stage] = round((timestamp - self.started_at) * 1000, 1)
+
+    def to_dict(self) -> dict:
+        data = dataclasses.asdict(self)
+        del data["_origin"]
+        return data
+
+
+def _append_to_file(data: dict):
+    """Appends a JSON line, rotating the file once it gets too big."""
+    with _file_lock:
+        try:
+            if (
+                os.path.exists(YMU_LAUNCH_HISTORY_FILE_PATH)
+                and os.path.getsize(YMU_LAUNCH_HISTORY_FILE_PATH) > LOG_FILE_MAX_BYTES
+            ):
+                os.replace(
+                    YMU_LAUNCH_HISTORY_FILE_PATH, YMU_LAUNCH_HISTORY_FILE_PATH + ".1"
+                )
+            with open(YMU_LAUNCH_HISTORY_FILE_PATH, "a", encoding="utf-8") as f:
+                f.write(json.dumps(data) + "\n")
+        except OSError as e:
+            logger.warning(f"Failed to write launch history: {e}")
+
+
+def finish(session: LaunchSession, outcome: str, error: Optional[str] = None):
+    """Sets the outcome of a session and appends it to launch_history.jsonl."""
+    session.outcome = outcome
+    session.error = error
+    timings = ", ".join(f"{stage}={ms:.0f}ms" for stage, ms in session.stages.items())
+    logger.info(f"Launch session finished ({outcome}): {timings}")
+    _append_to_file(session.to_dict())
+
+
+def load_history() -> List[dict]:
+    """Returns all recorded sessions, oldest first."""
+    sessions = []
+    for path in (YMU_LAUNCH_HISTORY_FILE_PATH + ".1", YMU_LAUNCH_HISTORY_FILE_PATH):
+        if not os.path.exists(path):
+            continue
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        sessions.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue
+        except OSError as e:
+            logger.warning(f"Failed to read launch history: {e}")
+    return sessions
+
+
+def _percentile(values: List[float], percentile: float) -> Optional[float]:
+    """Nearest-rank percentile; returns None for an empty list."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(math.ceil(percentile / 100 * len(ordered)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def summarize(
+    sessions: List[dict], launch_mode: Optional[str] = None
+) -> Dict[str, Dict[str, Optional[float]]]:
+    """
+    Aggregates the stage timings of injected sessions, optionally only those
+    launched in one mode. Returns {stage: {"count", "p50", "p95"}} in stage order.
+    """
+    samples: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+    for session in sessions:
+        if session.get("outcome") != OUTCOME_INJECTED:
+            continue
+        if launch_mode is not None and session.get("launch_mode") != launch_mode:
+            continue
+        for stage, ms in (session.get("stages") or {}).items():
+            if stage in samples and isinstance(ms, (int, float)):
+                samples[stage].append(float(ms))
+    return {
+        stage: {
+            "count": len(values),
+            "p50": _percentile(values, 50),
+            "p95": _percentile(values, 95),
+        }
+        for stage, values in samples.items()
+    }
+
+
+if __name__ == "__main__":
+    history = load_history()
+    print(f"{len(history)} session(s) in {YMU_LAUNCH_HISTORY_FILE_PATH}")
+    modes = sorted({s.get("launch_mode") for s in history if s.get("launch_mode")})
+    for mode in [None, *modes]:
+        print(f"\nlaunch mode: {mode or 'all'}")
+        print(f"{'stage':>16} {'count':>6} {'p50 ms':>9} {'p95 ms':>9}")
+        for stage, stats in summarize(history, mode).items():
+            if not stats["count"]:
+                continue
+            print(
+                f"{stage:>16} {stats['count']:>6} "
+                f"{stats['p50']:>9.0f} {stats['p95']:>9.0f}"
+            )
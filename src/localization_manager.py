@@ -1,11 +1,13 @@
 # localization_manager.py - downloads and manages translations
 import os
 import json
+import hashlib
 import logging
-import requests
 import threading
 from typing import Dict, Optional, List
 from PySide6.QtCore import QObject, Signal
+import network_monitor
+import manifest_service
 from paths import YMU_LANG_DIR, YMU_CONFIG_FILE_PATH, USER_AGENT
 
 logger = logging.getLogger(__name__)
@@ -259,20 +261,57 @@ class LocalizationManager(QObject):
         except Exception as e:
             logger.error(f"Failed to load translations.json: {e}")
 
+    def _get_local_file_hash(self) -> Optional[str]:
+        try:
+            with open(LOCAL_FILE_PATH, "rb") as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return None
+
+    def _write_local_file(self, content: bytes):
+        """Stores the downloaded file byte for byte so its hash matches the remote one."""
+        os.makedirs(os.path.dirname(LOCAL_FILE_PATH), exist_ok=True)
+        with open(LOCAL_FILE_PATH, "wb") as f:
+            f.write(content)
+
     def _update_from_remote_thread(self):
         """Internal method, runs in thread."""
-        logger.info(f"Checking for translation updates from: {REMOTE_LANG_URL}")
+        remote_url = REMOTE_LANG_URL
+        expected_hash = None
+        info = manifest_service.get_translations_info()
+        if info:
+            expected_hash = info["sha256"].lower()
+            remote_url = info.get("url") or REMOTE_LANG_URL
+            if expected_hash == self._get_local_file_hash():
+                logger.info(
+                    "Translations match the update manifest. Skipping download."
+                )
+                msg = self.tr(
+                    "Settings.Notify.LangUpToDate",
+                    "Translations are already up-to-date.",
+                )
+                self.update_finished.emit(True, msg, False)
+                return
+
+        logger.info(f"Checking for translation updates from: {remote_url}")
         try:
             headers = {"User-Agent": USER_AGENT}
-            response = requests.get(REMOTE_LANG_URL, headers=headers, timeout=10)
-            if response.status_code == 200:
+            response = network_monitor.get(remote_url, headers=headers, timeout=10)
+            if (
+                response.status_code == 200
+                and expected_hash
+                and hashlib.sha256(response.content).hexdigest() != expected_hash
+            ):
+                logger.warning("Downloaded translations do not match the manifest.")
+                self.update_finished.emit(
+                    False, "Translations failed verification.", False
+                )
+            elif response.status_code == 200:
                 remote_data = response.json()
                 if isinstance(remote_data, dict):
                     if remote_data != self.data:
                         logger.info("New translations detected. Updating local file...")
-                        os.makedirs(os.path.dirname(LOCAL_FILE_PATH), exist_ok=True)
-                        with open(LOCAL_FILE_PATH, "w", encoding="utf-8") as f:
-                            json.dump(remote_data, f, indent=4, ensure_ascii=False)
+                        self._write_local_file(response.content)
                         self.data = remote_data
                         msg = self.tr(
                             "Settings.Notify.LangUpdated",
@@ -280,6 +319,13 @@ class LocalizationManager(QObject):
                         )
                         self.update_finished.emit(True, msg, True)
                     else:
+                        if (
+                            expected_hash
+                            and expected_hash != self._get_local_file_hash()
+                        ):
+                            # Same content, different bytes: store the remote
+                            # bytes so the manifest hash matches next time.
+                            self._write_local_file(response.content)
                         logger.info("Local translations are already up-to-date.")
                         msg = self.tr(
                             "Settings.Notify.LangUpToDate",
@@ -0,0 +1,299 @@
+# manifest_service.py - Fetches the unified update manifest (versions, assets, hashes) in one request.
+import argparse
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Optional
+
+import requests
+
+import config_manager
+import network_monitor
+import release_service
+from paths import YMU_APPDATA_DIR, USER_AGENT
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MANIFEST_URL = (
+    "https://raw.githubusercontent.com/NiiV3AU/YMU/main/update-manifest.json"
+)
+MANIFEST_URL_CONFIG_KEY = "manifest.url"
+MANIFEST_ENABLED_CONFIG_KEY = "manifest.enabled"
+MANIFEST_CACHE_PATH = os.path.join(YMU_APPDATA_DIR, "manifest.json")
+SCHEMA_VERSION = 1
+
+KEY_YMU = "ymu"
+KEY_UPDATER = "updater"
+
+CACHE_DURATION_SECONDS = 300
+FAILURE_RETRY_SECONDS = 300
+
+_lock = threading.Lock()
+_payload: Optional[dict] = None
+_fetched_at = 0.0
+_failed_at = 0.0
+
+
+class ManifestError(Exception):
+    """Raised when a manifest is malformed or fails its hash check."""
+
+    pass
+
+
+def get_manifest_url() -> str:
+    """Returns the manifest URL. A mirror can be set via 'manifest.url' in config.json."""
+    return config_manager.get_config(MANIFEST_URL_CONFIG_KEY) or DEFAULT_MANIFEST_URL
+
+
+def is_enabled() -> bool:
+    """
+    Off by default: the repository does not publish update-manifest.json yet.
+    Setting 'manifest.url' to a mirror that does turns it on.
+    """
+    default = bool(config_manager.get_config(MANIFEST_URL_CONFIG_KEY))
+    return bool(config_manager.get_config(MANIFEST_ENABLED_CONFIG_KEY, default=default))
+
+
+def compute_payload_hash(payload: dict) -> str:
+    """SHA-256 of the canonical JSON form (sorted keys, no whitespace) of the payload."""
+    canonical = json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def build_manifest(payload: dict) -> dict:
+    """Wraps a payload into a manifest document with its hash."""
+    return {
+        "schema": SCHEMA_VERSION,
+        "sha256": compute_payload_hash(payload),
+        "payload": payload,
+    }
+
+
+def verify_manifest(document) -> dict:
+    """
+    Checks the schema and the payload hash of a manifest document.
+    The hash catches truncated or corrupted mirrors; every asset listed in the
+    payload is still verified against its own SHA-256 when it is downloaded.
+    :return: The verified payload.
+    :raises ManifestError: If the document is malformed or the hash does not match.
+    """
+    if not isinstance(document, dict):
+        raise ManifestError("Manifest is not a JSON object.")
+    if document.get("schema") != SCHEMA_VERSION:
+        raise ManifestError(f"Unsupported manifest schema: {document.get('schema')}")
+    payload = document.get("payload")
+    expected = document.get("sha256")
+    if not isinstance(payload, dict) or not isinstance(expected, str):
+        raise ManifestError("Manifest is missing its payload or hash.")
+    if compute_payload_hash(payload) != expected.lower():
+        raise ManifestError("Manifest hash does not match its payload.")
+    return payload
+
+
+def _load_cached_document() -> dict:
+    """Reads the last verified manifest and its ETag from disk."""
+    if not os.path.exists(MANIFEST_CACHE_PATH):
+        return {}
+    try:
+        with open(MANIFEST_CACHE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+            return data if isinstance(data, dict) else {}
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Failed to read cached manifest: {e}")
+        return {}
+
+
+def _save_cached_document(url: str, etag: Optional[str], document: dict):
+    temp_file = MANIFEST_CACHE_PATH + ".tmp"
+    try:
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump({"url": url, "etag": etag, "manifest": document}, f, indent=4)
+        os.replace(temp_file, MANIFEST_CACHE_PATH)
+    except OSError as e:
+        logger.warning(f"Failed to write cached manifest: {e}")
+
+
+def _fetch_from_remote() -> Optional[dict]:
+    """
+    Performs a single conditional GET. On 304 the manifest stored on disk is reused.
+    Returns the verified payload or None.
+    """
+    url = get_manifest_url()
+    cached = _load_cached_document()
+    cached_payload = None
+    if cached.get("url") == url and cached.get("manifest"):
+        try:
+            cached_payload = verify_manifest(cached["manifest"])
+        except ManifestError as e:
+            logger.warning(f"Discarding cached manifest: {e}")
+
+    headers = {"User-Agent": USER_AGENT}
+    if cached_payload is not None and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+
+    try:
+        response = network_monitor.get(url, headers=headers, timeout=10)
+        if response.status_code == 304 and cached_payload is not None:
+            logger.info("Update manifest is unchanged (304).")
+            return cached_payload
+        response.raise_for_status()
+        document = response.json()
+        payload = verify_manifest(document)
+    except requests.exceptions.RequestException as e:
+        logger.warning(f"Could not fetch update manifest: {e}")
+        return None
+    except (ValueError, ManifestError) as e:
+        logger.error(f"Rejected update manifest from {url}: {e}")
+        return None
+
+    _save_cached_document(url, response.headers.get("ETag"), document)
+    logger.info("Fetched a new update manifest.")
+    return payload
+
+
+def fetch_manifest(force: bool = False) -> Optional[dict]:
+    """
+    Returns the verified manifest payload, or None if it is disabled or unavailable.
+    Concurrent callers share one request; the result is kept in memory for a
+    few minutes and failures are not retried immediately, so callers can fall
+    back to their own sources without waiting on the manifest each time.
+    """
+    global _payload, _fetched_at, _failed_at
+
+    if not is_enabled():
+        return None
+
+    with _lock:
+        now = time.time()
+        if not force:
+            if _payload is not None and now - _fetched_at < CACHE_DURATION_SECONDS:
+                network_monitor.record_cache_hit(get_manifest_url())
+                return _payload
+            if now - _failed_at < FAILURE_RETRY_SECONDS:
+                return None
+
+        payload = _fetch_from_remote()
+        if payload is None:
+            _failed_at = now
+            return None
+        _payload = payload
+        _fetched_at = now
+        return _payload
+
+
+def _release_from_entry(entry) -> Optional[release_service.ReleaseData]:
+    if not isinstance(entry, dict):
+        return None
+    if not all(entry.get(key) for key in ("version", "url", "asset_name")):
+        return None
+    return release_service.ReleaseData(
+        version_tag=entry["version"],
+        download_url=entry["url"],
+        asset_name=entry["asset_name"],
+        checksum=entry.get("sha256"),
+        release_notes=entry.get("notes", "No release notes available."),
+    )
+
+
+def get_release(key: str) -> Optional[release_service.ReleaseData]:
+    """
+    Returns the release listed in the manifest.
+    :param key: KEY_YMU, KEY_UPDATER or a channel repository ("User/Repo").
+    """
+    payload = fetch_manifest()
+    if payload is None:
+        return None
+    if key in (KEY_YMU, KEY_UPDATER):
+        entry = payload.get(key)
+    else:
+        entry = (payload.get("channels") or {}).get(key)
+    return _release_from_entry(entry)
+
+
+def get_translations_info() -> Optional[dict]:
+    """Returns {"url": ..., "sha256": ...} for translations.json, if listed."""
+    payload = fetch_manifest()
+    if payload is None:
+        return None
+    info = payload.get("translations")
+    if isinstance(info, dict) and isinstance(info.get("sha256"), str):
+        return info
+    return None
+
+
+class ManifestReleaseProvider(release_service.ReleaseProvider):
+    """
+    ReleaseProvider that reads from the update manifest and falls back to
+    another provider (usually the GitHub API) if the entry is not available.
+    """
+
+    def __init__(
+        self, key: str, fallback: Optional[release_service.ReleaseProvider] = None
+    ):
+        self.key = key
+        self.fallback = fallback
+        self.api_url = getattr(fallback, "api_url", None) or get_manifest_url()
+        # True if the last release came from the manifest rather than the fallback.
+        self.from_manifest = False
+
+    def get_latest_release(self) -> Optional[release_service.ReleaseData]:
+        release = get_release(self.key)
+        self.from_manifest = release is not None
+        if release is not None:
+            logger.info(f"Release info for {self.key} taken from the update manifest.")
+            return release
+        if self.fallback is None:
+            return None
+        return self.fallback.get_latest_release()
+
+
+def github_provider(
+    key: str, repository: str, asset_extension: str = ".dll"
+) -> ManifestReleaseProvider:
+    """Convenience: manifest first, GitHub API for the given repository as fallback."""
+    return ManifestReleaseProvider(
+        key,
+        fallback=release_service.GitHubAPIProvider(
+            repository=repository, asset_extension=asset_extension
+        ),
+    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)-8s] [%(name)-18s] %(message)s",
+    )
+
+    parser = argparse.ArgumentParser(
+        description="Build or check a YMU update manifest."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build_parser = subparsers.add_parser(
+        "build", help="Wrap a payload JSON file into a manifest with its hash."
+    )
+    build_parser.add_argument("payload")
+    build_parser.add_argument("-o", "--output", default="update-manifest.json")
+    verify_parser = subparsers.add_parser("verify", help="Verify a manifest file.")
+    verify_parser.add_argument("manifest")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        with open(args.payload, "r", encoding="utf-8") as f:
+            manifest = build_manifest(json.load(f))
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=4, ensure_ascii=False)
+        print(f"Wrote {args.output} (sha256 {manifest['sha256']})")
+    else:
+        with open(args.manifest, "r", encoding="utf-8") as f:
+            try:
+                verify_manifest(json.load(f))
+                print("Manifest OK")
+            except ManifestError as e:
+                print(f"Manifest INVALID: {e}")
+                raise SystemExit(1)
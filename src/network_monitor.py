@@ -0,0 +1,341 @@
+# network_monitor.py - Times every outgoing HTTP request and keeps a rolling history.
+import collections
+import contextlib
+import dataclasses
+import json
+import logging
+import math
+import os
+import socket
+import threading
+import time
+from typing import Deque, Dict, Iterator, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+
+import config_manager
+from paths import YMU_NETWORK_LOG_FILE_PATH
+
+logger = logging.getLogger(__name__)
+
+HISTORY_SIZE = 200
+LOG_FILE_MAX_BYTES = 1024 * 1024
+LOG_TO_FILE_CONFIG_KEY = "network.log_to_file"
+
+CACHE_HIT = "hit"
+CACHE_REVALIDATED = "revalidated"
+CACHE_MISS = "miss"
+
+
+@dataclasses.dataclass
+class RequestTiming:
+    """Phase timings (in milliseconds) and outcome of a single HTTP request."""
+
+    method: str
+    url: str
+    host: str
+    timestamp: float
+    dns_ms: Optional[float] = None
+    connect_ms: Optional[float] = None
+    tls_ms: Optional[float] = None
+    ttfb_ms: Optional[float] = None
+    transfer_ms: Optional[float] = None
+    total_ms: float = 0.0
+    bytes: int = 0
+    status: Optional[int] = None
+    cache: str = CACHE_MISS
+    error: Optional[str] = None
+
+
+_history: Deque[RequestTiming] = collections.deque(maxlen=HISTORY_SIZE)
+_history_lock = threading.Lock()
+_file_lock = threading.Lock()
+_current = threading.local()
+# Cached so recording a request does not read config.json from disk.
+_log_to_file: Optional[bool] = None
+
+
+def _elapsed_ms(start: float, end: Optional[float] = None) -> float:
+    return round(((end or time.perf_counter()) - start) * 1000, 2)
+
+
+def _active_timing() -> Optional[RequestTiming]:
+    return getattr(_current, "timing", None)
+
+
+class _TimedConnectionMixin:
+    """
+    Splits connection setup into DNS, TCP connect and TLS phases.
+    Only active while a request is running through the timed adapter on this thread.
+    """
+
+    def _new_conn(self):
+        timing = _active_timing()
+        if timing is None:
+            return super()._new_conn()  # type: ignore
+
+        dns_host = self._dns_host  # type: ignore
+        start = time.perf_counter()
+        try:
+            addresses = socket.getaddrinfo(dns_host, self.port, 0, socket.SOCK_STREAM)  # type: ignore
+        except OSError:
+            # Let urllib3 resolve again so it raises its usual NameResolutionError.
+            return super()._new_conn()  # type: ignore
+        timing.dns_ms = _elapsed_ms(start)
+
+        # Try every resolved address in order, just like socket.create_connection.
+        connect_start = time.perf_counter()
+        last_error: Optional[Exception] = None
+        try:
+            for *_, sockaddr in addresses:
+                self._dns_host = sockaddr[0]
+                try:
+                    sock = super()._new_conn()  # type: ignore
+                    timing.connect_ms = _elapsed_ms(connect_start)
+                    return sock
+                except (NewConnectionError, ConnectTimeoutError) as e:
+                    last_error = e
+        finally:
+            self._dns_host = dns_host
+        assert last_error is not None
+        raise last_error
+
+    def connect(self):
+        timing = _active_timing()
+        start = time.perf_counter()
+        super().connect()  # type: ignore
+        if timing is not None and isinstance(self, HTTPSConnection):
+            setup_ms = (timing.dns_ms or 0.0) + (timing.connect_ms or 0.0)
+            timing.tls_ms = round(max(_elapsed_ms(start) - setup_ms, 0.0), 2)
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedAdapter(HTTPAdapter):
+    """An HTTPAdapter that records one RequestTiming per hop (redirects included)."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+    def send(self, request, *args, **kwargs):
+        hops: Optional[List] = getattr(_current, "hops", None)
+        timing = RequestTiming(
+            method=request.method or "GET",
+            url=request.url or "",
+            host=urlsplit(request.url or "").hostname or "",
+            timestamp=time.time(),
+        )
+        start = time.perf_counter()
+        _current.timing = timing
+        try:
+            response = super().send(request, *args, **kwargs)
+        except Exception as e:
+            timing.error = str(e)
+            timing.total_ms = _elapsed_ms(start)
+            record(timing)
+            raise
+        finally:
+            _current.timing = None
+
+        headers_at = time.perf_counter()
+        setup_ms = (
+            (timing.dns_ms or 0.0) + (timing.connect_ms or 0.0) + (timing.tls_ms or 0.0)
+        )
+        timing.ttfb_ms = round(max(_elapsed_ms(start, headers_at) - setup_ms, 0.0), 2)
+        timing.status = response.status_code
+        if response.status_code == 304:
+            timing.cache = CACHE_REVALIDATED
+
+        if hops is not None:
+            hops.append((timing, response, start, headers_at))
+        else:
+            timing.total_ms = _elapsed_ms(start, headers_at)
+            record(timing)
+        return response
+
+
+_session = requests.Session()
+_session.mount("http://", _TimedAdapter())
+_session.mount("https://", _TimedAdapter())
+
+
+def _finish_hops(hops: List) -> None:
+    """Completes the timings of all hops once the final body has been consumed."""
+    end = time.perf_counter()
+    for index, (timing, response, start, headers_at) in enumerate(hops):
+        body_done = hops[index + 1][2] if index + 1 < len(hops) else end
+        timing.transfer_ms = _elapsed_ms(headers_at, body_done)
+        timing.total_ms = _elapsed_ms(start, body_done)
+        try:
+            timing.bytes = int(response.raw.tell())
+        except (AttributeError, TypeError, ValueError):
+            timing.bytes = len(response._content or b"")
+        record(timing)
+
+
+@contextlib.contextmanager
+def _track_hops() -> Iterator[List]:
+    hops: List = []
+    _current.hops = hops
+    try:
+        yield hops
+    finally:
+        _current.hops = None
+
+
+def request(method: str, url: str, **kwargs) -> requests.Response:
+    """
+    Drop-in replacement for requests.request() that records phase timings.
+    Raises the same requests exceptions as the original.
+    """
+    with _track_hops() as hops:
+        try:
+            return _session.request(method, url, **kwargs)
+        finally:
+            _finish_hops(hops)
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """Drop-in replacement for requests.get() that records phase timings."""
+    return request("GET", url, **kwargs)
+
+
+@contextlib.contextmanager
+def stream(method: str, url: str, **kwargs) -> Iterator[requests.Response]:
+    """
+    Context manager for streamed downloads. The transfer phase and byte count
+    are recorded when the block exits, i.e. after the body has been consumed.
+    """
+    with _track_hops() as hops:
+        response = None
+        try:
+            response = _session.request(method, url, stream=True, **kwargs)
+            _current.hops = None
+            yield response
+        finally:
+            if response is not None:
+                response.close()
+            _finish_hops(hops)
+
+
+def record_cache_hit(url: str) -> None:
+    """Records a request that was answered from a local cache without any network I/O."""
+    record(
+        RequestTiming(
+            method="GET",
+            url=url,
+            host=urlsplit(url).hostname or "",
+            timestamp=time.time(),
+            cache=CACHE_HIT,
+        )
+    )
+
+
+def _append_to_log_file(timing: RequestTiming) -> None:
+    """Appends the timing as a JSON line next to ymu.log, rotating once it gets too big."""
+    with _file_lock:
+        try:
+            if (
+                os.path.exists(YMU_NETWORK_LOG_FILE_PATH)
+                and os.path.getsize(YMU_NETWORK_LOG_FILE_PATH) > LOG_FILE_MAX_BYTES
+            ):
+                os.replace(YMU_NETWORK_LOG_FILE_PATH, YMU_NETWORK_LOG_FILE_PATH + ".1")
+            with open(YMU_NETWORK_LOG_FILE_PATH, "a", encoding="utf-8") as f:
+                f.write(json.dumps(dataclasses.asdict(timing)) + "\n")
+        except OSError as e:
+            logger.warning(f"Failed to write network log: {e}")
+
+
+def is_log_to_file_enabled() -> bool:
+    """Reads the setting from config.json once; set_log_to_file keeps it current."""
+    global _log_to_file
+    if _log_to_file is None:
+        _log_to_file = bool(
+            config_manager.get_config(LOG_TO_FILE_CONFIG_KEY, default=False)
+        )
+    return _log_to_file
+
+
+def set_log_to_file(enabled: bool) -> None:
+    global _log_to_file
+    config_manager.set_config(LOG_TO_FILE_CONFIG_KEY, enabled)
+    _log_to_file = enabled
+
+
+def record(timing: RequestTiming) -> None:
+    """Stores a finished timing in the ring buffer and optionally in the JSON-lines file."""
+    with _history_lock:
+        _history.append(timing)
+    logger.debug(
+        f"{timing.method} {timing.host} status={timing.status} cache={timing.cache} "
+        f"total={timing.total_ms}ms ttfb={timing.ttfb_ms}ms bytes={timing.bytes}"
+    )
+    if is_log_to_file_enabled():
+        _append_to_log_file(timing)
+
+
+def get_history() -> List[RequestTiming]:
+    """Returns a snapshot of the recorded timings, oldest first."""
+    with _history_lock:
+        return list(_history)
+
+
+def _percentile(values: List[float], percentile: float) -> Optional[float]:
+    """Nearest-rank percentile; returns None for an empty list."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(math.ceil(percentile / 100 * len(ordered)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def summarize() -> Dict[str, Dict[str, Optional[float]]]:
+    """
+    Aggregates the history per host.
+    Returns {host: {"count", "errors", "cache_hits", "<phase>_p50", "<phase>_p95", ...}}.
+    """
+    by_host: Dict[str, List[RequestTiming]] = collections.defaultdict(list)
+    for timing in get_history():
+        by_host[timing.host].append(timing)
+
+    summary = {}
+    for host, timings in sorted(by_host.items()):
+        network = [t for t in timings if t.cache != CACHE_HIT and t.error is None]
+        stats: Dict[str, Optional[float]] = {
+            "count": len(timings),
+            "errors": sum(1 for t in timings if t.error is not None),
+            "cache_hits": sum(1 for t in timings if t.cache != CACHE_MISS),
+        }
+        for phase in ("total", "dns", "connect", "tls", "ttfb", "transfer"):
+            values = [
+                getattr(t, f"{phase}_ms")
+                for t in network
+                if getattr(t, f"{phase}_ms") is not None
+            ]
+            stats[f"{phase}_p50"] = _percentile(values, 50)
+            stats[f"{phase}_p95"] = _percentile(values, 95)
+        summary[host] = stats
+    return summary
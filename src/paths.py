@@ -27,6 +27,9 @@ YMU_APPDATA_DIR = _create_path(os.path.join(APPDATA_PATH, "YMU"))
 YMU_DLL_DIR = _create_path(os.path.join(YMU_APPDATA_DIR, "dll"))
 YMU_LOG_FILE_PATH = os.path.join(YMU_APPDATA_DIR, "ymu.log")
 YMU_CONFIG_FILE_PATH = os.path.join(YMU_APPDATA_DIR, "config.json")
+YMU_NETWORK_LOG_FILE_PATH = os.path.join(YMU_APPDATA_DIR, "network.jsonl")
+YMU_LAUNCH_HISTORY_FILE_PATH = os.path.join(YMU_APPDATA_DIR, "launch_history.jsonl")
+YMU_INSTALL_CACHE_FILE_PATH = os.path.join(YMU_APPDATA_DIR, "install_cache.json")
 
 YIMMENU_APPDATA_DIR = _create_path(os.path.join(APPDATA_PATH, "YimMenu"))
 YIMMENU_SCRIPTS_DIR = os.path.join(YIMMENU_APPDATA_DIR, "scripts")
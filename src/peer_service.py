@@ -0,0 +1,418 @@
+# peer_service.py - Shares verified DLLs between YMU instances on the same network.
+import hashlib
+import json
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+
+import requests
+
+import config_manager
+import network_monitor
+from paths import YMU_DLL_DIR, USER_AGENT
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HTTP_PORT = 47800
+DISCOVERY_PORT = 47801
+DISCOVERY_TIMEOUT_SECONDS = 0.5
+PEER_TIMEOUT_SECONDS = 3
+SERVICE_NAME = "ymu-peer"
+
+ENABLED_CONFIG_KEY = "peer_sharing.enabled"
+PORT_CONFIG_KEY = "peer_sharing.port"
+PEERS_CONFIG_KEY = "peer_sharing.peers"
+DISCOVERY_CONFIG_KEY = "peer_sharing.discovery"
+
+_hash_cache: Dict[str, Tuple[int, int, str]] = {}
+_hash_cache_lock = threading.Lock()
+
+
+def is_enabled() -> bool:
+    return bool(config_manager.get_config(ENABLED_CONFIG_KEY, default=False))
+
+
+def _file_sha256(path: str) -> Optional[str]:
+    """Returns the SHA-256 of a file, reusing the cached value while size and mtime match."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    with _hash_cache_lock:
+        cached = _hash_cache.get(path)
+    if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+        return cached[2]
+
+    sha256_hash = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for byte_block in iter(lambda: f.read(65536), b""):
+                sha256_hash.update(byte_block)
+    except OSError as e:
+        logger.warning(f"Could not hash '{path}' for sharing: {e}")
+        return None
+
+    checksum = sha256_hash.hexdigest()
+    with _hash_cache_lock:
+        _hash_cache[path] = (stat.st_size, stat.st_mtime_ns, checksum)
+    return checksum
+
+
+def build_object_index(directory: str = YMU_DLL_DIR) -> Dict[str, str]:
+    """Maps the SHA-256 of every DLL in the directory to its path."""
+    index = {}
+    if not os.path.isdir(directory):
+        return index
+    for entry in os.scandir(directory):
+        if entry.is_file() and entry.name.lower().endswith(".dll"):
+            checksum = _file_sha256(entry.path)
+            if checksum:
+                index[checksum] = entry.path
+    return index
+
+
+class _ObjectRequestHandler(BaseHTTPRequestHandler):
+    """Serves GET/HEAD /objects/<sha256> from the node's object directory."""
+
+    server: "_PeerHTTPServer"
+
+    def _resolve(self) -> Optional[str]:
+        parts = self.path.strip("/").split("/")
+        if len(parts) != 2 or parts[0] != "objects":
+            return None
+        checksum = parts[1].lower()
+        if len(checksum) != 64 or any(c not in "0123456789abcdef" for c in checksum):
+            return None
+        return build_object_index(self.server.object_dir).get(checksum)
+
+    def _send_headers(self, path: str):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(os.path.getsize(path)))
+        self.end_headers()
+
+    def do_HEAD(self):
+        path = self._resolve()
+        if path is None:
+            self.send_error(404)
+            return
+        self._send_headers(path)
+
+    def do_GET(self):
+        path = self._resolve()
+        if path is None:
+            self.send_error(404)
+            return
+        try:
+            with open(path, "rb") as f:
+                self._send_headers(path)
+                for byte_block in iter(lambda: f.read(65536), b""):
+                    self.wfile.write(byte_block)
+            logger.info(
+                f"Served '{os.path.basename(path)}' to peer {self.client_address[0]}"
+            )
+        except (OSError, ConnectionError) as e:
+            logger.warning(f"Failed to serve object to peer: {e}")
+
+    def log_message(self, format, *args):
+        logger.debug(f"Peer request from {self.client_address[0]}: {format % args}")
+
+
+class _PeerHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    object_dir: str = YMU_DLL_DIR
+
+
+class PeerNode:
+    """
+    A local sharing node: an HTTP endpoint serving verified objects plus a
+    UDP responder that answers discovery broadcasts from other YMU instances.
+    """
+
+    def __init__(
+        self,
+        port: int = DEFAULT_HTTP_PORT,
+        object_dir: str = YMU_DLL_DIR,
+        discovery: bool = True,
+    ):
+        self.port = port
+        self.object_dir = object_dir
+        self.discovery = discovery
+        self.node_id = uuid.uuid4().hex
+        self._http_server: Optional[_PeerHTTPServer] = None
+        self._discovery_socket: Optional[socket.socket] = None
+        self._threads: List[threading.Thread] = []
+
+    def start(self):
+        """Starts the HTTP endpoint and, if enabled, the discovery responder."""
+        self._http_server = _PeerHTTPServer(
+            ("0.0.0.0", self.port), _ObjectRequestHandler
+        )
+        self._http_server.object_dir = self.object_dir
+        self.port = self._http_server.server_address[1]
+        http_thread = threading.Thread(
+            target=self._http_server.serve_forever, daemon=True
+        )
+        http_thread.start()
+        self._threads.append(http_thread)
+        logger.info(f"Peer sharing endpoint listening on port {self.port}")
+
+        if self.discovery:
+            try:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                sock.bind(("", DISCOVERY_PORT))
+                self._discovery_socket = sock
+                discovery_thread = threading.Thread(
+                    target=self._answer_discovery, daemon=True
+                )
+                discovery_thread.start()
+                self._threads.append(discovery_thread)
+            except OSError as e:
+                logger.warning(f"Peer discovery responder unavailable: {e}")
+
+    def stop(self):
+        """Shuts the node down."""
+        if self._http_server:
+            self._http_server.shutdown()
+            self._http_server.server_close()
+            self._http_server = None
+        if self._discovery_socket:
+            self._discovery_socket.close()
+            self._discovery_socket = None
+        logger.info("Peer sharing stopped.")
+
+    def _answer_discovery(self):
+        sock = self._discovery_socket
+        while sock is not None and sock.fileno() != -1:
+            try:
+                data, address = sock.recvfrom(1024)
+                message = json.loads(data.decode("utf-8"))
+            except (OSError, ValueError):
+                if self._discovery_socket is None:
+                    return
+                continue
+            if (
+                not isinstance(message, dict)
+                or message.get("service") != SERVICE_NAME
+                or message.get("type") != "discover"
+            ):
+                continue
+            if message.get("id") == self.node_id:
+                continue
+            reply = {
+                "service": SERVICE_NAME,
+                "type": "announce",
+                "id": self.node_id,
+                "port": self.port,
+            }
+            try:
+                sock.sendto(json.dumps(reply).encode("utf-8"), address)
+            except OSError as e:
+                logger.debug(f"Failed to answer discovery from {address}: {e}")
+
+
+def _parse_announce(data: bytes, host: str) -> Optional[str]:
+    """Returns 'host:port' if the datagram is a valid announce reply, otherwise None."""
+    try:
+        reply = json.loads(data.decode("utf-8"))
+        if (
+            not isinstance(reply, dict)
+            or reply.get("service") != SERVICE_NAME
+            or reply.get("type") != "announce"
+        ):
+            return None
+        port = int(reply["port"])
+    except (KeyError, TypeError, ValueError):
+        logger.debug(f"Ignoring malformed discovery reply from {host}")
+        return None
+    if not 0 < port < 65536:
+        return None
+    return f"{host}:{port}"
+
+
+def discover_peers(
+    timeout: float = DISCOVERY_TIMEOUT_SECONDS, exclude_id: Optional[str] = None
+) -> List[str]:
+    """Broadcasts a discovery request and returns the 'host:port' of every peer that answers."""
+    peers = []
+    request_id = exclude_id or uuid.uuid4().hex
+    message = json.dumps(
+        {"service": SERVICE_NAME, "type": "discover", "id": request_id}
+    )
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            sock.settimeout(timeout)
+            sock.sendto(message.encode("utf-8"), ("255.255.255.255", DISCOVERY_PORT))
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline:
+                sock.settimeout(max(deadline - time.monotonic(), 0.01))
+                try:
+                    data, address = sock.recvfrom(1024)
+                except socket.timeout:
+                    break
+                peer = _parse_announce(data, address[0])
+                if peer is not None and peer not in peers:
+                    peers.append(peer)
+    except OSError as e:
+        logger.debug(f"Peer discovery broadcast failed: {e}")
+    return peers
+
+
+def get_candidate_peers() -> List[str]:
+    """Configured peers first, then peers found via broadcast."""
+    peers = list(config_manager.get_config(PEERS_CONFIG_KEY, default=[]) or [])
+    if config_manager.get_config(DISCOVERY_CONFIG_KEY, default=True):
+        exclude_id = _node.node_id if _node else None
+        for peer in discover_peers(exclude_id=exclude_id):
+            if peer not in peers:
+                peers.append(peer)
+    return peers
+
+
+def _fetch_from_peer(
+    peer: str,
+    checksum: str,
+    destination: str,
+    temp_path: str,
+    headers: Dict[str, str],
+    progress_signal: Optional[Callable[[int], None]],
+) -> bool:
+    """Streams one peer's copy into temp_path and moves it into place if it verifies."""
+    url = f"http://{peer}/objects/{checksum}"
+    sha256_hash = hashlib.sha256()
+    try:
+        with network_monitor.stream(
+            "GET", url, timeout=PEER_TIMEOUT_SECONDS, headers=headers
+        ) as response:
+            if response.status_code != 200:
+                return False
+            total_size = int(response.headers.get("content-length", 0))
+            downloaded_size = 0
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+            with open(temp_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=65536):
+                    f.write(chunk)
+                    sha256_hash.update(chunk)
+                    downloaded_size += len(chunk)
+                    if total_size > 0 and progress_signal:
+                        percentage = int((downloaded_size / total_size) * 100)
+                        if hasattr(progress_signal, "emit"):
+                            progress_signal.emit(percentage)  # type: ignore
+                        else:
+                            progress_signal(percentage)
+    except (requests.exceptions.RequestException, OSError, ValueError) as e:
+        logger.debug(f"Peer {peer} unavailable: {e}")
+        return False
+
+    if sha256_hash.hexdigest() != checksum:
+        logger.warning(
+            f"Peer {peer} delivered an object with a wrong checksum. Ignoring it."
+        )
+        return False
+    os.replace(temp_path, destination)
+    logger.info(f"Fetched '{os.path.basename(destination)}' from peer {peer}.")
+    return True
+
+
+def fetch_object(
+    checksum: str,
+    destination: str,
+    peers: Optional[List[str]] = None,
+    progress_signal: Optional[Callable[[int], None]] = None,
+) -> bool:
+    """
+    Tries to fetch the object with the given SHA-256 from the peers.
+    The file is hashed while streaming and only moved into place if it matches.
+    :return: True if a peer delivered a verified copy, otherwise False.
+    """
+    checksum = checksum.lower()
+    candidates = peers if peers is not None else get_candidate_peers()
+    temp_path = destination + ".peer"
+    headers = {"User-Agent": USER_AGENT}
+
+    for peer in candidates:
+        try:
+            if _fetch_from_peer(
+                peer, checksum, destination, temp_path, headers, progress_signal
+            ):
+                return True
+        finally:
+            # Left over after a failed, interrupted or rejected transfer.
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    return False
+
+
+_node: Optional[PeerNode] = None
+
+
+def start_sharing() -> Optional[PeerNode]:
+    """Starts the local sharing node if peer sharing is enabled in the config."""
+    global _node
+    if _node is not None or not is_enabled():
+        return _node
+    port = int(config_manager.get_config(PORT_CONFIG_KEY, default=DEFAULT_HTTP_PORT))
+    discovery = bool(config_manager.get_config(DISCOVERY_CONFIG_KEY, default=True))
+    node = PeerNode(port=port, discovery=discovery)
+    try:
+        node.start()
+    except OSError as e:
+        logger.error(f"Could not start peer sharing on port {port}: {e}")
+        return None
+    _node = node
+    return _node
+
+
+def stop_sharing():
+    """Stops the local sharing node, if running."""
+    global _node
+    if _node is not None:
+        _node.stop()
+        _node = None
+
+
+if __name__ == "__main__":
+    import argparse
+
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format="%(asctime)s [%(levelname)-8s] [%(name)-18s] %(message)s",
+    )
+
+    parser = argparse.ArgumentParser(description="Run a standalone YMU peer node.")
+    parser.add_argument("--port", type=int, default=DEFAULT_HTTP_PORT)
+    parser.add_argument("--dir", default=YMU_DLL_DIR)
+    parser.add_argument(
+        "--fetch", help="SHA-256 to fetch from --peer instead of serving"
+    )
+    parser.add_argument("--peer", action="append", default=[])
+    args = parser.parse_args()
+
+    if args.fetch:
+        target = os.path.join(args.dir, f"{args.fetch}.dll")
+        ok = fetch_object(args.fetch, target, peers=args.peer or None)
+        print(
+            f"Fetched to {target}" if ok else "No peer could deliver a verified copy."
+        )
+    else:
+        node = PeerNode(port=args.port, object_dir=args.dir)
+        node.start()
+        print(
+            f"Serving {len(build_object_index(args.dir))} object(s) on port {node.port}. Ctrl+C to stop."
+        )
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            node.stop()
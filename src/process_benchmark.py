@@ -0,0 +1,141 @@
+# process_benchmark.py - Measures how much a game-process scan costs as the process count grows.
+import argparse
+import logging
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List
+
+import psutil
+
+import process_manager
+
+
+def _full_attribute_scan(*args, **kwargs) -> int | None:
+    """The previous find_gta_pid strategy: name, exe and cmdline for every process."""
+    for p in psutil.process_iter(["pid", "name", "exe", "cmdline"]):
+        if p.info["name"] and p.info["name"].lower() in process_manager.TARGET_NAMES:
+            return p.pid
+    return None
+
+
+SCANNERS: Dict[str, Callable[..., int | None]] = {
+    "full-attributes": _full_attribute_scan,
+    "two-phase": process_manager._scan_psutil,
+    # Warmed up by time_scan; run_benchmark waits until the dummies are old
+    # enough to be remembered, so the timed calls only see process churn.
+    "incremental": process_manager.IncrementalProcessScanner().scan,
+}
+if process_manager.USE_PROC_SCANNER:
+    SCANNERS["proc"] = process_manager._scan_proc
+
+
+def time_scan(scan: Callable[..., int | None], iterations: int) -> Dict[str, float]:
+    """Runs a scan repeatedly (after one warm-up) and returns timings in milliseconds."""
+    scan()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        scan()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "mean": statistics.fmean(samples),
+        "p50": samples[len(samples) // 2],
+        "max": samples[-1],
+    }
+
+
+def spawn_dummy_processes(count: int) -> List[subprocess.Popen]:
+    """Starts idle processes to inflate the process table."""
+    sleep_binary = shutil.which("sleep")
+    if sleep_binary:
+        command = [sleep_binary, "3600"]
+    else:
+        command = [sys.executable, "-c", "import time; time.sleep(3600)"]
+    return [
+        subprocess.Popen(
+            command,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        for _ in range(count)
+    ]
+
+
+def _stop_processes(processes: List[subprocess.Popen]):
+    for process in processes:
+        process.kill()
+    for process in processes:
+        process.wait()
+
+
+def register_synthetic_targets(count: int):
+    """Adds targets that never match, to show scan cost does not grow with them."""
+    synthetic = [
+        process_manager.TargetProfile(
+            f"Synthetic {i}",
+            (f"synthetic_{i}.exe",),
+            path_patterns=(f"*/synthetic {i}/*",) if i % 2 else (),
+        )
+        for i in range(count)
+    ]
+    process_manager.set_target_profiles(
+        process_manager.DEFAULT_TARGET_PROFILES + synthetic
+    )
+
+
+def run_benchmark(extra_counts: List[int], iterations: int, scanners: List[str]):
+    print(
+        f"{'processes':>10} {'scanner':>18} {'mean ms':>9} {'p50 ms':>9} {'max ms':>9}"
+    )
+    for extra in extra_counts:
+        dummies = spawn_dummy_processes(extra)
+        try:
+            # Give the children a moment to show up in the process table, and let
+            # them age past the incremental scanner's recheck window.
+            time.sleep(
+                max(
+                    0.2 + extra * 0.002,
+                    process_manager.IncrementalProcessScanner.RECHECK_AGE_SECONDS,
+                )
+            )
+            process_count = len(psutil.pids())
+            for name in scanners:
+                stats = time_scan(SCANNERS[name], iterations)
+                print(
+                    f"{process_count:>10} {name:>18} {stats['mean']:>9.2f} "
+                    f"{stats['p50']:>9.2f} {stats['max']:>9.2f}"
+                )
+        finally:
+            _stop_processes(dummies)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark game-process scanners.")
+    parser.add_argument(
+        "--extra",
+        type=int,
+        nargs="+",
+        default=[0, 100, 300],
+        help="Numbers of idle processes to add for each round.",
+    )
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument(
+        "--targets",
+        type=int,
+        default=0,
+        help="Number of synthetic target profiles to add to the defaults.",
+    )
+    parser.add_argument(
+        "--scanners", nargs="+", choices=list(SCANNERS), default=list(SCANNERS)
+    )
+    args = parser.parse_args()
+
+    # find_gta_pid logs every miss; keep the table readable.
+    logging.basicConfig(level=logging.ERROR)
+    if args.targets:
+        register_synthetic_targets(args.targets)
+    run_benchmark(args.extra, args.iterations, args.scanners)
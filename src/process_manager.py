@@ -1,48 +1,403 @@
 # process_manager.py - Handles finding the GTA5.exe process and injecting the DLL.
 
+import abc
+import collections
+import dataclasses
+import fnmatch
 import psutil
-import pyinjector
 import os
 import logging
+import queue
+import random
+import re
+import socket
+import struct
+import sys
+import threading
+import time
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Set, Tuple, Type
+import config_manager
 from paths import YMU_DLL_DIR
 
 logger = logging.getLogger(__name__)
 
-TARGET_EXECUTABLES = ["gta5.exe", "gta5_enhanced.exe"]
+TARGETS_CONFIG_KEY = "targets"
 
 
-def find_gta_pid(*args, **kwargs) -> int | None:
+@dataclasses.dataclass(frozen=True)
+class TargetProfile:
     """
-    Scans for the GTA5 process (Standard or Enhanced) and returns its PID.
-    :return: The process ID (PID) if found, otherwise None.
+    A game or edition YMU can find and inject into.
+    :param executables: Process/executable names, matched case-insensitively.
+    :param path_patterns: Glob patterns for the executable path (e.g.
+        '*/grand theft auto v enhanced/*'). Processes whose name is claimed by a
+        profile with patterns have their path checked before they count.
+    :param launchers: Launchers (as on the Inject page) that can start it.
+    :param dll_channel: The release channel whose DLL fits this target.
     """
-    try:
-        for p in psutil.process_iter(["pid", "name", "exe", "cmdline"]):
-            if p.info["name"] and p.info["name"].lower() in TARGET_EXECUTABLES:
-                logger.info(
-                    f"Found process by name: '{p.info['name']}' with PID: {p.pid}"
+
+    name: str
+    executables: Tuple[str, ...]
+    path_patterns: Tuple[str, ...] = ()
+    launchers: Tuple[str, ...] = ()
+    dll_channel: Optional[str] = None
+
+    @classmethod
+    def from_config(cls, data: dict) -> "TargetProfile":
+        """:raises ValueError: If a list field holds something other than a list."""
+        for key in ("executables", "path_patterns", "launchers"):
+            if not isinstance(data.get(key, []), list):
+                raise ValueError(f"'{key}' must be a list.")
+        if not data["executables"]:
+            raise ValueError("'executables' must not be empty.")
+        return cls(
+            name=str(data["name"]),
+            executables=tuple(str(e).lower() for e in data["executables"]),
+            path_patterns=tuple(str(p) for p in data.get("path_patterns", [])),
+            launchers=tuple(str(launcher) for launcher in data.get("launchers", [])),
+            dll_channel=data.get("dll_channel"),
+        )
+
+
+_ALL_LAUNCHERS = ("Steam", "Epic Games", "Rockstar Games")
+DEFAULT_TARGET_PROFILES = [
+    TargetProfile(
+        "GTA V Legacy",
+        ("gta5.exe",),
+        launchers=_ALL_LAUNCHERS,
+        dll_channel="YimMenu (Legacy)",
+    ),
+    TargetProfile(
+        "GTA V Enhanced",
+        ("gta5_enhanced.exe",),
+        launchers=_ALL_LAUNCHERS,
+        dll_channel="YimMenuV2 (Enhanced)",
+    ),
+]
+TARGET_EXECUTABLES = [e for t in DEFAULT_TARGET_PROFILES for e in t.executables]
+TARGET_NAMES = frozenset(TARGET_EXECUTABLES)
+
+# Linux truncates process names to 15 characters (e.g. under Wine/Proton),
+# so "gta5_enhanced.exe" shows up as "gta5_enhanced.e".
+_COMM_NAME_LENGTH = 15
+# Processes whose name does not identify the program they run.
+_LOADERS = ["wine", "wine64", "wine-preloader", "wine64-preloader", "wineloader"]
+LOADER_NAMES = frozenset(_LOADERS) | frozenset(
+    name[:_COMM_NAME_LENGTH] for name in _LOADERS
+)
+
+
+def _executable_path(path: str) -> str:
+    """
+    Returns the lower-case executable path with forward slashes. Understands
+    the forms seen under Wine/Proton too: 'Z:\\games\\GTA5.exe', '\\??\\C:\\...',
+    quoted paths and a whole Windows command line in one argument.
+    """
+    lowered = path.strip().lower()
+    exe_end = lowered.find(".exe")
+    if exe_end != -1:
+        lowered = lowered[: exe_end + 4]
+    return lowered.replace("\\", "/").lstrip('"')
+
+
+def _executable_name(path: str) -> str:
+    """Returns the lower-case file name of an executable path."""
+    return _executable_path(path).rsplit("/", 1)[-1]
+
+
+@dataclasses.dataclass(frozen=True)
+class TargetMatch:
+    target: TargetProfile
+    how: str
+
+    def __str__(self) -> str:
+        return f"{self.how} ({self.target.name})"
+
+
+class TargetMatcher:
+    """
+    All target profiles compiled into lookup tables: names map straight to
+    their profile, and the path patterns of the profiles sharing an executable
+    name are folded into one regex, so a single pass over the process table
+    matches any number of targets at the cost of one dict lookup per process.
+    """
+
+    def __init__(self, profiles: List[TargetProfile]):
+        self.profiles = list(profiles)
+        claimants: Dict[str, List[TargetProfile]] = {}
+        for profile in self.profiles:
+            for executable in profile.executables:
+                claimants.setdefault(executable.lower(), []).append(profile)
+        self.executables = sorted(claimants)
+
+        # Per executable: a regex over the patterns of the profiles claiming it
+        # (one named group per profile), and the first claimant without
+        # patterns, which takes the process if no pattern matches.
+        self._path_rules: Dict[
+            str,
+            Tuple[Optional[re.Pattern], List[TargetProfile], Optional[TargetProfile]],
+        ] = {}
+        for executable, owners in claimants.items():
+            patterned = [owner for owner in owners if owner.path_patterns]
+            fallback = next(
+                (owner for owner in owners if not owner.path_patterns), None
+            )
+            regex = None
+            if patterned:
+                regex = re.compile(
+                    "|".join(
+                        f"(?P<t{i}>"
+                        + "|".join(
+                            fnmatch.translate(pattern.lower().replace("\\", "/"))
+                            for pattern in owner.path_patterns
+                        )
+                        + ")"
+                        for i, owner in enumerate(patterned)
+                    )
                 )
-                return p.pid
+            self._path_rules[executable] = (regex, patterned, fallback)
 
-            if (
-                p.info["exe"]
-                and os.path.basename(p.info["exe"]).lower() in TARGET_EXECUTABLES
-            ):
-                logger.info(
-                    f"Found process by executable path: '{p.info['exe']}' with PID: {p.pid}"
+        # Names that identify a target on their own; if any profile claiming a
+        # name has path patterns, the path has to be read.
+        self._direct = {
+            executable: fallback
+            for executable, (regex, _, fallback) in self._path_rules.items()
+            if regex is None
+        }
+        patterned_names = {
+            executable
+            for executable, (regex, _, _) in self._path_rules.items()
+            if regex is not None
+        }
+        truncated = {
+            name[:_COMM_NAME_LENGTH]
+            for name in claimants
+            if len(name) > _COMM_NAME_LENGTH
+        }
+        self.ambiguous_names = frozenset(truncated | patterned_names) | LOADER_NAMES
+        self.direct_comms = {
+            name.encode(): profile
+            for name, profile in self._direct.items()
+            if len(name) <= _COMM_NAME_LENGTH
+        }
+        self.ambiguous_comms = frozenset(
+            name[:_COMM_NAME_LENGTH].encode() for name in self.ambiguous_names
+        )
+
+    def match_name(self, name: Optional[str]) -> Optional[TargetProfile]:
+        """The profile a process name alone identifies, if any."""
+        return self._direct.get(name.lower()) if name else None
+
+    def needs_disambiguation(self, name: Optional[str]) -> bool:
+        """True if the name alone cannot rule the process out."""
+        return not name or name.lower() in self.ambiguous_names
+
+    def match_path(self, path: Optional[str]) -> Optional[TargetProfile]:
+        """Matches an executable path (or command-line argument) against all targets."""
+        if not path:
+            return None
+        normalized = _executable_path(path)
+        rule = self._path_rules.get(normalized.rsplit("/", 1)[-1])
+        if rule is None:
+            return None
+        regex, patterned, fallback = rule
+        if regex is not None:
+            found = regex.match(normalized)
+            if found is not None:
+                return patterned[int(found.lastgroup[1:])]
+        return fallback
+
+
+def load_target_profiles() -> List[TargetProfile]:
+    """
+    Returns the default profiles plus those under 'targets' in config.json.
+    A configured profile with the name of a default one replaces it.
+    """
+    profiles = {profile.name: profile for profile in DEFAULT_TARGET_PROFILES}
+    stored = config_manager.get_config(TARGETS_CONFIG_KEY, default=[])
+    for data in stored if isinstance(stored, list) else []:
+        try:
+            profile = TargetProfile.from_config(data)
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Ignoring invalid target profile {data!r}: {e}")
+            continue
+        profiles[profile.name] = profile
+    return list(profiles.values())
+
+
+_target_matcher: Optional[TargetMatcher] = None
+_target_matcher_lock = threading.Lock()
+
+
+def get_target_matcher() -> TargetMatcher:
+    """Returns the compiled matcher, building it from the profiles on first use."""
+    global _target_matcher
+    with _target_matcher_lock:
+        if _target_matcher is None:
+            _target_matcher = TargetMatcher(load_target_profiles())
+            logger.info(
+                f"Target profiles: {', '.join(p.name for p in _target_matcher.profiles)}"
+            )
+        return _target_matcher
+
+
+def set_target_profiles(profiles: Optional[List[TargetProfile]]):
+    """Replaces the target profiles (None reloads them from config.json)."""
+    global _target_matcher
+    with _target_matcher_lock:
+        _target_matcher = TargetMatcher(profiles) if profiles is not None else None
+
+
+def _inspect_candidate(
+    process: psutil.Process, matcher: Optional[TargetMatcher] = None
+) -> Optional[TargetMatch]:
+    """
+    Reads exe and cmdline of a single candidate.
+    :return: What matched, or None.
+    """
+    matcher = matcher or get_target_matcher()
+    with process.oneshot():
+        try:
+            exe = process.exe()
+        except (psutil.AccessDenied, psutil.ZombieProcess):
+            exe = None
+        target = matcher.match_path(exe)
+        if target is not None:
+            return TargetMatch(target, f"executable path '{exe}'")
+        try:
+            cmdline = process.cmdline()
+        except (psutil.AccessDenied, psutil.ZombieProcess):
+            cmdline = []
+    # Loaders such as wine keep the game in a later argument.
+    for arg in cmdline[:2]:
+        target = matcher.match_path(arg)
+        if target is not None:
+            return TargetMatch(target, f"command line '{arg}'")
+    return None
+
+
+def _match_process(process: psutil.Process, name: str | None) -> Optional[TargetMatch]:
+    """
+    Decides whether a process is a target, reading exe/cmdline only if the name is ambiguous.
+    :return: What matched, or None.
+    """
+    matcher = get_target_matcher()
+    target = matcher.match_name(name)
+    if target is not None:
+        return TargetMatch(target, f"name '{name}'")
+    if matcher.needs_disambiguation(name):
+        return _inspect_candidate(process, matcher)
+    return None
+
+
+PROC_ROOT = "/proc"
+USE_PROC_SCANNER = sys.platform.startswith("linux") and os.path.isdir(
+    os.path.join(PROC_ROOT, "self")
+)
+
+
+def _read_proc_file(path: str, size: int) -> bytes | None:
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        return os.read(fd, size)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+
+def _iter_proc_matches(
+    proc_root: str = PROC_ROOT,
+) -> Iterator[Tuple[int, TargetMatch]]:
+    """
+    Linux: reads /proc directly. comm is read for every process and cmdline only
+    for ambiguous ones, without creating a psutil.Process per PID.
+    Lazy, so callers that want one match stop at the first.
+    :return: (pid, match) for each game process.
+    """
+    matcher = get_target_matcher()
+    candidates = []
+    with os.scandir(proc_root) as entries:
+        for entry in entries:
+            pid = entry.name
+            if not pid.isdigit():
+                continue
+            comm = _read_proc_file(f"{proc_root}/{pid}/comm", 64)
+            if comm is None:
+                continue
+            comm = comm.rstrip(b"\n").lower()
+            target = matcher.direct_comms.get(comm)
+            if target is not None:
+                yield int(pid), TargetMatch(
+                    target, f"name '{comm.decode(errors='replace')}'"
                 )
-                return p.pid
+                continue
+            if not comm or comm in matcher.ambiguous_comms:
+                candidates.append(pid)
 
-            if p.info["cmdline"] and len(p.info["cmdline"]) > 0:
-                exe_in_cmd = p.info["cmdline"][0].lower()
-                if any(exe_in_cmd.endswith(target) for target in TARGET_EXECUTABLES):
-                    logger.info(
-                        f"Found process by command line: '{p.info['cmdline'][0]}' with PID: {p.pid}"
-                    )
-                    return p.pid
+    for pid in candidates:
+        cmdline = _read_proc_file(f"{proc_root}/{pid}/cmdline", 4096)
+        if not cmdline:
+            continue
+        # Loaders such as wine keep the game in the second argument.
+        for arg in cmdline.split(b"\0", 2)[:2]:
+            text = arg.decode("utf-8", errors="replace")
+            target = matcher.match_path(text)
+            if target is not None:
+                yield int(pid), TargetMatch(target, f"command line '{text}'")
+                break
 
-    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-        pass
+
+def _scan_proc(proc_root: str = PROC_ROOT) -> Tuple[int, TargetMatch] | None:
+    """:return: (pid, match) of the first game process or None."""
+    return next(_iter_proc_matches(proc_root), None)
+
+
+def _iter_psutil_matches() -> Iterator[Tuple[int, TargetMatch]]:
+    """
+    Reads only process names for the whole table; exe and cmdline are read
+    for the few processes whose name is ambiguous.
+    :return: (pid, match) for each game process.
+    """
+    matcher = get_target_matcher()
+    candidates = []
+    for p in psutil.process_iter(["name"]):
+        name = p.info["name"]
+        target = matcher.match_name(name)
+        if target is not None:
+            yield p.pid, TargetMatch(target, f"name '{name}'")
+        elif matcher.needs_disambiguation(name):
+            candidates.append(p)
+
+    for p in candidates:
+        try:
+            match = _inspect_candidate(p, matcher)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+        if match:
+            yield p.pid, match
+
+
+def _scan_psutil() -> Tuple[int, TargetMatch] | None:
+    """:return: (pid, match) of the first game process or None."""
+    return next(_iter_psutil_matches(), None)
+
+
+def find_gta_pid(*args, **kwargs) -> int | None:
+    """
+    Scans for the GTA5 process (Standard or Enhanced) and returns its PID.
+    Uses the /proc scanner on Linux and psutil everywhere else.
+    :return: The process ID (PID) if found, otherwise None.
+    """
+    try:
+        found = _scan_proc() if USE_PROC_SCANNER else _scan_psutil()
+        if found:
+            pid, match = found
+            logger.info(f"Found process by {match} with PID: {pid}")
+            return pid
     except Exception as e:
         logger.exception(
             f"An unexpected error occurred while searching for the game process: {e}"
@@ -52,11 +407,473 @@ def find_gta_pid(*args, **kwargs) -> int | None:
     return None
 
 
-def inject_dll(pid: int, dll_filename: str, **kwargs) -> bool:
+class IncrementalProcessScanner:
+    """
+    Finds the game by inspecting only the processes that appeared since the
+    previous scan. Known PIDs are kept with their create time; vanished ones are
+    evicted, and a known PID with a different create time was reused by a new
+    process, so it is inspected again.
+    Once found, the game is returned as long as its PID and create time still match.
+    """
+
+    # Processes younger than this are inspected again on the next scan,
+    # since they may not have exec'd into their final image yet.
+    RECHECK_AGE_SECONDS = 2.0
+
+    def __init__(self):
+        self._known: Dict[int, float] = {}
+        self._match: Optional[Tuple[int, float]] = None
+        self._lock = threading.Lock()
+
+    def reset(self):
+        with self._lock:
+            self._known.clear()
+            self._match = None
+
+    def _is_alive(self, pid: int, create_time: float) -> bool:
+        try:
+            return psutil.Process(pid).create_time() == create_time
+        except psutil.Error:
+            return False
+
+    def scan(self, *args, **kwargs) -> int | None:
+        """:return: The PID of the game process if it is running, otherwise None."""
+        with self._lock:
+            if self._match is not None:
+                if self._is_alive(*self._match):
+                    return self._match[0]
+                logger.info(f"Game process {self._match[0]} is gone.")
+                self._match = None
+
+            try:
+                pids = set(psutil.pids())
+            except Exception as e:
+                logger.exception(f"Failed to list processes: {e}")
+                return None
+
+            for pid in self._known.keys() - pids:
+                del self._known[pid]
+
+            now = time.time()
+            for pid in sorted(pids):
+                try:
+                    process = psutil.Process(pid)
+                    create_time = process.create_time()
+                except psutil.Error:
+                    self._known.pop(pid, None)
+                    continue
+                if self._known.get(pid) == create_time:
+                    continue
+                self._known.pop(pid, None)
+                try:
+                    try:
+                        name = process.name()
+                    except psutil.AccessDenied:
+                        name = None
+                    match = _match_process(process, name)
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+
+                if match:
+                    logger.info(f"Found process by {match} with PID: {pid}")
+                    self._match = (pid, create_time)
+                    return pid
+                if now - create_time >= self.RECHECK_AGE_SECONDS:
+                    self._known[pid] = create_time
+            return None
+
+
+_scanner = IncrementalProcessScanner()
+
+
+def scan_for_gta_pid(*args, **kwargs) -> int | None:
+    """
+    Like find_gta_pid, but incremental: meant for repeated polling, where
+    it only looks at processes that started since the last call.
+    """
+    return _scanner.scan()
+
+
+# Processes that start the game for each launcher choice on the Inject page.
+LAUNCHER_PROCESS_NAMES: Dict[str, List[str]] = {
+    "Steam": ["steam.exe", "steam"],
+    "Epic Games": ["epicgameslauncher.exe"],
+    "Rockstar Games": ["playgtav.exe", "launcher.exe", "rockstarservice.exe"],
+}
+
+
+class LaunchTracker:
+    """
+    Follows the process tree of a launch: only processes that descend from
+    the roots (YMU itself and the launcher's processes) are inspected.
+    Descendants are remembered as they appear, so the chain survives
+    intermediate launcher processes exiting. After fallback_after seconds
+    it gives up and scans globally.
+    """
+
+    FALLBACK_AFTER_SECONDS = 60.0
+
+    def __init__(
+        self,
+        root_pids: List[int],
+        fallback_after: float = FALLBACK_AFTER_SECONDS,
+    ):
+        self._lock = threading.Lock()
+        self._deadline = time.monotonic() + fallback_after
+        self._tree: Set[int] = set()
+        self._checked: Set[int] = set()
+        self._seen: Set[int] = set(psutil.pids())
+        for pid in root_pids:
+            try:
+                process = psutil.Process(pid)
+                self._tree.add(pid)
+                self._tree.update(c.pid for c in process.children(recursive=True))
+            except psutil.Error:
+                continue
+        logger.info(
+            f"Tracking launch from {len(root_pids)} root(s), "
+            f"{len(self._tree)} process(es) in the tree."
+        )
+
+    @classmethod
+    def for_launcher(
+        cls, launcher: str, fallback_after: float = FALLBACK_AFTER_SECONDS, **kwargs
+    ) -> "LaunchTracker":
+        """Roots are the running YMU process and any running launcher processes."""
+        names = set(LAUNCHER_PROCESS_NAMES.get(launcher, []))
+        roots = [os.getpid()]
+        if names:
+            for p in psutil.process_iter(["name"]):
+                if p.info["name"] and p.info["name"].lower() in names:
+                    roots.append(p.pid)
+        return cls(roots, fallback_after=fallback_after)
+
+    @property
+    def fell_back(self) -> bool:
+        return time.monotonic() >= self._deadline
+
+    def _update_tree(self):
+        """Adds processes that started since the last update and descend from the tree."""
+        current = set(psutil.pids())
+        parents: Dict[int, int] = {}
+        for pid in current - self._seen:
+            try:
+                parents[pid] = psutil.Process(pid).ppid()
+            except psutil.Error:
+                continue
+        self._seen = current
+        # PIDs are not ordered by creation on Windows, so repeat until stable.
+        added = True
+        while added:
+            added = False
+            for pid, ppid in list(parents.items()):
+                if ppid in self._tree:
+                    self._tree.add(pid)
+                    del parents[pid]
+                    added = True
+
+    def is_descendant(self, pid: int) -> bool:
+        with self._lock:
+            if pid not in self._tree:
+                self._update_tree()
+            return pid in self._tree
+
+    def scan(self, *args, **kwargs) -> int | None:
+        """:return: The PID of the game if it started from this launch, otherwise None."""
+        if self.fell_back:
+            return scan_for_gta_pid()
+        with self._lock:
+            self._update_tree()
+            now = time.time()
+            for pid in sorted(self._tree - self._checked):
+                try:
+                    process = psutil.Process(pid)
+                    create_time = process.create_time()
+                    try:
+                        name = process.name()
+                    except psutil.AccessDenied:
+                        name = None
+                    match = _match_process(process, name)
+                except psutil.Error:
+                    self._checked.add(pid)
+                    continue
+                if match:
+                    logger.info(f"Found launched game by {match} with PID: {pid}")
+                    return pid
+                # Young processes may still exec into the game; look again later.
+                if now - create_time >= IncrementalProcessScanner.RECHECK_AGE_SECONDS:
+                    self._checked.add(pid)
+        return None
+
+
+class InjectionFailed(RuntimeError):
+    """Raised by an injector backend when the DLL could not be loaded into the target."""
+
+    pass
+
+
+class InjectorBackend(abc.ABC):
+    """
+    Loads a DLL into another process. Backends raise PermissionError when the
+    target cannot be opened with our rights and InjectionFailed otherwise.
+    """
+
+    name = "base"
+
+    @classmethod
+    def is_supported(cls) -> bool:
+        return True
+
+    @abc.abstractmethod
+    def inject(self, pid: int, dll_path: str):
+        pass
+
+
+class PyInjectorBackend(InjectorBackend):
+    """The pyinjector package."""
+
+    name = "pyinjector"
+
+    @classmethod
+    def is_supported(cls) -> bool:
+        try:
+            import pyinjector  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def inject(self, pid: int, dll_path: str):
+        import pyinjector
+
+        try:
+            pyinjector.inject(pid, dll_path)
+        except pyinjector.InjectorError as e:
+            if "Access is denied" in str(e):
+                raise PermissionError("Access Denied") from e
+            raise InjectionFailed(str(e)) from e
+
+
+class LoadLibraryInjectorBackend(InjectorBackend):
+    """
+    Windows: writes the DLL path into the target and runs LoadLibraryW there
+    with CreateRemoteThread, using only kernel32 through ctypes.
+    """
+
+    name = "loadlibrary"
+
+    PROCESS_ACCESS = 0x0002 | 0x0008 | 0x0010 | 0x0020 | 0x0400
+    MEM_COMMIT_RESERVE = 0x1000 | 0x2000
+    MEM_RELEASE = 0x8000
+    PAGE_READWRITE = 0x04
+    ERROR_ACCESS_DENIED = 5
+    WAIT_OBJECT_0 = 0
+    THREAD_TIMEOUT_MS = 30000
+
+    @classmethod
+    def is_supported(cls) -> bool:
+        # kernel32 is mapped at the same address in every 64-bit process,
+        # so our LoadLibraryW address is valid in the (64-bit) game.
+        return sys.platform == "win32" and struct.calcsize("P") == 8
+
+    @staticmethod
+    def _kernel32():
+        import ctypes
+        from ctypes import wintypes
+
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        kernel32.OpenProcess.restype = wintypes.HANDLE
+        kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+        kernel32.VirtualAllocEx.restype = wintypes.LPVOID
+        kernel32.VirtualAllocEx.argtypes = [
+            wintypes.HANDLE,
+            wintypes.LPVOID,
+            ctypes.c_size_t,
+            wintypes.DWORD,
+            wintypes.DWORD,
+        ]
+        kernel32.VirtualFreeEx.argtypes = [
+            wintypes.HANDLE,
+            wintypes.LPVOID,
+            ctypes.c_size_t,
+            wintypes.DWORD,
+        ]
+        kernel32.WriteProcessMemory.argtypes = [
+            wintypes.HANDLE,
+            wintypes.LPVOID,
+            wintypes.LPCVOID,
+            ctypes.c_size_t,
+            ctypes.POINTER(ctypes.c_size_t),
+        ]
+        kernel32.GetModuleHandleW.restype = wintypes.HMODULE
+        kernel32.GetModuleHandleW.argtypes = [wintypes.LPCWSTR]
+        kernel32.GetProcAddress.restype = wintypes.LPVOID
+        kernel32.GetProcAddress.argtypes = [wintypes.HMODULE, wintypes.LPCSTR]
+        kernel32.CreateRemoteThread.restype = wintypes.HANDLE
+        kernel32.CreateRemoteThread.argtypes = [
+            wintypes.HANDLE,
+            wintypes.LPVOID,
+            ctypes.c_size_t,
+            wintypes.LPVOID,
+            wintypes.LPVOID,
+            wintypes.DWORD,
+            wintypes.LPDWORD,
+        ]
+        kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+        kernel32.GetExitCodeThread.argtypes = [wintypes.HANDLE, wintypes.LPDWORD]
+        kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+        return kernel32
+
+    def _raise_last_error(self, call: str):
+        import ctypes
+
+        error = ctypes.get_last_error()
+        if error == self.ERROR_ACCESS_DENIED:
+            raise PermissionError("Access Denied")
+        raise InjectionFailed(f"{call} failed with error {error}.")
+
+    def inject(self, pid: int, dll_path: str):
+        import ctypes
+        from ctypes import wintypes
+
+        kernel32 = self._kernel32()
+        process = kernel32.OpenProcess(self.PROCESS_ACCESS, False, pid)
+        if not process:
+            self._raise_last_error("OpenProcess")
+        try:
+            data = (dll_path + "\0").encode("utf-16-le")
+            remote = kernel32.VirtualAllocEx(
+                process, None, len(data), self.MEM_COMMIT_RESERVE, self.PAGE_READWRITE
+            )
+            if not remote:
+                self._raise_last_error("VirtualAllocEx")
+            # The path must stay allocated while LoadLibraryW may still read it.
+            free_remote = True
+            try:
+                written = ctypes.c_size_t()
+                if not kernel32.WriteProcessMemory(
+                    process, remote, data, len(data), ctypes.byref(written)
+                ):
+                    self._raise_last_error("WriteProcessMemory")
+                load_library = kernel32.GetProcAddress(
+                    kernel32.GetModuleHandleW("kernel32.dll"), b"LoadLibraryW"
+                )
+                thread = kernel32.CreateRemoteThread(
+                    process, None, 0, load_library, remote, 0, None
+                )
+                if not thread:
+                    self._raise_last_error("CreateRemoteThread")
+                try:
+                    waited = kernel32.WaitForSingleObject(
+                        thread, self.THREAD_TIMEOUT_MS
+                    )
+                    if waited != self.WAIT_OBJECT_0:
+                        free_remote = False
+                        raise InjectionFailed("LoadLibraryW did not return in time.")
+                    # The exit code is the low half of the module handle; 0 means failure.
+                    exit_code = wintypes.DWORD()
+                    kernel32.GetExitCodeThread(thread, ctypes.byref(exit_code))
+                    if exit_code.value == 0:
+                        raise InjectionFailed(
+                            "LoadLibraryW failed in the target process."
+                        )
+                finally:
+                    kernel32.CloseHandle(thread)
+            finally:
+                if free_remote:
+                    kernel32.VirtualFreeEx(process, remote, 0, self.MEM_RELEASE)
+        finally:
+            kernel32.CloseHandle(process)
+
+
+class FakeInjectorBackend(InjectorBackend):
+    """
+    Simulates injection without touching the target, for tests and benchmarks.
+    Every call sleeps for latency ± jitter seconds and then fails with the
+    given probabilities. Calls are recorded as (pid, dll_path, seconds).
+    """
+
+    name = "fake"
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        failure_rate: float = 0.0,
+        access_denied_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.access_denied_rate = access_denied_rate
+        self.calls: List[Tuple[int, str, float]] = []
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def inject(self, pid: int, dll_path: str):
+        start = time.perf_counter()
+        with self._lock:
+            delay = self.latency + self._random.uniform(-self.jitter, self.jitter)
+            roll = self._random.random()
+        try:
+            time.sleep(max(delay, 0.0))
+            if roll < self.access_denied_rate:
+                raise PermissionError("Access Denied")
+            if roll < self.access_denied_rate + self.failure_rate:
+                raise InjectionFailed("Simulated injection failure.")
+        finally:
+            with self._lock:
+                self.calls.append((pid, dll_path, time.perf_counter() - start))
+
+
+INJECTOR_BACKENDS: Dict[str, Type[InjectorBackend]] = {
+    backend.name: backend
+    for backend in (PyInjectorBackend, LoadLibraryInjectorBackend, FakeInjectorBackend)
+}
+# The fake is only used when selected explicitly.
+DEFAULT_INJECTOR_ORDER = [PyInjectorBackend, LoadLibraryInjectorBackend]
+INJECTOR_CONFIG_KEY = "inject.backend"
+
+_injector_override: Optional[InjectorBackend] = None
+
+
+def set_injector_backend(backend: Optional[InjectorBackend]):
+    """Overrides the backend used by inject_dll (None restores the configured one)."""
+    global _injector_override
+    _injector_override = backend
+
+
+def get_injector_backend() -> InjectorBackend:
+    """
+    Returns the override, else the backend named by 'inject.backend' in
+    config.json, else the first supported default.
+    :raises InjectionFailed: If no backend is available.
+    """
+    if _injector_override is not None:
+        return _injector_override
+    name = config_manager.get_config(INJECTOR_CONFIG_KEY)
+    if name:
+        backend_class = INJECTOR_BACKENDS.get(name)
+        if backend_class is not None and backend_class.is_supported():
+            return backend_class()
+        logger.warning(f"Injector backend '{name}' is not available here.")
+    for backend_class in DEFAULT_INJECTOR_ORDER:
+        if backend_class.is_supported():
+            return backend_class()
+    raise InjectionFailed("No injector backend is available on this system.")
+
+
+def inject_dll(
+    pid: int,
+    dll_filename: str,
+    backend: Optional[InjectorBackend] = None,
+    **kwargs,
+) -> bool:
     """
     Injects a DLL into a process with the given PID.
     :param pid: The Process ID of the target process.
     :param dll_path: The absolute path to the DLL file.
+    :param backend: The injector to use; defaults to get_injector_backend().
     :return: True if injection was successful, otherwise False.
     """
     dll_path = os.path.join(YMU_DLL_DIR, dll_filename)
@@ -69,26 +886,968 @@ def inject_dll(pid: int, dll_filename: str, **kwargs) -> bool:
         if not psutil.pid_exists(pid):
             logger.error(f"Process with PID {pid} does not exist. Cannot inject.")
             return False
-        logger.info(f"Attempting to inject '{dll_path}' into PID {pid}...")
-        pyinjector.inject(pid, dll_path)
+        backend = backend or get_injector_backend()
+        logger.info(
+            f"Attempting to inject '{dll_path}' into PID {pid} ({backend.name})..."
+        )
+        backend.inject(pid, dll_path)
         logger.info("Injection successful.")
         return True
-    except pyinjector.InjectorError as e:
-        error_msg = str(e)
-        if "Access is denied" in error_msg:
-            logger.warning("Injection blocked due to insufficient permissions.")
-            raise PermissionError("Access Denied")
-        logger.exception(f"A pyinjector error occurred during injection: {e}")
+    except PermissionError:
+        logger.warning("Injection blocked due to insufficient permissions.")
+        raise PermissionError("Access Denied")
+    except InjectionFailed as e:
+        logger.error(f"Injection failed: {e}")
         return False
     except Exception as e:
         logger.exception(f"An unexpected exception occurred during injection: {e}")
         raise e
 
 
-def is_process_running(pid: int) -> bool:
+def is_process_running(pid: int, create_time: float | None = None) -> bool:
     """
     Checks if a process with the given PID is still running.
     :param pid: The Process ID to check.
+    :param create_time: If given, the process must also have this create time,
+        which rules out a new process that reused the PID.
     :return: True if the process is running, otherwise False.
     """
-    return psutil.pid_exists(pid)
+    if create_time is None:
+        return psutil.pid_exists(pid)
+    try:
+        return psutil.Process(pid).create_time() == create_time
+    except psutil.Error:
+        return False
+
+
+@dataclasses.dataclass(frozen=True)
+class TrackedProcess:
+    """A process identified by PID and create time, so PID reuse is detected."""
+
+    pid: int
+    create_time: float
+
+    @classmethod
+    def from_pid(cls, pid: int) -> Optional["TrackedProcess"]:
+        try:
+            return cls(pid, psutil.Process(pid).create_time())
+        except psutil.Error:
+            return None
+
+    def is_alive(self) -> bool:
+        return is_process_running(self.pid, self.create_time)
+
+
+@dataclasses.dataclass(frozen=True)
+class GameProcess:
+    """A running game instance and what is known about it."""
+
+    pid: int
+    create_time: float
+    name: str
+    exe: Optional[str]
+    username: Optional[str]
+    matched_by: str
+    target: Optional[str] = None
+
+    @property
+    def tracked(self) -> TrackedProcess:
+        return TrackedProcess(self.pid, self.create_time)
+
+
+def _describe_game_process(pid: int, match: TargetMatch) -> Optional[GameProcess]:
+    try:
+        process = psutil.Process(pid)
+        with process.oneshot():
+            create_time = process.create_time()
+            name = process.name()
+            try:
+                exe = process.exe() or None
+            except (psutil.AccessDenied, psutil.ZombieProcess):
+                exe = None
+            try:
+                username = process.username()
+            except (psutil.AccessDenied, psutil.ZombieProcess, KeyError):
+                username = None
+    except psutil.Error:
+        return None
+    return GameProcess(
+        pid, create_time, name, exe, username, str(match), match.target.name
+    )
+
+
+def find_gta_processes(*args, **kwargs) -> List[GameProcess]:
+    """
+    Returns every running game process (e.g. instances of different users or
+    sandboxes), oldest first.
+    """
+    matches = _iter_proc_matches() if USE_PROC_SCANNER else _iter_psutil_matches()
+    processes = []
+    try:
+        for pid, match in matches:
+            game_process = _describe_game_process(pid, match)
+            if game_process is not None:
+                processes.append(game_process)
+    except Exception as e:
+        logger.exception(
+            f"An unexpected error occurred while searching for game processes: {e}"
+        )
+    processes.sort(key=lambda p: p.create_time)
+    logger.info(f"Found {len(processes)} game process(es).")
+    return processes
+
+
+@dataclasses.dataclass
+class InjectionResult:
+    pid: int
+    success: bool
+    error: Optional[str] = None
+    duration_ms: float = 0.0
+
+
+def _inject_tracked(tracked: TrackedProcess, dll_filename: str) -> InjectionResult:
+    start = time.perf_counter()
+    try:
+        if not tracked.is_alive():
+            success, error = False, "Process exited."
+        else:
+            success = inject_dll(tracked.pid, dll_filename)
+            error = None if success else "Injection failed."
+    except PermissionError:
+        success, error = False, "Access Denied"
+    except Exception as e:
+        success, error = False, str(e) or type(e).__name__
+    return InjectionResult(
+        tracked.pid, success, error, round((time.perf_counter() - start) * 1000, 1)
+    )
+
+
+def inject_many(
+    targets: List[TrackedProcess],
+    dll_filename: str,
+    timeout: Optional[float] = None,
+    on_result: Optional[Callable[[InjectionResult], None]] = None,
+    **kwargs,
+) -> Dict[int, InjectionResult]:
+    """
+    Injects a DLL into several processes at once, one thread per target, so a
+    slow or failing target does not hold up the others.
+    :param timeout: Seconds to wait for all targets. Targets still running
+        afterwards are reported as timed out; their threads are daemon threads,
+        so a hung injection does not keep YMU from exiting.
+    :param on_result: Called in the calling thread as each target finishes.
+    :return: {pid: InjectionResult} for every target.
+    """
+    results: Dict[int, InjectionResult] = {}
+    if not targets:
+        return results
+    finished: "queue.Queue[InjectionResult]" = queue.Queue()
+    for tracked in targets:
+        threading.Thread(
+            target=lambda t=tracked: finished.put(_inject_tracked(t, dll_filename)),
+            name=f"inject-{tracked.pid}",
+            daemon=True,
+        ).start()
+
+    expected = len({tracked.pid for tracked in targets})
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    while len(results) < expected:
+        remaining = None if deadline is None else deadline - time.monotonic()
+        try:
+            if remaining is not None and remaining <= 0:
+                raise queue.Empty
+            result = finished.get(timeout=remaining)
+        except queue.Empty:
+            break
+        results[result.pid] = result
+        logger.info(
+            f"Injection into PID {result.pid}: "
+            f"{'ok' if result.success else result.error} ({result.duration_ms} ms)"
+        )
+        if on_result is not None:
+            on_result(result)
+
+    for tracked in targets:
+        if tracked.pid not in results:
+            logger.warning(f"Injection into PID {tracked.pid} timed out.")
+            results[tracked.pid] = InjectionResult(
+                tracked.pid, False, "Timed out.", timeout * 1000
+            )
+    return results
+
+
+INJECTION_PROFILES_CONFIG_KEY = "inject.profiles"
+
+
+@dataclasses.dataclass
+class InjectionStep:
+    dll: str
+    # Seconds to wait after this DLL before injecting the next one.
+    delay_seconds: float = 0.0
+
+
+@dataclasses.dataclass
+class InjectionProfile:
+    """An ordered list of DLLs that are injected one after another as one job."""
+
+    name: str
+    steps: List[InjectionStep]
+    stop_on_failure: bool = True
+
+    @classmethod
+    def from_config(cls, name: str, data: dict) -> "InjectionProfile":
+        """Accepts steps as DLL names or as {"dll": ..., "delay_seconds": ...}."""
+        steps = []
+        for entry in data.get("steps", []):
+            if isinstance(entry, str):
+                steps.append(InjectionStep(entry))
+            else:
+                steps.append(
+                    InjectionStep(
+                        str(entry["dll"]), float(entry.get("delay_seconds", 0.0))
+                    )
+                )
+        return cls(name, steps, bool(data.get("stop_on_failure", True)))
+
+    def to_config(self) -> dict:
+        return {
+            "steps": [dataclasses.asdict(step) for step in self.steps],
+            "stop_on_failure": self.stop_on_failure,
+        }
+
+
+def load_injection_profiles() -> Dict[str, InjectionProfile]:
+    """Returns the profiles stored under 'inject.profiles' in config.json."""
+    profiles = {}
+    stored = config_manager.get_config(INJECTION_PROFILES_CONFIG_KEY, default={})
+    if not isinstance(stored, dict):
+        return profiles
+    for name, data in stored.items():
+        try:
+            profiles[name] = InjectionProfile.from_config(name, data)
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Ignoring invalid injection profile '{name}': {e}")
+    return profiles
+
+
+def save_injection_profile(profile: InjectionProfile) -> bool:
+    if not profile.name or "." in profile.name:
+        raise ValueError(f"Invalid profile name: '{profile.name}'")
+    return config_manager.set_config(
+        f"{INJECTION_PROFILES_CONFIG_KEY}.{profile.name}", profile.to_config()
+    )
+
+
+def validate_injection_profile(profile: InjectionProfile) -> List[str]:
+    """Returns one message per problem; an empty list means the profile can run."""
+    problems = []
+    if not profile.steps:
+        problems.append("The profile has no DLLs.")
+    for number, step in enumerate(profile.steps, start=1):
+        if not step.dll.lower().endswith(".dll"):
+            problems.append(f"Step {number}: '{step.dll}' is not a DLL.")
+        elif not os.path.isfile(os.path.join(YMU_DLL_DIR, step.dll)):
+            problems.append(f"Step {number}: '{step.dll}' not found.")
+        if step.delay_seconds < 0:
+            problems.append(f"Step {number}: the delay must not be negative.")
+    return problems
+
+
+@dataclasses.dataclass
+class ProfileStepResult:
+    dll: str
+    success: bool
+    error: Optional[str] = None
+    # Milliseconds from the start of the job until this step started, and its duration.
+    started_ms: float = 0.0
+    duration_ms: float = 0.0
+    skipped: bool = False
+
+
+@dataclasses.dataclass
+class ProfileResult:
+    pid: int
+    profile: str
+    steps: List[ProfileStepResult]
+    duration_ms: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return all(step.success for step in self.steps)
+
+    @property
+    def injected(self) -> bool:
+        """True if any step got a DLL into the process, even if later ones failed."""
+        return any(step.success for step in self.steps)
+
+
+def inject_profile(
+    tracked: TrackedProcess,
+    profile: InjectionProfile,
+    stop_event: Optional[threading.Event] = None,
+    on_result: Optional[Callable[[ProfileStepResult], None]] = None,
+    progress_signal=None,
+    **kwargs,
+) -> ProfileResult:
+    """
+    Injects the DLLs of a profile in order, waiting each step's delay in between.
+    All files are checked before the first injection. After a failed step the
+    rest is skipped if the profile says stop_on_failure.
+    :param stop_event: Skips the remaining steps once set (also cuts delays short).
+    :param on_result: Called in the calling thread as each step finishes.
+    :raises ValueError: If the profile fails validation; nothing is injected then.
+    """
+    problems = validate_injection_profile(profile)
+    if problems:
+        raise ValueError(f"Profile '{profile.name}': " + " ".join(problems))
+    stop_event = stop_event or threading.Event()
+    start = time.perf_counter()
+    results: List[ProfileStepResult] = []
+    failed = False
+    for index, step in enumerate(profile.steps):
+        started_ms = round((time.perf_counter() - start) * 1000, 1)
+        if (failed and profile.stop_on_failure) or stop_event.is_set():
+            result = ProfileStepResult(
+                step.dll, False, "Skipped.", started_ms, skipped=True
+            )
+        else:
+            injection = _inject_tracked(tracked, step.dll)
+            result = ProfileStepResult(
+                step.dll,
+                injection.success,
+                injection.error,
+                started_ms,
+                injection.duration_ms,
+            )
+            failed = failed or not injection.success
+            logger.info(
+                f"Profile '{profile.name}' step {index + 1}/{len(profile.steps)} "
+                f"{step.dll} into PID {tracked.pid}: "
+                f"{'ok' if result.success else result.error} ({result.duration_ms} ms)"
+            )
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+        if progress_signal is not None:
+            progress_signal.emit(int((index + 1) / len(profile.steps) * 100))
+        if result.success and step.delay_seconds > 0 and index < len(profile.steps) - 1:
+            stop_event.wait(step.delay_seconds)
+    return ProfileResult(
+        tracked.pid,
+        profile.name,
+        results,
+        round((time.perf_counter() - start) * 1000, 1),
+    )
+
+
+class ProcessExitWatcher(threading.Thread):
+    """
+    Blocks on the exit of a tracked process in a daemon thread and calls
+    on_exit(tracked) as soon as it is gone. The callback runs in this thread.
+    """
+
+    WAIT_SLICE_SECONDS = 1.0
+
+    def __init__(
+        self, tracked: TrackedProcess, on_exit: Callable[[TrackedProcess], None]
+    ):
+        super().__init__(name=f"exit-watcher-{tracked.pid}", daemon=True)
+        self.tracked = tracked
+        self.on_exit = on_exit
+        self._stop_event = threading.Event()
+
+    def stop(self):
+        """Stops watching without calling on_exit."""
+        self._stop_event.set()
+
+    def run(self):
+        try:
+            process = psutil.Process(self.tracked.pid)
+            if process.create_time() != self.tracked.create_time:
+                raise psutil.NoSuchProcess(self.tracked.pid)
+            # wait() returns as soon as the process exits; the slices only
+            # bound how long stop() takes to be noticed.
+            while not self._stop_event.is_set():
+                try:
+                    process.wait(timeout=self.WAIT_SLICE_SECONDS)
+                    break
+                except psutil.TimeoutExpired:
+                    continue
+        except psutil.AccessDenied:
+            # Not allowed to wait on it, so poll its liveness instead.
+            while not self._stop_event.is_set() and self.tracked.is_alive():
+                self._stop_event.wait(self.WAIT_SLICE_SECONDS)
+        except psutil.Error:
+            pass
+
+        if not self._stop_event.is_set():
+            logger.info(f"Process {self.tracked.pid} exited.")
+            self.on_exit(self.tracked)
+
+
+READINESS_CONFIG_KEY = "readiness"
+
+
+def _module_name(path: str) -> str:
+    return path.replace("\\", "/").rsplit("/", 1)[-1].lower()
+
+
+def _has_visible_window(pid: int) -> bool:
+    """Windows: True if the process owns a visible top-level window."""
+    import ctypes
+    from ctypes import wintypes
+
+    user32 = ctypes.windll.user32
+    found = False
+
+    @ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+    def check_window(hwnd, _):
+        nonlocal found
+        owner_pid = wintypes.DWORD()
+        user32.GetWindowThreadProcessId(hwnd, ctypes.byref(owner_pid))
+        if owner_pid.value == pid and user32.IsWindowVisible(hwnd):
+            found = True
+            return False
+        return True
+
+    user32.EnumWindows(check_window, 0)
+    return found
+
+
+# Returns whether a PID has a main window; None where that cannot be checked.
+DEFAULT_WINDOW_PROBE: Optional[Callable[[int], bool]] = (
+    _has_visible_window if sys.platform == "win32" else None
+)
+
+
+@dataclasses.dataclass
+class ReadinessThresholds:
+    """
+    What ReadinessDetector waits for. Each field can be overridden under
+    "readiness" in config.json, e.g. {"readiness": {"cpu_percent": 80}}.
+    """
+
+    # Every entry must be loaded; "a.dll|b.dll" accepts either one.
+    required_modules: Tuple[str, ...] = ("dxgi.dll", "d3d11.dll|d3d12.dll")
+    require_window: bool = True
+    # CPU (percent of one core) and disk I/O must stay below these limits,
+    # on average over the whole window and in the latest sample.
+    settle_window_seconds: float = 5.0
+    cpu_percent: float = 100.0
+    io_bytes_per_second: float = 4.0 * 1024 * 1024
+    min_age_seconds: float = 10.0
+
+    @classmethod
+    def from_config(cls) -> "ReadinessThresholds":
+        thresholds = cls()
+        overrides = config_manager.get_config(READINESS_CONFIG_KEY, default={})
+        if not isinstance(overrides, dict):
+            return thresholds
+        for field in dataclasses.fields(cls):
+            if field.name not in overrides:
+                continue
+            value = overrides[field.name]
+            try:
+                if field.name == "required_modules":
+                    if isinstance(value, str):
+                        raise TypeError("expected a list")
+                    value = tuple(str(module).lower() for module in value)
+                elif isinstance(getattr(thresholds, field.name), bool):
+                    # bool("false") is True, so only JSON booleans are accepted.
+                    if not isinstance(value, bool):
+                        raise TypeError("expected true or false")
+                else:
+                    value = type(getattr(thresholds, field.name))(value)
+            except (TypeError, ValueError):
+                logger.warning(
+                    f"Ignoring invalid readiness setting {field.name}={value!r}"
+                )
+                continue
+            setattr(thresholds, field.name, value)
+        return thresholds
+
+
+@dataclasses.dataclass
+class ReadinessStatus:
+    ready: bool
+    age_seconds: float
+    missing_modules: List[str]
+    # None if the platform cannot tell.
+    has_window: Optional[bool]
+    # None until a full settle window has been sampled.
+    cpu_percent: Optional[float]
+    io_bytes_per_second: Optional[float]
+
+    def describe(self) -> str:
+        parts = [f"age {self.age_seconds:.1f} s"]
+        if self.missing_modules:
+            parts.append(f"waiting for {', '.join(self.missing_modules)}")
+        if self.has_window is not None:
+            parts.append("window" if self.has_window else "no window")
+        if self.cpu_percent is None:
+            parts.append("sampling activity")
+        else:
+            parts.append(f"cpu {self.cpu_percent:.0f}%")
+        if self.io_bytes_per_second is not None:
+            parts.append(f"io {self.io_bytes_per_second / 1024:.0f} KiB/s")
+        return ", ".join(parts)
+
+
+class ReadinessDetector:
+    """
+    Decides when a freshly started game is far enough along to inject into,
+    using cheap signals sampled by poll(): its loaded modules (memory_maps),
+    a visible top-level window, and CPU/disk activity settling over a
+    sliding window. Signals the platform or our rights cannot provide are skipped.
+    """
+
+    POLL_INTERVAL_SECONDS = 0.5
+
+    def __init__(
+        self,
+        tracked: TrackedProcess,
+        thresholds: Optional[ReadinessThresholds] = None,
+        window_probe: Optional[Callable[[int], bool]] = DEFAULT_WINDOW_PROBE,
+    ):
+        """:raises psutil.NoSuchProcess: If the process is already gone."""
+        self.tracked = tracked
+        self.thresholds = thresholds or ReadinessThresholds.from_config()
+        self.window_probe = window_probe if self.thresholds.require_window else None
+        self._process = psutil.Process(tracked.pid)
+        self._missing_modules = [
+            module.lower() for module in self.thresholds.required_modules
+        ]
+        self._has_window = False
+        self._io_available = True
+        # (monotonic time, cpu seconds, io bytes or None)
+        self._samples: Deque[Tuple[float, float, Optional[int]]] = collections.deque()
+
+    def _update_modules(self):
+        if not self._missing_modules:
+            return
+        try:
+            maps = self._process.memory_maps(grouped=True)
+        except psutil.AccessDenied:
+            logger.warning("Cannot read the game's modules; skipping that check.")
+            self._missing_modules = []
+            return
+        loaded = {_module_name(m.path) for m in maps if m.path}
+        self._missing_modules = [
+            entry
+            for entry in self._missing_modules
+            if loaded.isdisjoint(entry.split("|"))
+        ]
+
+    def _sample_activity(self, now: float):
+        with self._process.oneshot():
+            cpu_times = self._process.cpu_times()
+            io_bytes = None
+            if self._io_available:
+                try:
+                    counters = self._process.io_counters()
+                    io_bytes = counters.read_bytes + counters.write_bytes
+                except (psutil.AccessDenied, AttributeError, NotImplementedError):
+                    self._io_available = False
+        self._samples.append((now, cpu_times.user + cpu_times.system, io_bytes))
+        # Keep one sample from before the window so the rates cover all of it.
+        window_start = now - self.thresholds.settle_window_seconds
+        while len(self._samples) > 2 and self._samples[1][0] <= window_start:
+            self._samples.popleft()
+
+    @staticmethod
+    def _rates(first, last) -> Tuple[float, Optional[float]]:
+        elapsed = max(last[0] - first[0], 1e-6)
+        cpu_percent = (last[1] - first[1]) / elapsed * 100
+        io_rate = None
+        if first[2] is not None and last[2] is not None:
+            io_rate = (last[2] - first[2]) / elapsed
+        return cpu_percent, io_rate
+
+    def _is_settled(self) -> Tuple[bool, Optional[float], Optional[float]]:
+        """:return: (settled, average cpu percent, average io rate) over the window."""
+        first, last = self._samples[0], self._samples[-1]
+        if last[0] - first[0] < self.thresholds.settle_window_seconds:
+            return False, None, None
+        settled = True
+        cpu_percent, io_rate = self._rates(first, last)
+        for cpu, io in (
+            (cpu_percent, io_rate),
+            self._rates(self._samples[-2], last),
+        ):
+            if cpu > self.thresholds.cpu_percent:
+                settled = False
+            if io is not None and io > self.thresholds.io_bytes_per_second:
+                settled = False
+        return settled, cpu_percent, io_rate
+
+    def poll(self) -> ReadinessStatus:
+        """
+        Takes one sample and evaluates all signals.
+        :raises psutil.NoSuchProcess: If the game exited.
+        """
+        if not self.tracked.is_alive():
+            raise psutil.NoSuchProcess(self.tracked.pid)
+        self._update_modules()
+        if self.window_probe is not None and not self._has_window:
+            self._has_window = bool(self.window_probe(self.tracked.pid))
+        self._sample_activity(time.monotonic())
+        settled, cpu_percent, io_rate = self._is_settled()
+
+        age = time.time() - self.tracked.create_time
+        has_window = self._has_window if self.window_probe is not None else None
+        ready = (
+            settled
+            and age >= self.thresholds.min_age_seconds
+            and not self._missing_modules
+            and has_window is not False
+        )
+        return ReadinessStatus(
+            ready=ready,
+            age_seconds=age,
+            missing_modules=list(self._missing_modules),
+            has_window=has_window,
+            cpu_percent=cpu_percent,
+            io_bytes_per_second=io_rate,
+        )
+
+    def wait_until_ready(
+        self,
+        timeout: Optional[float] = None,
+        stop_event: Optional[threading.Event] = None,
+        on_status: Optional[Callable[[ReadinessStatus], None]] = None,
+    ) -> Optional[ReadinessStatus]:
+        """
+        Polls until the game is ready, the timeout passes or stop_event is set.
+        :return: The last status (check .ready), or None if stopped.
+        :raises psutil.NoSuchProcess: If the game exited.
+        """
+        stop_event = stop_event or threading.Event()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not stop_event.is_set():
+            status = self.poll()
+            if on_status is not None:
+                on_status(status)
+            if status.ready:
+                logger.info(
+                    f"Game process {self.tracked.pid} is ready ({status.describe()})."
+                )
+                return status
+            if deadline is not None and time.monotonic() >= deadline:
+                logger.warning(
+                    f"Game process {self.tracked.pid} not ready after {timeout} s "
+                    f"({status.describe()})."
+                )
+                return status
+            stop_event.wait(self.POLL_INTERVAL_SECONDS)
+        return None
+
+
+class ProcessWatcher(abc.ABC):
+    """
+    Reports game process starts to on_started(tracked) from a background thread.
+    Subclasses provide the event source; start() raises if it is unavailable.
+    """
+
+    name = "base"
+    # False for backends that scan the process table on a timer.
+    event_driven = True
+    START_TIMEOUT_SECONDS = 5.0
+
+    def __init__(self, on_started: Callable[[TrackedProcess], None]):
+        self.on_started = on_started
+        self._stop_event = threading.Event()
+        self._ready = threading.Event()
+        self._start_error: Optional[BaseException] = None
+        self._reported: Set[TrackedProcess] = set()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def is_supported(cls) -> bool:
+        return True
+
+    @abc.abstractmethod
+    def _open(self):
+        """Sets up the event source. Runs in the watcher thread."""
+
+    @abc.abstractmethod
+    def _listen(self):
+        """Delivers events until the stop event is set. Runs in the watcher thread."""
+
+    def _close(self):
+        """Releases the event source. Runs in the watcher thread."""
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._run, name=f"process-watcher-{self.name}", daemon=True
+        )
+        self._thread.start()
+        if not self._ready.wait(self.START_TIMEOUT_SECONDS):
+            self.stop()
+            raise TimeoutError(f"{self.name} watcher did not start in time.")
+        if self._start_error is not None:
+            raise self._start_error
+
+    def stop(self):
+        self._stop_event.set()
+
+    def _run(self):
+        try:
+            self._open()
+        except BaseException as e:
+            self._start_error = e
+            self._ready.set()
+            return
+        self._ready.set()
+        try:
+            # Subscribed first, so a game started right now is not missed.
+            pid = IncrementalProcessScanner().scan()
+            if pid is not None:
+                self._check_pid(pid)
+            self._listen()
+        except Exception as e:
+            logger.exception(f"The {self.name} process watcher failed: {e}")
+        finally:
+            self._close()
+
+    def _check_pid(self, pid: int):
+        """Reports the process if it is the game and was not reported before."""
+        try:
+            process = psutil.Process(pid)
+            tracked = TrackedProcess(pid, process.create_time())
+            if tracked in self._reported:
+                return
+            try:
+                name = process.name()
+            except psutil.AccessDenied:
+                name = None
+            match = _match_process(process, name)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return
+        if match:
+            logger.info(f"{self.name} watcher: game started ({match}, PID {pid}).")
+            self._reported = {t for t in self._reported if t.is_alive()}
+            self._reported.add(tracked)
+            self.on_started(tracked)
+
+
+class NetlinkProcessWatcher(ProcessWatcher):
+    """
+    Linux: subscribes to exec/comm events of the kernel proc connector.
+    Needs CAP_NET_ADMIN, which is why it is usually only available as root.
+    """
+
+    name = "netlink"
+
+    NETLINK_CONNECTOR = 11
+    CN_IDX_PROC = 1
+    CN_VAL_PROC = 1
+    PROC_CN_MCAST_LISTEN = 1
+    NLMSG_DONE = 3
+    PROC_EVENT_EXEC = 0x00000002
+    PROC_EVENT_COMM = 0x00000200
+
+    _NLMSGHDR = struct.Struct("=IHHII")
+    _CN_MSG = struct.Struct("=IIIIHH")
+    _PROC_EVENT = struct.Struct("=IIQ")
+    _PID_TGID = struct.Struct("=ii")
+
+    def __init__(self, on_started: Callable[[TrackedProcess], None]):
+        super().__init__(on_started)
+        self._sock: Optional[socket.socket] = None
+
+    @classmethod
+    def is_supported(cls) -> bool:
+        return sys.platform.startswith("linux") and hasattr(socket, "AF_NETLINK")
+
+    def _open(self):
+        sock = socket.socket(
+            socket.AF_NETLINK,  # type: ignore[attr-defined]
+            socket.SOCK_DGRAM,
+            self.NETLINK_CONNECTOR,
+        )
+        try:
+            sock.bind((0, self.CN_IDX_PROC))
+            op = struct.pack("=I", self.PROC_CN_MCAST_LISTEN)
+            cn_msg = self._CN_MSG.pack(
+                self.CN_IDX_PROC, self.CN_VAL_PROC, 0, 0, len(op), 0
+            )
+            header = self._NLMSGHDR.pack(
+                self._NLMSGHDR.size + len(cn_msg) + len(op),
+                self.NLMSG_DONE,
+                0,
+                0,
+                sock.getsockname()[0],
+            )
+            sock.sendto(header + cn_msg + op, (0, 0))
+            sock.settimeout(0.5)
+        except OSError:
+            sock.close()
+            raise
+        self._sock = sock
+
+    def _close(self):
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def _listen(self):
+        assert self._sock is not None
+        while not self._stop_event.is_set():
+            try:
+                data = self._sock.recv(65536)
+            except socket.timeout:
+                continue
+            except OSError as e:
+                # ENOBUFS: events were dropped. Keep listening.
+                logger.warning(f"Netlink receive failed: {e}")
+                continue
+            for pid in self._parse(data):
+                self._check_pid(pid)
+
+    def _parse(self, data: bytes) -> List[int]:
+        """Returns the PIDs of exec/comm events of main threads in a datagram."""
+        pids = []
+        offset = 0
+        while offset + self._NLMSGHDR.size <= len(data):
+            length = self._NLMSGHDR.unpack_from(data, offset)[0]
+            if length < self._NLMSGHDR.size:
+                break
+            event_at = offset + self._NLMSGHDR.size + self._CN_MSG.size
+            if event_at + self._PROC_EVENT.size + self._PID_TGID.size <= len(data):
+                what = self._PROC_EVENT.unpack_from(data, event_at)[0]
+                if what in (self.PROC_EVENT_EXEC, self.PROC_EVENT_COMM):
+                    pid, tgid = self._PID_TGID.unpack_from(
+                        data, event_at + self._PROC_EVENT.size
+                    )
+                    if pid == tgid:
+                        pids.append(tgid)
+            offset += (length + 3) & ~3
+        return pids
+
+
+class WmiProcessWatcher(ProcessWatcher):
+    """
+    Windows: WMI process-start events. Win32_ProcessStartTrace is pushed by the
+    kernel but needs admin rights; otherwise WMI polls Win32_Process once per second.
+    """
+
+    name = "wmi"
+
+    WBEM_E_TIMED_OUT = -2147209215  # 0x80043001
+    NEXT_EVENT_TIMEOUT_MS = 500
+
+    def __init__(self, on_started: Callable[[TrackedProcess], None]):
+        super().__init__(on_started)
+        self._events = None
+        self._pid_property = "ProcessID"
+
+    @classmethod
+    def is_supported(cls) -> bool:
+        if sys.platform != "win32":
+            return False
+        try:
+            import pythoncom  # noqa: F401
+            import win32com.client  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def _open(self):
+        import pythoncom
+        import pywintypes
+        import win32com.client
+
+        pythoncom.CoInitialize()
+        service = win32com.client.GetObject("winmgmts:\\\\.\\root\\cimv2")
+        executables = get_target_matcher().executables
+        trace_filter = " OR ".join(f"ProcessName = '{name}'" for name in executables)
+        try:
+            self._events = service.ExecNotificationQuery(
+                f"SELECT ProcessID FROM Win32_ProcessStartTrace WHERE {trace_filter}"
+            )
+        except pywintypes.com_error:
+            instance_filter = " OR ".join(
+                f"TargetInstance.Name = '{name}'" for name in executables
+            )
+            self._events = service.ExecNotificationQuery(
+                "SELECT * FROM __InstanceCreationEvent WITHIN 1 "
+                f"WHERE TargetInstance ISA 'Win32_Process' AND ({instance_filter})"
+            )
+            self._pid_property = "TargetInstance.ProcessId"
+            logger.info("No access to process start traces. Using WMI polling.")
+
+    def _close(self):
+        import pythoncom
+
+        self._events = None
+        pythoncom.CoUninitialize()
+
+    def _listen(self):
+        import pywintypes
+
+        assert self._events is not None
+        while not self._stop_event.is_set():
+            try:
+                event = self._events.NextEvent(self.NEXT_EVENT_TIMEOUT_MS)
+            except pywintypes.com_error as e:
+                if e.excepinfo and e.excepinfo[5] == self.WBEM_E_TIMED_OUT:
+                    continue
+                raise
+            value = event
+            for part in self._pid_property.split("."):
+                value = getattr(value, part)
+            self._check_pid(int(value))
+
+
+class PollingProcessWatcher(ProcessWatcher):
+    """Fallback: runs the incremental scanner on a fixed interval."""
+
+    name = "polling"
+    event_driven = False
+
+    def __init__(
+        self, on_started: Callable[[TrackedProcess], None], interval: float = 3.0
+    ):
+        super().__init__(on_started)
+        self.interval = interval
+        self._scanner = IncrementalProcessScanner()
+
+    def _open(self):
+        pass
+
+    def _listen(self):
+        while not self._stop_event.wait(self.interval):
+            pid = self._scanner.scan()
+            if pid is not None:
+                self._check_pid(pid)
+
+
+WATCHER_BACKENDS: List[Type[ProcessWatcher]] = [
+    NetlinkProcessWatcher,
+    WmiProcessWatcher,
+    PollingProcessWatcher,
+]
+
+
+def create_process_watcher(
+    on_started: Callable[[TrackedProcess], None], allow_polling: bool = True
+) -> Optional[ProcessWatcher]:
+    """
+    Starts the first backend that works on this system.
+    :param allow_polling: If False, only event-driven backends are tried.
+    :return: The running watcher, or None if no backend could be started.
+    """
+    for backend in WATCHER_BACKENDS:
+        if not allow_polling and not backend.event_driven:
+            continue
+        if not backend.is_supported():
+            continue
+        watcher = backend(on_started)
+        try:
+            watcher.start()
+        except Exception as e:
+            logger.info(f"Process watcher '{backend.name}' is unavailable: {e}")
+            continue
+        logger.info(f"Using the '{backend.name}' process watcher.")
+        return watcher
+    return None
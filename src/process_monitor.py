@@ -0,0 +1,275 @@
+# process_monitor.py - Long-lived game process monitor with an adaptive polling cadence.
+import logging
+import time
+from typing import Callable, List, Optional
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+import process_manager
+
+logger = logging.getLogger(__name__)
+
+
+class ProcessMonitor(QObject):
+    """
+    Tracks the game process for the whole lifetime of the app and publishes
+    changes as signals. Starts come from the event-driven process watcher when
+    available and exits from the exit watcher; the timer polls fast while a
+    launch is pending and backs off once nothing has changed for a while.
+    The tracked process doubles as a snapshot of whether the game is running,
+    so the GUI never has to scan on its own thread.
+    """
+
+    game_started = Signal(int)
+    game_exited = Signal(int)
+
+    # Watcher callbacks arrive on background threads; these hop to the GUI thread.
+    _watcher_started = Signal(int)
+    _watcher_exited = Signal(int)
+
+    LAUNCHING_INTERVAL_MS = 250
+    ACTIVE_INTERVAL_MS = 3000
+    SETTLED_INTERVAL_MS = 15000
+    # With an event-driven watcher, polling only catches missed events.
+    SAFETY_NET_INTERVAL_MS = 30000
+    LAUNCH_WINDOW_SECONDS = 120
+    SETTLE_SECONDS = 60
+    # Without an event-driven watcher, an older "not running" answer gets rescanned.
+    SNAPSHOT_MAX_AGE_SECONDS = 5
+
+    def __init__(self, worker_manager, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.worker_manager = worker_manager
+        self.tracked_process: Optional[process_manager.TrackedProcess] = None
+        self._exit_watcher: Optional[process_manager.ProcessExitWatcher] = None
+        self._launching_until = 0.0
+        self._launch_tracker: Optional[process_manager.LaunchTracker] = None
+        self._last_change = time.monotonic()
+        self._scan_running = False
+        self._snapshot_at: Optional[float] = None
+        self._refresh_callbacks: List[Callable[[Optional[int]], None]] = []
+        self._shut_down = False
+
+        self._watcher_started.connect(self._on_process_found)
+        self._watcher_exited.connect(self._on_process_exited)
+        # Starting a backend can block for seconds (WMI/COM setup, netlink
+        # subscribe), so it happens on a worker; polling covers the meantime.
+        self.process_watcher: Optional[process_manager.ProcessWatcher] = None
+        self.worker_manager.run_task(
+            target=self._create_process_watcher,
+            on_finished=self._on_process_watcher_ready,
+            on_error=lambda e: logger.warning(f"Process watcher failed: {e}"),
+            dedicated=True,
+        )
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._poll)
+        self.timer.start(0)
+
+    @property
+    def current_pid(self) -> Optional[int]:
+        return self.tracked_process.pid if self.tracked_process else None
+
+    def snapshot_age(self) -> Optional[float]:
+        """Seconds since the snapshot was last confirmed, or None before the first scan."""
+        if self._snapshot_at is None:
+            return None
+        return time.monotonic() - self._snapshot_at
+
+    def is_snapshot_fresh(self) -> bool:
+        """True if current_pid can be trusted without scanning."""
+        age = self.snapshot_age()
+        if age is None:
+            return False
+        if self.tracked_process is not None or self.process_watcher is not None:
+            # The exit watcher and the process watcher report changes as they happen.
+            return True
+        return age <= self.SNAPSHOT_MAX_AGE_SECONDS
+
+    def refresh(self, on_done: Callable[[Optional[int]], None]):
+        """
+        Calls on_done(current_pid) on the GUI thread: right away if the snapshot
+        is fresh, otherwise after a background scan (joining one in progress).
+        """
+        if self.is_snapshot_fresh():
+            on_done(self.current_pid)
+            return
+        self._refresh_callbacks.append(on_done)
+        if not self._scan_running:
+            self._start_scan()
+
+    def is_launching(self) -> bool:
+        return self.tracked_process is None and time.monotonic() < self._launching_until
+
+    def current_interval_ms(self) -> int:
+        now = time.monotonic()
+        if self.is_launching():
+            return self.LAUNCHING_INTERVAL_MS
+        if self.process_watcher is not None:
+            return self.SAFETY_NET_INTERVAL_MS
+        if now - self._last_change >= self.SETTLE_SECONDS:
+            return self.SETTLED_INTERVAL_MS
+        return self.ACTIVE_INTERVAL_MS
+
+    def set_launching(self, launching: bool = True, launcher: Optional[str] = None):
+        """
+        Polls fast until the game shows up (or the launch window ends).
+        :param launcher: If given, detection is narrowed to processes started
+            from YMU or that launcher until LaunchTracker falls back.
+        """
+        self._launching_until = (
+            time.monotonic() + self.LAUNCH_WINDOW_SECONDS if launching else 0.0
+        )
+        self._launch_tracker = None
+        if launching and launcher:
+            # Queued on the shared worker thread, so the tracker takes its
+            # snapshot before a launch task queued right after this call runs.
+            self.worker_manager.run_task(
+                process_manager.LaunchTracker.for_launcher,
+                launcher,
+                on_finished=self._on_launch_tracker_ready,
+                on_error=lambda e: logger.warning(f"Launch tracking failed: {e}"),
+            )
+        self._reschedule()
+
+    def track(self, pid: int):
+        """Starts tracking a PID found elsewhere (e.g. by the update pipeline)."""
+        self._on_process_found(pid)
+
+    def shutdown(self):
+        """Stops polling and all background watchers."""
+        self._shut_down = True
+        self.timer.stop()
+        if self.process_watcher is not None:
+            self.process_watcher.stop()
+        if self._exit_watcher is not None:
+            self._exit_watcher.stop()
+            self._exit_watcher = None
+
+    def _create_process_watcher(
+        self, progress_signal=None
+    ) -> Optional[process_manager.ProcessWatcher]:
+        watcher = process_manager.create_process_watcher(
+            on_started=self._on_watcher_started, allow_polling=False
+        )
+        if watcher is not None and self._shut_down:
+            # The app closed while the backend was starting.
+            watcher.stop()
+            return None
+        return watcher
+
+    def _on_process_watcher_ready(
+        self, watcher: Optional[process_manager.ProcessWatcher]
+    ):
+        if watcher is None:
+            return
+        if self._shut_down:
+            watcher.stop()
+            return
+        self.process_watcher = watcher
+        # A game that started before the subscription took effect has no event.
+        if self.tracked_process is None and not self._scan_running:
+            self._start_scan()
+        else:
+            self._reschedule()
+
+    def _reschedule(self):
+        self.timer.start(self.current_interval_ms())
+
+    def _on_launch_tracker_ready(self, tracker: process_manager.LaunchTracker):
+        if self.is_launching():
+            self._launch_tracker = tracker
+
+    def _active_launch_tracker(self) -> Optional[process_manager.LaunchTracker]:
+        tracker = self._launch_tracker
+        if tracker is None or not self.is_launching() or tracker.fell_back:
+            return None
+        return tracker
+
+    def _poll(self):
+        if self.tracked_process is not None:
+            if not self.tracked_process.is_alive():
+                self._on_process_exited(self.tracked_process.pid)
+            self._reschedule()
+            return
+        if self._scan_running:
+            self._reschedule()
+            return
+        self._start_scan()
+
+    def _start_scan(self):
+        self._scan_running = True
+        tracker = self._active_launch_tracker()
+        self.worker_manager.run_task(
+            target=tracker.scan if tracker else process_manager.scan_for_gta_pid,
+            on_finished=self._on_scan_finished,
+            on_error=self._on_scan_error,
+        )
+
+    def _on_scan_finished(self, pid: Optional[int]):
+        self._scan_running = False
+        self._snapshot_at = time.monotonic()
+        if pid is not None:
+            self._on_process_found(pid)
+        self._reschedule()
+        self._run_refresh_callbacks()
+
+    def _on_scan_error(self, error: Exception):
+        self._scan_running = False
+        logger.error(f"Process scan failed: {error}")
+        self._reschedule()
+        self._run_refresh_callbacks()
+
+    def _run_refresh_callbacks(self):
+        callbacks, self._refresh_callbacks = self._refresh_callbacks, []
+        for callback in callbacks:
+            try:
+                callback(self.current_pid)
+            except Exception:
+                logger.exception("Process snapshot callback failed.")
+
+    def _on_watcher_started(self, tracked: process_manager.TrackedProcess):
+        """
+        Runs on the watcher thread: the ancestry check reads the process table,
+        so it happens here before the start is handed to the GUI thread.
+        """
+        tracker = self._active_launch_tracker()
+        if tracker is not None and not tracker.is_descendant(tracked.pid):
+            logger.info(
+                f"Ignoring game process {tracked.pid}: not started by this launch."
+            )
+            return
+        self._watcher_started.emit(tracked.pid)
+
+    def _on_process_found(self, pid: int):
+        if self.tracked_process is not None and self.tracked_process.pid == pid:
+            return
+        tracked = process_manager.TrackedProcess.from_pid(pid)
+        if tracked is None:
+            return
+        if self._exit_watcher is not None:
+            self._exit_watcher.stop()
+        self.tracked_process = tracked
+        self._exit_watcher = process_manager.ProcessExitWatcher(
+            tracked, on_exit=lambda t: self._watcher_exited.emit(t.pid)
+        )
+        self._exit_watcher.start()
+        self._launching_until = 0.0
+        self._launch_tracker = None
+        self._last_change = self._snapshot_at = time.monotonic()
+        logger.info(f"Game process {pid} is running.")
+        self.game_started.emit(pid)
+        self._reschedule()
+
+    def _on_process_exited(self, pid: int):
+        if self.tracked_process is None or self.tracked_process.pid != pid:
+            return
+        if self._exit_watcher is not None:
+            self._exit_watcher.stop()
+            self._exit_watcher = None
+        self.tracked_process = None
+        self._last_change = self._snapshot_at = time.monotonic()
+        logger.info(f"Game process {pid} exited.")
+        self.game_exited.emit(pid)
+        self._reschedule()
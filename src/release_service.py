@@ -8,6 +8,8 @@ import os
 import logging
 import re
 from typing import Optional, Callable
+import network_monitor
+import peer_service
 from paths import YMU_DLL_DIR, USER_AGENT
 
 
@@ -58,14 +60,27 @@ class GitHubAPIProvider(ReleaseProvider):
             "Accept": "application/vnd.github.v3+json",
             "User-Agent": USER_AGENT,
         }
+        # Set both to revalidate a previously fetched release with a conditional request.
+        self.etag: Optional[str] = None
+        self.cached_release: Optional[ReleaseData] = None
 
     def get_latest_release(self) -> Optional[ReleaseData]:
         """
         Fetches the latest release from the GitHub API and parses the data.
+        If an ETag and cached release are set and the release is unchanged,
+        the cached release is returned without downloading the body again.
         """
         try:
-            response = requests.get(self.api_url, headers=self.headers, timeout=10)
+            headers = dict(self.headers)
+            if self.etag and self.cached_release:
+                headers["If-None-Match"] = self.etag
+
+            response = network_monitor.get(self.api_url, headers=headers, timeout=10)
+            if response.status_code == 304 and self.cached_release:
+                logger.info(f"Release info for {self.api_url} is unchanged (304).")
+                return self.cached_release
             response.raise_for_status()
+            self.etag = response.headers.get("ETag")
             data = response.json()
 
             version_tag = data.get("tag_name")
@@ -94,13 +109,14 @@ class GitHubAPIProvider(ReleaseProvider):
                 )
                 return None
 
-            return ReleaseData(
+            self.cached_release = ReleaseData(
                 version_tag=version_tag,
                 download_url=download_url,  # type: ignore
                 checksum=checksum,
                 release_notes=release_notes,
                 asset_name=asset_name,  # type: ignore
             )
+            return self.cached_release
 
         except requests.exceptions.RequestException as e:
             logger.error(f"A network error occurred: {e}")
@@ -133,35 +149,49 @@ def get_local_sha256(dll_path: str) -> str | None:
 def download_and_verify_release(
     release_data: ReleaseData,
     progress_signal: Optional[Callable[[int], None]] = None,
+    destination_dir: str = YMU_DLL_DIR,
     **kwargs,
 ) -> bool:
     """
     Downloads a release file, verifies its integrity, and reports progress.
+    :param destination_dir: Folder the asset is saved to (defaults to the DLL folder).
     """
-    download_path = os.path.join(YMU_DLL_DIR, release_data.asset_name)
+    download_path = os.path.join(destination_dir, release_data.asset_name)
     try:
+        if (
+            release_data.checksum
+            and destination_dir == YMU_DLL_DIR
+            and peer_service.is_enabled()
+        ):
+            if peer_service.fetch_object(
+                release_data.checksum, download_path, progress_signal=progress_signal
+            ):
+                logger.info(f"'{release_data.asset_name}' was provided by a LAN peer.")
+                return True
+            logger.info("No peer could provide the file. Falling back to GitHub.")
+
         headers = {"User-Agent": USER_AGENT}
-        response = requests.get(
-            release_data.download_url, stream=True, timeout=30, headers=headers
-        )
-        response.raise_for_status()
-
-        total_size = int(response.headers.get("content-length", 0))
-        downloaded_size = 0
-
-        os.makedirs(os.path.dirname(download_path), exist_ok=True)
-
-        with open(download_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-                downloaded_size += len(chunk)
-                if total_size > 0 and progress_signal:
-                    percentage = int((downloaded_size / total_size) * 100)
-                    if progress_signal:
-                        if hasattr(progress_signal, "emit"):
-                            progress_signal.emit(percentage)
-                        else:
-                            progress_signal(percentage)
+        with network_monitor.stream(
+            "GET", release_data.download_url, timeout=30, headers=headers
+        ) as response:
+            response.raise_for_status()
+
+            total_size = int(response.headers.get("content-length", 0))
+            downloaded_size = 0
+
+            os.makedirs(os.path.dirname(download_path), exist_ok=True)
+
+            with open(download_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=8192):
+                    f.write(chunk)
+                    downloaded_size += len(chunk)
+                    if total_size > 0 and progress_signal:
+                        percentage = int((downloaded_size / total_size) * 100)
+                        if progress_signal:
+                            if hasattr(progress_signal, "emit"):
+                                progress_signal.emit(percentage)
+                            else:
+                                progress_signal(percentage)
 
         logger.info(f"Download of '{release_data.asset_name}' complete.")
 
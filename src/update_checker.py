@@ -1,8 +1,15 @@
+import dataclasses
 import release_service
+import network_monitor
 import subprocess
 import logging
+import json
+import shutil
 import sys
 import os
+import config_manager
+import manifest_service
+import update_scheduler
 from paths import YMU_APPDATA_DIR, LOCAL_VERSION
 
 logger = logging.getLogger(__name__)
@@ -10,87 +17,222 @@ logger = logging.getLogger(__name__)
 REPO = "NiiV3AU/YMU"
 UPDATER_REPO = "xesdoog/YMU-Updater"
 UPDATER_EXE_PATH = os.path.join(YMU_APPDATA_DIR, "ymu_self_updater.exe")
+UPDATER_CACHE_DIR = os.path.join(YMU_APPDATA_DIR, "updater")
+UPDATER_CACHE_META_PATH = os.path.join(UPDATER_CACHE_DIR, "updater.json")
+STAGING_DIR = os.path.join(YMU_APPDATA_DIR, "staging")
+STAGED_META_PATH = os.path.join(STAGING_DIR, "staged.json")
+BACKGROUND_UPDATE_CONFIG_KEY = "self_update.background"
 
-_update_cache = {}
-CACHE_DURATION_SECONDS = 300
+SCHEDULE_TARGET = "ymu"
 
 # --- STATUS CONSTANTS ---
 STATUS_ERROR = "ERROR"
 STATUS_UPDATE_AVAILABLE = "UPDATE_AVAILABLE"
 STATUS_UP_TO_DATE = "UP_TO_DATE"
 STATUS_AHEAD = "AHEAD"
+STATUS_STAGED = "STAGED"
 
 
-def check_for_updates(*args, **kwargs):
+def _fetch_latest_version() -> str:
+    """Returns the tag of the latest YMU release. Raises if it cannot be fetched."""
+    logger.info("Checking for YMU updates...")
+    provider = manifest_service.github_provider(
+        manifest_service.KEY_YMU, REPO, asset_extension=".exe"
+    )
+    latest_release = provider.get_latest_release()
+    if not latest_release:
+        raise RuntimeError("Could not fetch release info")
+    return latest_release.version_tag
+
+
+def check_for_updates(*args, force: bool = False, **kwargs):
     """
     Returns tuple: (STATUS_CODE, DATA)
     DATA is either the remote version string or the error message/object.
+    The remote version is persisted by update_scheduler, so restarts reuse it
+    until the next scheduled check. Pass force=True for a user-initiated check.
     """
-    import time
     from packaging.version import parse
 
-    current_time = time.time()
-
-    if REPO in _update_cache:
-        cached_data, timestamp = _update_cache[REPO]
-        if (current_time - timestamp) < CACHE_DURATION_SECONDS:
-            return cached_data
-
-    logger.info("Checking for YMU updates...")
     try:
-        provider = release_service.GitHubAPIProvider(
-            repository=REPO, asset_extension=".exe"
+        remote_version, from_cache = update_scheduler.run_check(
+            SCHEDULE_TARGET, _fetch_latest_version, force=force
         )
-        latest_release = provider.get_latest_release()
-
-        if not latest_release:
-            return (STATUS_ERROR, "Could not fetch release info")
-
-        remote_version = latest_release.version_tag
+        if from_cache:
+            network_monitor.record_cache_hit(
+                f"https://api.github.com/repos/{REPO}/releases/latest"
+            )
 
+        # Compared on every call, the running version changes after an update.
         local = parse(LOCAL_VERSION)
         remote = parse(remote_version)
 
-        result = None
         if remote > local:
-            result = (STATUS_UPDATE_AVAILABLE, remote_version)
+            return (STATUS_UPDATE_AVAILABLE, remote_version)
         elif remote == local:
-            result = (STATUS_UP_TO_DATE, remote_version)
+            return (STATUS_UP_TO_DATE, remote_version)
         else:
-            result = (STATUS_AHEAD, remote_version)
-
-        _update_cache[REPO] = (result, current_time)
-        return result
+            return (STATUS_AHEAD, remote_version)
 
+    except update_scheduler.CheckPostponed as e:
+        logger.info(str(e))
+        return (STATUS_ERROR, str(e))
     except Exception as e:
         logger.exception(f"Update check failed: {e}")
         return (STATUS_ERROR, str(e))
 
 
-def download_and_launch_updater(progress_signal=None, *args, **kwargs):
+def channel_target(repository: str) -> str:
+    return f"channel:{repository}"
+
+
+def get_channel_release(
+    repository: str, force: bool = False, *args, **kwargs
+) -> release_service.ReleaseData:
     """
-    Downloads updater, passes sys.executable to it.
+    Returns the latest release of a DLL channel, using the persisted result
+    while it is still scheduled as fresh.
+    :raises RuntimeError: If the release info could not be fetched.
     """
-    logger.info(f"Fetching latest updater from {UPDATER_REPO}")
-    provider = release_service.GitHubAPIProvider(
+    provider = manifest_service.github_provider(repository, repository)
+
+    def fetch():
+        logger.info(f"Fetching fresh release data for {repository}.")
+        release = provider.get_latest_release()
+        if not release:
+            raise RuntimeError("Failed to fetch release data from GitHub.")
+        return release
+
+    release, from_cache = update_scheduler.run_check(
+        channel_target(repository),
+        fetch,
+        encode=dataclasses.asdict,
+        decode=lambda data: release_service.ReleaseData(**data),
+        force=force,
+    )
+    if from_cache:
+        logger.info(f"Using stored release data for {repository}.")
+        network_monitor.record_cache_hit(provider.api_url)
+    return release
+
+
+def _load_updater_cache() -> dict:
+    """Reads the metadata of the cached updater (tag, asset, SHA-256, ETag)."""
+    if not os.path.exists(UPDATER_CACHE_META_PATH):
+        return {}
+    try:
+        with open(UPDATER_CACHE_META_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+            return data if isinstance(data, dict) else {}
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Failed to read updater cache metadata: {e}")
+        return {}
+
+
+def _save_updater_cache(
+    release: release_service.ReleaseData, sha256: str, etag: str | None
+):
+    """Stores the metadata of a freshly downloaded updater."""
+    meta = {
+        "tag": release.version_tag,
+        "asset_name": release.asset_name,
+        "download_url": release.download_url,
+        "sha256": sha256,
+        "etag": etag,
+    }
+    try:
+        os.makedirs(UPDATER_CACHE_DIR, exist_ok=True)
+        with open(UPDATER_CACHE_META_PATH, "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=4)
+    except OSError as e:
+        logger.warning(f"Failed to write updater cache metadata: {e}")
+
+
+def _get_valid_cached_updater(meta: dict, tag: str | None = None) -> str | None:
+    """
+    Returns the path of the cached updater if it exists, belongs to the given
+    release tag (if any) and still matches its recorded SHA-256.
+    """
+    asset_name = meta.get("asset_name")
+    if not asset_name or not meta.get("sha256"):
+        return None
+    if tag is not None and meta.get("tag") != tag:
+        return None
+    cached_path = os.path.join(UPDATER_CACHE_DIR, asset_name)
+    local_checksum = release_service.get_local_sha256(cached_path)
+    if local_checksum and local_checksum.lower() == meta["sha256"].lower():
+        return cached_path
+    return None
+
+
+def _get_updater(progress_signal=None) -> tuple[str | None, str]:
+    """
+    Returns (path, message). Revalidates the cached updater with a conditional
+    request and only downloads it again if the release or the file changed.
+    """
+    meta = _load_updater_cache()
+    github = release_service.GitHubAPIProvider(
         repository=UPDATER_REPO, asset_extension=".exe"
     )
+    if meta.get("etag") and meta.get("download_url"):
+        github.etag = meta["etag"]
+        github.cached_release = release_service.ReleaseData(
+            version_tag=meta["tag"],
+            download_url=meta["download_url"],
+            asset_name=meta["asset_name"],
+            checksum=meta.get("sha256"),
+        )
+
+    provider = manifest_service.ManifestReleaseProvider(
+        manifest_service.KEY_UPDATER, fallback=github
+    )
+    logger.info(f"Fetching latest updater from {UPDATER_REPO}")
     latest_release = provider.get_latest_release()
 
     if not latest_release:
-        return (False, "Could not find the latest updater release.")
+        cached_path = _get_valid_cached_updater(meta)
+        if cached_path:
+            logger.warning("Could not reach GitHub. Using the cached updater.")
+            return (cached_path, "Using cached updater")
+        return (None, "Could not find the latest updater release.")
+
+    cached_path = _get_valid_cached_updater(meta, tag=latest_release.version_tag)
+    if cached_path and (
+        not latest_release.checksum
+        or latest_release.checksum.lower() == meta["sha256"].lower()
+    ):
+        logger.info(f"Cached updater {latest_release.version_tag} is up-to-date.")
+        network_monitor.record_cache_hit(latest_release.download_url)
+        return (cached_path, "Using cached updater")
 
     success = release_service.download_and_verify_release(
-        latest_release, progress_signal
+        latest_release, progress_signal, destination_dir=UPDATER_CACHE_DIR
     )
-
     if not success:
-        return (False, "Failed to download the updater executable.")
+        return (None, "Failed to download the updater executable.")
+
+    updater_path = os.path.join(UPDATER_CACHE_DIR, latest_release.asset_name)
+    checksum = release_service.get_local_sha256(updater_path)
+    if not checksum:
+        return (None, "Failed to download the updater executable.")
+    # A GitHub ETag only describes the GitHub response, not a manifest entry.
+    etag = None if provider.from_manifest else github.etag
+    _save_updater_cache(latest_release, checksum, etag)
+    return (updater_path, "Updater downloaded")
+
+
+def download_and_launch_updater(progress_signal=None, *args, **kwargs):
+    """
+    Gets the updater (from cache when unchanged), passes sys.executable to it.
+    """
+    updater_path, message = _get_updater(progress_signal)
+    if not updater_path:
+        return (False, message)
 
     try:
-        logger.info(f"Launching updater: {UPDATER_EXE_PATH}")
+        logger.info(f"Launching updater: {updater_path}")
         current_exe = sys.executable
-        cmd = [UPDATER_EXE_PATH, current_exe]
+        cmd = [updater_path, current_exe]
 
         if sys.platform == "win32":
             subprocess.Popen(
@@ -105,3 +247,157 @@ def download_and_launch_updater(progress_signal=None, *args, **kwargs):
     except (IOError, OSError) as e:
         logger.exception(f"Failed to launch updater: {e}")
         return (False, str(e))
+
+
+def get_app_executable() -> str | None:
+    """
+    Returns the path of the running YMU executable, or None when running
+    from source (nothing to swap in that case).
+    """
+    if "__compiled__" in globals():
+        return os.path.abspath(sys.argv[0])
+    if getattr(sys, "frozen", False):
+        return sys.executable
+    return None
+
+
+def is_background_update_enabled() -> bool:
+    return bool(config_manager.get_config(BACKGROUND_UPDATE_CONFIG_KEY, default=False))
+
+
+def _load_staged_meta() -> dict:
+    if not os.path.exists(STAGED_META_PATH):
+        return {}
+    try:
+        with open(STAGED_META_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+            return data if isinstance(data, dict) else {}
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Failed to read staged update metadata: {e}")
+        return {}
+
+
+def _clear_staging():
+    shutil.rmtree(STAGING_DIR, ignore_errors=True)
+
+
+def get_staged_update() -> dict | None:
+    """
+    Returns the metadata of a staged update if it is newer than the running
+    version and the staged file still matches its SHA-256, otherwise None.
+    """
+    from packaging.version import parse, InvalidVersion
+
+    meta = _load_staged_meta()
+    if not meta.get("version") or not meta.get("asset_name") or not meta.get("sha256"):
+        return None
+    try:
+        if parse(meta["version"]) <= parse(LOCAL_VERSION):
+            return None
+    except InvalidVersion:
+        return None
+
+    staged_path = os.path.join(STAGING_DIR, meta["asset_name"])
+    local_checksum = release_service.get_local_sha256(staged_path)
+    if not local_checksum or local_checksum.lower() != meta["sha256"].lower():
+        logger.warning("Staged update failed verification. Discarding it.")
+        _clear_staging()
+        return None
+    return dict(meta, path=staged_path)
+
+
+def stage_update(*args, **kwargs):
+    """
+    Downloads and verifies the latest YMU build into the staging folder.
+    Returns tuple: (STATUS_CODE, DATA) like check_for_updates, with
+    STATUS_STAGED if a verified build is waiting for the next start.
+    """
+    status, data = check_for_updates()
+    if status != STATUS_UPDATE_AVAILABLE:
+        return (status, data)
+
+    staged = get_staged_update()
+    if staged and staged["version"] == data:
+        logger.info(f"Update {data} is already staged.")
+        return (STATUS_STAGED, data)
+
+    provider = manifest_service.github_provider(
+        manifest_service.KEY_YMU, REPO, asset_extension=".exe"
+    )
+    latest_release = provider.get_latest_release()
+    if not latest_release:
+        return (STATUS_ERROR, "Could not fetch release info")
+    if not latest_release.checksum:
+        # Never swap the executable for an unverified file.
+        return (STATUS_ERROR, "Release has no checksum. Refusing to stage it.")
+
+    _clear_staging()
+    logger.info(f"Staging YMU {latest_release.version_tag} in the background...")
+    if not release_service.download_and_verify_release(
+        latest_release, destination_dir=STAGING_DIR
+    ):
+        _clear_staging()
+        return (STATUS_ERROR, "Failed to download the update.")
+
+    meta = {
+        "version": latest_release.version_tag,
+        "asset_name": latest_release.asset_name,
+        "sha256": latest_release.checksum.lower(),
+    }
+    try:
+        with open(STAGED_META_PATH, "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=4)
+    except OSError as e:
+        _clear_staging()
+        return (STATUS_ERROR, str(e))
+
+    logger.info(
+        f"YMU {latest_release.version_tag} staged. It will be applied on restart."
+    )
+    return (STATUS_STAGED, latest_release.version_tag)
+
+
+def apply_staged_update(target_exe: str) -> bool:
+    """
+    Swaps the running executable for the staged build. The old executable is
+    renamed to '<name>.old' (allowed on Windows while it is running) and is
+    removed on the next start by cleanup_previous_version.
+    :return: True if the new build is now in place and YMU should relaunch.
+    """
+    staged = get_staged_update()
+    if not staged:
+        return False
+
+    backup_path = target_exe + ".old"
+    try:
+        if os.path.exists(backup_path):
+            os.remove(backup_path)
+        os.replace(target_exe, backup_path)
+    except OSError as e:
+        logger.error(f"Could not move the current executable aside: {e}")
+        return False
+
+    try:
+        shutil.move(staged["path"], target_exe)
+    except OSError as e:
+        logger.error(f"Could not install the staged update, rolling back: {e}")
+        try:
+            os.replace(backup_path, target_exe)
+        except OSError:
+            logger.critical(f"Rollback failed. The previous build is at {backup_path}")
+        return False
+
+    _clear_staging()
+    logger.info(f"Applied staged update {staged['version']}.")
+    return True
+
+
+def cleanup_previous_version(target_exe: str):
+    """Removes the executable left behind by the last applied update."""
+    backup_path = target_exe + ".old"
+    if os.path.exists(backup_path):
+        try:
+            os.remove(backup_path)
+            logger.info(f"Removed previous version: {backup_path}")
+        except OSError:
+            pass
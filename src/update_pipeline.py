@@ -0,0 +1,194 @@
+# update_pipeline.py - Chains update check, download, DLL selection, process wait and injection.
+import concurrent.futures
+import dataclasses
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+import manifest_service
+import process_manager
+import release_service
+from paths import YMU_DLL_DIR
+
+logger = logging.getLogger(__name__)
+
+STAGE_CHECK = "check"
+STAGE_DOWNLOAD = "download"
+STAGE_SELECT = "select"
+STAGE_WAIT_PROCESS = "wait_process"
+STAGE_INJECT = "inject"
+
+PROCESS_WAIT_TIMEOUT_SECONDS = 600
+PROCESS_POLL_INTERVAL_SECONDS = 0.5
+
+
+class PipelineError(RuntimeError):
+    """Raised when a pipeline stage fails. Carries the stage and timings so far."""
+
+    def __init__(self, stage: str, message: str, timings: Dict[str, float]):
+        super().__init__(message)
+        self.stage = stage
+        self.timings = timings
+
+
+@dataclasses.dataclass
+class PipelineResult:
+    """Outcome of a successful update-and-inject run."""
+
+    version_tag: str
+    dll_filename: str
+    pid: int
+    downloaded: bool
+    timings: Dict[str, float]
+    total_ms: float
+
+
+class _StageClock:
+    """Thread-safe stopwatch for (possibly overlapping) stages."""
+
+    def __init__(self):
+        self._origin = time.perf_counter()
+        self._starts: Dict[str, float] = {}
+        self.timings: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def start(self, stage: str):
+        with self._lock:
+            self._starts[stage] = time.perf_counter()
+
+    def stop(self, stage: str):
+        with self._lock:
+            started = self._starts.get(stage, self._origin)
+            self.timings[stage] = round((time.perf_counter() - started) * 1000, 2)
+
+    def total_ms(self) -> float:
+        return round((time.perf_counter() - self._origin) * 1000, 2)
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return dict(self.timings)
+
+
+def _wait_for_process(
+    clock: _StageClock,
+    cancel: threading.Event,
+    stop_event: threading.Event,
+    timeout: float,
+    poll_interval: float,
+) -> Optional[int]:
+    """Polls for the game process until found, cancelled, stopped or timed out."""
+    clock.start(STAGE_WAIT_PROCESS)
+    deadline = time.monotonic() + timeout
+    try:
+        while (
+            not cancel.is_set()
+            and not stop_event.is_set()
+            and time.monotonic() < deadline
+        ):
+            pid = process_manager.scan_for_gta_pid()
+            if pid is not None:
+                return pid
+            cancel.wait(poll_interval)
+        return None
+    finally:
+        clock.stop(STAGE_WAIT_PROCESS)
+
+
+def run_update_and_inject(
+    repository: str,
+    dll_name: str,
+    progress_signal: Optional[Callable[[int], None]] = None,
+    process_timeout: float = PROCESS_WAIT_TIMEOUT_SECONDS,
+    poll_interval: float = PROCESS_POLL_INTERVAL_SECONDS,
+    stop_event: Optional[threading.Event] = None,
+    **kwargs,
+) -> PipelineResult:
+    """
+    Runs check -> download/verify -> select -> wait for process -> inject as one job.
+    Process detection starts right away and overlaps with the check and download,
+    so a game that is already running (or starting) costs no extra latency.
+    :param stop_event: Ends the wait for the game process and skips the injection once set.
+    :raises PipelineError: If any stage fails or the run was stopped.
+    :raises PermissionError: If the injection is blocked by missing privileges.
+    """
+    clock = _StageClock()
+    cancel = threading.Event()
+    stop_event = stop_event or threading.Event()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        process_future = executor.submit(
+            _wait_for_process, clock, cancel, stop_event, process_timeout, poll_interval
+        )
+        try:
+            clock.start(STAGE_CHECK)
+            provider = manifest_service.github_provider(repository, repository)
+            release = provider.get_latest_release()
+            clock.stop(STAGE_CHECK)
+            if release is None:
+                raise PipelineError(
+                    STAGE_CHECK, "Could not fetch release info.", clock.snapshot()
+                )
+
+            local_path = os.path.join(YMU_DLL_DIR, dll_name)
+            local_checksum = release_service.get_local_sha256(local_path)
+            downloaded = False
+            clock.start(STAGE_DOWNLOAD)
+            if release.checksum and local_checksum == release.checksum.lower():
+                logger.info(f"{dll_name} is already up-to-date. Skipping download.")
+                dll_filename = dll_name
+            else:
+                if not release_service.download_and_verify_release(
+                    release, progress_signal
+                ):
+                    clock.stop(STAGE_DOWNLOAD)
+                    raise PipelineError(
+                        STAGE_DOWNLOAD,
+                        "Download or verification failed.",
+                        clock.snapshot(),
+                    )
+                downloaded = True
+                dll_filename = release.asset_name
+            clock.stop(STAGE_DOWNLOAD)
+
+            clock.start(STAGE_SELECT)
+            if not os.path.isfile(os.path.join(YMU_DLL_DIR, dll_filename)):
+                raise PipelineError(
+                    STAGE_SELECT, f"{dll_filename} is missing.", clock.snapshot()
+                )
+            clock.stop(STAGE_SELECT)
+        except BaseException:
+            cancel.set()
+            raise
+
+        pid = process_future.result()
+        if stop_event.is_set():
+            raise PipelineError(STAGE_WAIT_PROCESS, "Stopped.", clock.snapshot())
+        if pid is None:
+            raise PipelineError(
+                STAGE_WAIT_PROCESS,
+                "The game process did not appear in time.",
+                clock.snapshot(),
+            )
+
+    clock.start(STAGE_INJECT)
+    try:
+        success = process_manager.inject_dll(pid, dll_filename)
+    finally:
+        clock.stop(STAGE_INJECT)
+    if not success:
+        raise PipelineError(STAGE_INJECT, "Injection failed.", clock.snapshot())
+
+    result = PipelineResult(
+        version_tag=release.version_tag,
+        dll_filename=dll_filename,
+        pid=pid,
+        downloaded=downloaded,
+        timings=clock.snapshot(),
+        total_ms=clock.total_ms(),
+    )
+    logger.info(
+        f"Update-and-inject finished in {result.total_ms} ms. Stages: {result.timings}"
+    )
+    return result
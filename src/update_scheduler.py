@@ -0,0 +1,181 @@
+# update_scheduler.py - Persists update-check results per target and decides when to check again.
+import json
+import logging
+import os
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import config_manager
+from paths import YMU_APPDATA_DIR
+
+logger = logging.getLogger(__name__)
+
+SCHEDULE_FILE_PATH = os.path.join(YMU_APPDATA_DIR, "update_schedule.json")
+INTERVAL_CONFIG_KEY = "update_schedule.interval_minutes"
+DEFAULT_INTERVAL_MINUTES = 30
+# Even an explicit check reuses a result that is younger than this.
+MIN_CHECK_AGE_SECONDS = 300
+JITTER_FRACTION = 0.1
+BACKOFF_BASE_SECONDS = 60
+BACKOFF_MAX_SECONDS = 6 * 60 * 60
+
+_state_lock = threading.Lock()
+_target_locks: Dict[str, threading.Lock] = {}
+
+
+class CheckPostponed(RuntimeError):
+    """Raised when a target is backing off after failures and has no stored result."""
+
+    def __init__(self, target: str, retry_at: float):
+        retry_in = max(int(retry_at - time.time()), 0)
+        super().__init__(
+            f"Update check for {target} failed recently. Retrying in {retry_in} s."
+        )
+        self.target = target
+        self.retry_at = retry_at
+
+
+def _load_state() -> dict:
+    if not os.path.exists(SCHEDULE_FILE_PATH):
+        return {}
+    try:
+        with open(SCHEDULE_FILE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+            return data if isinstance(data, dict) else {}
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Failed to read update schedule: {e}")
+        return {}
+
+
+def _save_state(state: dict):
+    temp_file = SCHEDULE_FILE_PATH + ".tmp"
+    try:
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=4)
+        os.replace(temp_file, SCHEDULE_FILE_PATH)
+    except OSError as e:
+        logger.warning(f"Failed to write update schedule: {e}")
+
+
+def _update_entry(target: str, **fields):
+    with _state_lock:
+        state = _load_state()
+        entry = state.get(target) if isinstance(state.get(target), dict) else {}
+        entry.update(fields)
+        state[target] = entry
+        _save_state(state)
+
+
+def _get_target_lock(target: str) -> threading.Lock:
+    with _state_lock:
+        return _target_locks.setdefault(target, threading.Lock())
+
+
+def get_entry(target: str) -> dict:
+    """Returns the stored state of a target (last_check, next_check, failures, result...)."""
+    with _state_lock:
+        entry = _load_state().get(target)
+    return entry if isinstance(entry, dict) else {}
+
+
+def get_interval_seconds() -> float:
+    minutes = config_manager.get_config(
+        INTERVAL_CONFIG_KEY, default=DEFAULT_INTERVAL_MINUTES
+    )
+    try:
+        return max(float(minutes), 1.0) * 60
+    except (TypeError, ValueError):
+        return DEFAULT_INTERVAL_MINUTES * 60
+
+
+def _jittered(seconds: float) -> float:
+    return seconds * random.uniform(1 - JITTER_FRACTION, 1 + JITTER_FRACTION)
+
+
+def _next_check(entry: dict, now: float) -> float:
+    """
+    The stored next check time, capped so that a clock that jumped backwards
+    cannot postpone checks indefinitely.
+    """
+    longest_wait = max(get_interval_seconds(), BACKOFF_MAX_SECONDS)
+    longest_wait *= 1 + JITTER_FRACTION
+    return min(float(entry.get("next_check", 0)), now + longest_wait)
+
+
+def is_due(target: str) -> bool:
+    """True if the target has never been checked or its next check time has passed."""
+    now = time.time()
+    return now >= _next_check(get_entry(target), now)
+
+
+def get_due_targets(targets: Iterable[str]) -> List[str]:
+    return [target for target in targets if is_due(target)]
+
+
+def run_check(
+    target: str,
+    check: Callable[[], Any],
+    encode: Optional[Callable[[Any], Any]] = None,
+    decode: Optional[Callable[[Any], Any]] = None,
+    force: bool = False,
+) -> Tuple[Any, bool]:
+    """
+    Runs `check` for a target unless a stored result can be used, and persists the outcome.
+    Only one check per target runs at a time; callers that wait for a running
+    check get its result instead of starting another one.
+    :param encode: Turns the result into something JSON-serializable.
+    :param decode: Turns the stored value back into a result.
+    :param force: Ignore the schedule and any backoff (a result younger than
+        MIN_CHECK_AGE_SECONDS is still reused).
+    :return: (result, from_cache)
+    :raises CheckPostponed: If the target is backing off and has no stored result.
+    :raises Exception: Whatever `check` raised; it counts as a failure.
+    """
+    encode = encode or (lambda value: value)
+    decode = decode or (lambda value: value)
+    requested_at = time.time()
+
+    with _get_target_lock(target):
+        entry = get_entry(target)
+        now = time.time()
+        last_success = float(entry.get("last_success", 0))
+        if "result" in entry:
+            if (
+                last_success >= requested_at
+                or now - last_success < MIN_CHECK_AGE_SECONDS
+                or (not force and now < _next_check(entry, now))
+            ):
+                return decode(entry["result"]), True
+        elif not force and now < _next_check(entry, now):
+            raise CheckPostponed(target, _next_check(entry, now))
+
+        try:
+            result = check()
+        except Exception as e:
+            failures = int(entry.get("failures", 0)) + 1
+            delay = min(BACKOFF_BASE_SECONDS * 2 ** (failures - 1), BACKOFF_MAX_SECONDS)
+            _update_entry(
+                target,
+                last_check=now,
+                next_check=now + _jittered(delay),
+                failures=failures,
+                last_error=str(e),
+            )
+            logger.warning(
+                f"Update check for {target} failed ({failures}x). "
+                f"Backing off for ~{int(delay)} s."
+            )
+            raise
+
+        _update_entry(
+            target,
+            last_check=now,
+            last_success=now,
+            next_check=now + _jittered(get_interval_seconds()),
+            failures=0,
+            last_error=None,
+            result=encode(result),
+        )
+        return result, False
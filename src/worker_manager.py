@@ -1,7 +1,8 @@
 # worker_manager.py - Manages the QThread and executes functions in the background.
 import logging
+import threading
 from PySide6.QtCore import QObject, QThread, Signal, Slot, QMetaObject, Qt
-from typing import Callable, Any, Optional
+from typing import Callable, Any, Dict, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +43,8 @@ class WorkerManager(QObject):
         self._thread = QThread()
         self._thread.start()
         self.active_workers = set()
+        # Dedicated threads and the events that make their jobs return early.
+        self._dedicated_threads: Dict[QThread, Optional[threading.Event]] = {}
         logger.info(
             f"WorkerManager initialized with thread: {self._thread.currentThread()}"
         )
@@ -53,11 +56,28 @@ class WorkerManager(QObject):
         on_finished: Optional[Callable[[Any], None]] = None,
         on_error: Optional[Callable[[Exception], None]] = None,
         on_progress: Optional[Callable[[int], None]] = None,
+        dedicated: bool = False,
+        cancel_event: Optional[threading.Event] = None,
         **kwargs,
     ):
-        """Creates a worker, keeps it alive, and queues its task."""
+        """
+        Creates a worker, keeps it alive, and queues its task.
+        Long-running jobs can pass dedicated=True to get their own thread
+        instead of blocking the shared one.
+        :param cancel_event: Set by cleanup() so a blocking dedicated job can
+            return; the job has to be given the same event to watch.
+        """
         worker = Worker(target, *args, **kwargs)
-        worker.moveToThread(self._thread)
+        if dedicated:
+            thread = QThread()
+            self._dedicated_threads[thread] = cancel_event
+            worker.finished.connect(thread.quit)
+            worker.error.connect(thread.quit)
+            thread.finished.connect(lambda: self._dedicated_threads.pop(thread, None))
+            thread.start()
+            worker.moveToThread(thread)
+        else:
+            worker.moveToThread(self._thread)
 
         self.active_workers.add(worker)
 
@@ -82,7 +102,21 @@ class WorkerManager(QObject):
         self.active_workers.discard(worker)
 
     def cleanup(self):
-        """Stops the managed thread cleanly when the application exits."""
+        """
+        Stops the managed thread cleanly when the application exits.
+        Dedicated jobs are cancelled through their events and waited for, since
+        quit() cannot interrupt a thread that is blocked in Python code.
+        """
+        dedicated = list(self._dedicated_threads.items())
+        for thread, cancel_event in dedicated:
+            if cancel_event is not None:
+                cancel_event.set()
+            thread.quit()
+        for thread, _ in dedicated:
+            if thread.isRunning():
+                logger.info(f"Waiting for dedicated thread {thread} to finish.")
+                thread.wait()
+        self._dedicated_threads.clear()
         if self._thread.isRunning():
             logger.info("--- YMU shut down successfully---")
             self._thread.quit()